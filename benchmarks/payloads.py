@@ -0,0 +1,57 @@
+import random
+from typing import Any, Dict, List
+
+TITLES = [
+    "Python-разработчик",
+    "Senior Java Developer",
+    "Менеджер по продажам",
+    "Аналитик данных",
+    "Бухгалтер",
+    "Официант",
+    "Frontend Developer",
+    "Системный администратор",
+]
+COMPANIES = [f"Компания {number}" for number in range(500)]
+
+
+def generate_items(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Синтетические вакансии в формате списка вакансий API hh.ru"""
+    rng = random.Random(seed)
+    items = []
+    for number in range(count):
+        salary = None
+        if rng.random() < 0.7:
+            salary_from = rng.randrange(30, 400) * 1000
+            salary = {
+                "from": salary_from if rng.random() < 0.9 else None,
+                "to": salary_from + rng.randrange(0, 100) * 1000,
+                "currency": "RUR",
+                "gross": rng.random() < 0.5,
+            }
+        items.append(
+            {
+                "id": str(100000000 + number),
+                "name": f"{rng.choice(TITLES)} #{number}",
+                "employer": {
+                    "id": str(rng.randrange(10**6)),
+                    "name": rng.choice(COMPANIES),
+                },
+                "salary": salary,
+                "alternate_url": f"https://hh.ru/vacancy/{100000000 + number}",
+                "published_at": "2024-05-01T10:00:00+0300",
+                "area": {"id": "1", "name": "Москва"},
+            }
+        )
+    return items
+
+
+def paginate(items: List[Dict[str, Any]], page: int, per_page: int) -> Dict[str, Any]:
+    """Страница выдачи в формате ответа API hh.ru"""
+    pages = (len(items) + per_page - 1) // per_page
+    return {
+        "items": items[page * per_page : (page + 1) * per_page],
+        "found": len(items),
+        "pages": pages,
+        "page": page,
+        "per_page": per_page,
+    }
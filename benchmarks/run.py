@@ -0,0 +1,238 @@
+"""
+Бенчмарки конвейера загрузка -> разбор -> сохранение.
+
+Запуск: python -m benchmarks.run --sizes 1000 10000 100000
+Результаты сохраняются в benchmarks/results/ в JSON; с флагом --baseline
+они сравниваются с предыдущим прогоном
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.payloads import generate_items
+from benchmarks.server import FakeHHServer
+from src.external_api import HHAPI
+from src.vacancies import Vacancy
+from src.vacancy_batch import VacancyBatch
+from src.work_with_files import JSONFileHandler, JSONLinesFileHandler
+
+RESULTS_DIR = Path(__file__).parent / "results"
+# Больше 2000 вакансий по одному запросу API не отдает
+MAX_FETCH_ITEMS = 2000
+
+
+def measure(
+    scenario: str,
+    size: int,
+    func: Callable[[], Any],
+    setup: Optional[Callable[[], None]] = None,
+    repeat: int = 3,
+) -> Dict[str, Any]:
+    """
+    Лучшее время из repeat запусков и пиковая память отдельного запуска
+    под tracemalloc (чтобы трассировка не искажала время)
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timings)
+    return {
+        "scenario": scenario,
+        "size": size,
+        "seconds": seconds,
+        "items_per_second": size / seconds if seconds else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_parse(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    size = len(items)
+    return [
+        measure("parse.cast_to_object", size, lambda: Vacancy.cast_to_object(items)),
+        measure("parse.vacancy_batch", size, lambda: VacancyBatch.from_raw(items)),
+        measure(
+            "parse.cast_to_object_parallel",
+            size,
+            lambda: Vacancy.cast_to_object_parallel(items),
+        ),
+    ]
+
+
+def run_store(items: List[Dict[str, Any]], directory: Path) -> List[Dict[str, Any]]:
+    size = len(items)
+    vacancies = Vacancy.cast_to_object(items)
+    json_path = directory / "bench.json"
+    jsonl_path = directory / "bench.jsonl"
+
+    def reset(path: Path) -> Callable[[], None]:
+        return lambda: path.unlink(missing_ok=True)
+
+    def fill_json() -> None:
+        reset(json_path)()
+        JSONFileHandler(str(json_path)).add_data(vacancies)
+
+    company = vacancies[0].company
+    return [
+        measure(
+            "store.json.add_data",
+            size,
+            lambda: JSONFileHandler(str(json_path)).add_data(vacancies),
+            setup=reset(json_path),
+        ),
+        measure(
+            "store.json.delete_data",
+            size,
+            lambda: JSONFileHandler(str(json_path)).delete_data({"company": company}),
+            setup=fill_json,
+        ),
+        measure(
+            "store.jsonl.add_data",
+            size,
+            lambda: JSONLinesFileHandler(str(jsonl_path)).add_data(vacancies),
+            setup=reset(jsonl_path),
+        ),
+    ]
+
+
+def run_fetch(
+    items: List[Dict[str, Any]], latency: float, directory: Path
+) -> List[Dict[str, Any]]:
+    items = items[:MAX_FETCH_ITEMS]
+    size = len(items)
+    jsonl_path = directory / "pipeline.jsonl"
+    results = []
+    with FakeHHServer(items, latency=latency) as server:
+        results.append(
+            measure(
+                "fetch.sequential",
+                size,
+                lambda: HHAPI(url=server.url).load_vacancies("bench"),
+            )
+        )
+        results.append(
+            measure(
+                "fetch.concurrent",
+                size,
+                lambda: HHAPI(url=server.url).load_vacancies("bench", concurrent=True),
+            )
+        )
+
+        def pipeline() -> None:
+            api = HHAPI(url=server.url)
+            handler = JSONLinesFileHandler(str(jsonl_path))
+            handler.add_stream(
+                Vacancy.iter_cast_to_object(api.iter_vacancies("bench")),
+                batch_size=100,
+            )
+
+        results.append(
+            measure(
+                "pipeline.stream_to_jsonl",
+                size,
+                pipeline,
+                setup=lambda: jsonl_path.unlink(missing_ok=True),
+            )
+        )
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float
+) -> bool:
+    """Печатает сравнение с базовым прогоном; False, если есть регрессии"""
+    previous = {(r["scenario"], r["size"]): r for r in baseline["results"]}
+    ok = True
+    for result in results:
+        base = previous.get((result["scenario"], result["size"]))
+        if base is None:
+            continue
+        ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        mark = ""
+        if ratio > threshold:
+            mark = "  РЕГРЕССИЯ"
+            ok = False
+        print(
+            f"{result['scenario']:<28} {result['size']:>7} "
+            f"{base['seconds']:.4f}s -> {result['seconds']:.4f}s (x{ratio:.2f}){mark}"
+        )
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки конвейера вакансий")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="задержка ответа сервера, с"
+    )
+    parser.add_argument("--output", help="файл результатов (JSON)")
+    parser.add_argument("--baseline", help="результаты прошлого прогона для сравнения")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="допустимое замедление относительно базового прогона",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            items = generate_items(size)
+            results += run_parse(items)
+            results += run_store(items, Path(directory))
+            results += run_fetch(items, args.latency, Path(directory))
+
+    for result in results:
+        print(
+            f"{result['scenario']:<28} {result['size']:>7} "
+            f"{result['seconds']:.4f}s {result['items_per_second']:>12.0f} items/s "
+            f"{result['peak_memory_bytes'] / 2**20:>8.1f} MiB"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency": args.latency,
+        },
+        "results": results,
+    }
+    output = (
+        Path(args.output)
+        if args.output
+        else (RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=4)
+    print(f"Результаты сохранены в {output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            if not compare(results, json.load(file), args.threshold):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.payloads import paginate
+
+
+class FakeHHServer:
+    """
+    Локальная замена api.hh.ru: отдает заранее сгенерированные вакансии
+    постранично с искусственной задержкой ответа
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], latency: float = 0.0):
+        self.items = items
+        self.latency = latency
+        self.requests = 0
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__make_handler())
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}/vacancies"
+
+    def __make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                query = parse_qs(urlparse(self.path).query)
+                page = int(query.get("page", ["0"])[0])
+                per_page = int(query.get("per_page", ["20"])[0])
+                body = json.dumps(
+                    paginate(server.items, page, per_page), ensure_ascii=False
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "FakeHHServer":
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
@@ -1,19 +1,46 @@
-from src.external_api import HHAPI
-from src.vacancies import Vacancy
-from src.work_with_files import JSONFileHandler
+import argparse
+import contextlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TextIO
 
-#  Создание экземпляра класса для работы с API
+if TYPE_CHECKING:
+    from src.external_api import HHAPI
+    from src.vacancies import Vacancy
 
-hh_api = HHAPI()
+# Модули проекта (а с ними requests) импортируются внутри функций, а клиент
+# API создается только перед первым запросом: запуски из cron и конвейеров
+# не тратят время на то, что им не понадобится
 
 
-def user_interaction():
+def create_api(use_cache: bool = False) -> "HHAPI":
+    from src.external_api import HHAPI
+
+    if use_cache:
+        from src.cache import ResponseCache
+
+        return HHAPI(cache=ResponseCache.default())
+    return HHAPI()
+
+
+def user_interaction(hh_api: Optional["HHAPI"] = None):
+    from src.selection import sort_by_salary, top_n
+    from src.vacancies import Vacancy
+    from src.work_with_files import JSONFileHandler
+
     user_request = input("Введите поисковой запрос\n")
+    hh_api = hh_api or create_api()
     result = hh_api.load_vacancies(user_request)
     result = Vacancy.cast_to_object(result)
     sort_request = input("Отсортировать вакансии по зарплате? (от большей к меньшей)\n")
     if sort_request.lower() == "да":
-        sorted(result, reverse=True)
+        top_request = input("Сколько вакансий показать? (пусто - все)\n")
+        if top_request.strip().isdigit():
+            result = top_n(result, int(top_request))
+        else:
+            sort_by_salary(result)
     file_request = input("Если хотите записать результат в файл напишите 'файл'\n")
     if file_request.lower() == "файл":
         filename = input("Укажите имя файла. (В конце обязательно '.json')\n")
@@ -25,5 +52,128 @@ def user_interaction():
             print(filehandler1.vacancy_to_dict(vacancy))
 
 
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Поиск вакансий hh.ru. Без ключевых слов запускается диалог"
+    )
+    parser.add_argument("keywords", nargs="*", help="ключевые слова поиска")
+    parser.add_argument(
+        "--sort",
+        choices=("none", "salary"),
+        default="none",
+        help="salary - по убыванию зарплаты (вывод после загрузки всех страниц)",
+    )
+    parser.add_argument(
+        "--top", type=int, metavar="N", help="только N вакансий с наибольшей зарплатой"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="'-' - JSON Lines в stdout по мере загрузки страниц (по умолчанию), "
+        "*.jsonl - дозапись в файл после каждой страницы, иначе JSON-файл. "
+        "Относительный путь отсчитывается от текущей папки",
+    )
+    parser.add_argument(
+        "--concurrent", action="store_true", help="загружать страницы параллельно"
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="использовать кэш ответов на диске"
+    )
+    return parser
+
+
+def iter_search(
+    api: "HHAPI", keywords: Iterable[str], concurrent: bool = False
+) -> Iterator[List["Vacancy"]]:
+    """
+    Вакансии по ключевым словам постранично, по мере загрузки.
+    Вакансия, уже найденная по предыдущему слову, повторно не выдается
+    """
+    from src.vacancies import Vacancy
+
+    seen_links = set()
+    for keyword in dict.fromkeys(keywords):
+        for items in api.iter_pages(keyword, concurrent=concurrent):
+            page = []
+            for vacancy in Vacancy.iter_cast_to_object(items):
+                if vacancy.link:
+                    if vacancy.link in seen_links:
+                        continue
+                    seen_links.add(vacancy.link)
+                page.append(vacancy)
+            if page:
+                yield page
+
+
+def run_batch(
+    args: argparse.Namespace,
+    api: Optional["HHAPI"] = None,
+    stream: Optional[TextIO] = None,
+) -> None:
+    """Неинтерактивный поиск: результат пишется в stdout или в файл"""
+    from src.work_with_files import FileHandler
+
+    pages = iter_search(api or create_api(args.cache), args.keywords, args.concurrent)
+    # Сортировка и отбор лучших требуют всех вакансий, поэтому выводятся
+    # одной порцией; top_n при этом держит в памяти только N вакансий
+    if args.top is not None:
+        from src.selection import top_n
+
+        pages = iter([top_n((v for page in pages for v in page), args.top)])
+    elif args.sort == "salary":
+        from src.selection import sort_by_salary
+
+        pages = iter([sort_by_salary([v for page in pages for v in page])])
+
+    if args.output == "-":
+        stream = stream or sys.stdout
+        # Сообщения об ошибках разбора не должны смешиваться с JSON Lines
+        with contextlib.redirect_stdout(sys.stderr):
+            for page in pages:
+                for vacancy in page:
+                    record = FileHandler.vacancy_to_dict(vacancy)
+                    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+                # Следующая программа в конвейере получает страницу сразу
+                stream.flush()
+        return
+
+    # Обработчики кладут относительные пути в папку data проекта,
+    # а пользователь командной строки ждет файл в текущей папке
+    output = str(Path(args.output).resolve())
+    if output.endswith(".jsonl"):
+        from src.work_with_files import JSONLinesFileHandler
+
+        handler = JSONLinesFileHandler(output)
+        for page in pages:
+            handler.add_data(page)
+    else:
+        from src.work_with_files import JSONFileHandler
+
+        JSONFileHandler(output).add_data([v for page in pages for v in page])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.top is not None and args.top < 0:
+        parser.error("--top должен быть неотрицательным")
+    if not args.keywords:
+        user_interaction()
+        return 0
+
+    try:
+        run_batch(args)
+    except BrokenPipeError:
+        # Читатель конвейера (например, head) закрыл вывод раньше времени:
+        # перенаправляем stdout, чтобы не упасть при сбросе буфера на выходе
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except ConnectionError as e:
+        print(f"Ошибка загрузки: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
-    user_interaction()
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import json
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from src.work_with_files import FileHandler
+
+# Офлайн-таблица курсов: сколько рублей стоит единица валюты.
+# Коды валют как в API hh.ru (RUR - рубль, BYR - белорусский рубль)
+RATES_TO_RUB: Dict[str, float] = {
+    "RUR": 1.0,
+    "RUB": 1.0,
+    "USD": 90.0,
+    "EUR": 98.0,
+    "KZT": 0.19,
+    "BYR": 28.0,
+    "UAH": 2.2,
+    "UZS": 0.0072,
+    "KGS": 1.03,
+    "AZN": 53.0,
+    "GEL": 33.0,
+}
+# Налог на доходы: зарплата «до вычета» переводится в сумму «на руки»
+INCOME_TAX = 0.13
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+GroupBy = Union[str, Callable[[Dict[str, Any]], Any], None]
+
+
+def load_rates(path: str) -> Dict[str, float]:
+    """Загружает таблицу курсов из JSON-файла вида {"USD": 90.0, ...}"""
+    with open(path, "r", encoding="utf-8") as file:
+        return {**RATES_TO_RUB, **json.load(file)}
+
+
+def normalize_salary(
+    value: Optional[float],
+    currency: Optional[str] = None,
+    gross: Optional[bool] = None,
+    rates: Optional[Dict[str, float]] = None,
+) -> Optional[float]:
+    """
+    Переводит сумму в рубли «на руки». Валюта по умолчанию - рубль;
+    для неизвестной валюты возвращается None
+    """
+    if value is None:
+        return None
+    rate = (rates or RATES_TO_RUB).get(currency or "RUR")
+    if rate is None:
+        return None
+    amount = value * rate
+    if gross:
+        amount *= 1 - INCOME_TAX
+    return amount
+
+
+def salary_point(
+    record: Dict[str, Any], rates: Optional[Dict[str, float]] = None
+) -> Optional[float]:
+    """Нормализованная зарплата записи: середина вилки или известная граница"""
+    bounds = [
+        record.get(field)
+        for field in ("salary_min", "salary_max")
+        if record.get(field) is not None
+    ]
+    if not bounds:
+        return None
+    return normalize_salary(
+        sum(bounds) / len(bounds), record.get("currency"), record.get("gross"), rates
+    )
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Перцентиль отсортированной выборки с линейной интерполяцией"""
+    if not sorted_values:
+        raise ValueError("Пустая выборка")
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    fraction = position - lower
+    return sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+
+
+def histogram(
+    sorted_values: Sequence[float], bin_width: float
+) -> List[Dict[str, float]]:
+    """Гистограмма с корзинами ширины bin_width: [{"from", "to", "count"}]"""
+    counts: Dict[int, int] = {}
+    for value in sorted_values:
+        bucket = int(value // bin_width)
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return [
+        {"from": bucket * bin_width, "to": (bucket + 1) * bin_width, "count": count}
+        for bucket, count in sorted(counts.items())
+    ]
+
+
+def salary_stats(
+    records: Iterable[Dict[str, Any]],
+    group_by: GroupBy = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    bin_width: float = 50000,
+    rates: Optional[Dict[str, float]] = None,
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    Статистика нормализованных зарплат за один проход по записям.
+    group_by - имя поля записи (например "company" или "currency") или
+    функция записи -> ключ группы, например lambda r: r["title"].split()[0];
+    без группировки все записи попадают в группу "all".
+    Ключевое слово поиска в записях не хранится: чтобы сгруппировать
+    по нему, передайте функцию, которая находит слово по ссылке записи
+    (например, по результату BatchSearch.search)
+    """
+    if isinstance(group_by, str):
+        field = group_by
+        group_by = lambda record: record.get(field)
+
+    groups: Dict[Any, array] = {}
+    for record in records:
+        point = salary_point(record, rates)
+        if point is None:
+            continue
+        key = group_by(record) if group_by else "all"
+        values = groups.get(key)
+        if values is None:
+            values = groups[key] = array("d")
+        values.append(point)
+
+    stats = {}
+    for key, values in groups.items():
+        ordered = sorted(values)
+        stats[key] = {
+            "count": len(ordered),
+            "mean": sum(ordered) / len(ordered),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "median": percentile(ordered, 50),
+            "percentiles": {p: percentile(ordered, p) for p in percentiles},
+            "histogram": histogram(ordered, bin_width),
+        }
+    return stats
+
+
+class SalaryAnalytics:
+    """
+    Отчеты по зарплатам хранилища с кэшем по версии данных:
+    пока файл не изменился, повторный отчет не перечитывает данные
+    """
+
+    def __init__(self, handler: FileHandler, rates: Optional[Dict[str, float]] = None):
+        self.__handler = handler
+        self.__rates = rates
+        self.__cache: Dict[tuple, Dict[Any, Dict[str, Any]]] = {}
+        self.__cache_version: Any = None
+
+    def report(
+        self,
+        group_by: Optional[str] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        bin_width: float = 50000,
+    ) -> Dict[Any, Dict[str, Any]]:
+        version = self.__handler.data_version()
+        if version is None or version != self.__cache_version:
+            self.__cache.clear()
+            self.__cache_version = version
+
+        key = (group_by, tuple(percentiles), bin_width)
+        if version is None or key not in self.__cache:
+            self.__cache[key] = salary_stats(
+                self.__handler.get_data(),
+                group_by=group_by,
+                percentiles=percentiles,
+                bin_width=bin_width,
+                rates=self.__rates,
+            )
+        return self.__cache[key]
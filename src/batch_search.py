@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.external_api import HHAPI, PageFetchError
+from src.rate_limit import TokenBucket
+
+
+class BatchSearch:
+    """
+    Поиск вакансий сразу по списку ключевых слов.
+    Все поиски идут через один клиент HHAPI (общая сессия с пулом соединений)
+    и общий ограничитель частоты, а параметры и результаты у каждого
+    ключевого слова свои
+    """
+
+    def __init__(
+        self,
+        api: Optional[HHAPI] = None,
+        max_workers: int = 4,
+        requests_per_second: float = 5.0,
+        burst: int = 10,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers должен быть положительным")
+        if api is None:
+            api = HHAPI(rate_limiter=TokenBucket(requests_per_second, burst))
+        self.__api = api
+        self.__max_workers = max_workers
+        # Ошибки последнего поиска по ключевым словам: по e.page загрузку
+        # слова можно продолжить через start_page
+        self.errors: Dict[str, PageFetchError] = {}
+
+    def __load(
+        self, keyword: str, kwargs: Dict[str, Any]
+    ) -> Tuple[List[Dict], Optional[PageFetchError]]:
+        try:
+            return self.__api.load_vacancies(keyword, **kwargs), None
+        except PageFetchError as e:
+            # Ошибка одного слова не отменяет результаты остальных
+            return e.vacancies, e
+
+    def search(self, keywords: Iterable[str], **kwargs: Any) -> Dict[str, List[Dict]]:
+        """
+        Возвращает вакансии по каждому ключевому слову.
+        Вакансия, найденная по нескольким словам, остается только у первого
+        из них (по порядку в keywords). Аргументы kwargs передаются в
+        HHAPI.load_vacancies. Если слово загрузить не удалось, в результат
+        попадают его вакансии до ошибки, а сама ошибка - в self.errors
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda keyword: self.__load(keyword, kwargs), unique_keywords
+                )
+            )
+
+        self.errors = {}
+        seen_ids = set()
+        deduplicated: Dict[str, List[Dict]] = {}
+        for keyword, (items, error) in zip(unique_keywords, results):
+            if error is not None:
+                self.errors[keyword] = error
+            deduplicated[keyword] = []
+            for item in items:
+                if item["id"] in seen_ids:
+                    continue
+                seen_ids.add(item["id"])
+                deduplicated[keyword].append(item)
+        return deduplicated
+
+    def search_all(self, keywords: Iterable[str], **kwargs: Any) -> List[Dict]:
+        """Все уникальные вакансии по списку ключевых слов одним списком"""
+        return [
+            item for items in self.search(keywords, **kwargs).values() for item in items
+        ]
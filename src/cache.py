@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Запись кэша: {"body": ответ API, "etag": ..., "last_modified": ..., "stored_at": ...}
+CacheEntry = Dict[str, Any]
+
+
+class CacheBackend(ABC):
+    """Абстрактное хранилище записей кэша"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """Кэш в памяти, вытесняющий давно не использованные записи (LRU)"""
+
+    def __init__(self, max_size: int = 256):
+        if max_size < 1:
+            raise ValueError("max_size должен быть положительным")
+        self.__max_size = max_size
+        self.__entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+class DiskCache(CacheBackend):
+    """Кэш на диске: по одному JSON-файлу на запись"""
+
+    def __init__(self, directory: str):
+        self.__directory = Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+
+    def __path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.__directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self.__path(key), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self.__path(key)
+        # Пишем во временный файл и подменяем, чтобы не оставить обрывок записи
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(entry, file, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def clear(self) -> None:
+        for path in self.__directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class ResponseCache:
+    """
+    Кэш ответов API с ключом по URL и параметрам запроса.
+    Записи моложе ttl секунд отдаются без обращения к сети, для устаревших
+    записей HHAPI делает условный запрос с ETag/Last-Modified
+    """
+
+    def __init__(self, backends: Iterable[CacheBackend], ttl: float = 3600):
+        self.__backends = list(backends)
+        if not self.__backends:
+            raise ValueError("Нужно указать хотя бы одно хранилище кэша")
+        self.ttl = ttl
+
+    @classmethod
+    def default(
+        cls, directory: Optional[str] = None, ttl: float = 3600
+    ) -> "ResponseCache":
+        """Кэш из LRU в памяти поверх кэша на диске в data/cache"""
+        if directory is None:
+            directory = str(Path(__file__).parent.parent / "data" / "cache")
+        return cls([MemoryCache(), DiskCache(directory)], ttl=ttl)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return url + "?" + json.dumps(params or {}, sort_keys=True, ensure_ascii=False)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        for index, backend in enumerate(self.__backends):
+            entry = backend.get(key)
+            if entry is not None:
+                # Поднимаем запись в более быстрые хранилища
+                for faster in self.__backends[:index]:
+                    faster.set(key, entry)
+                return entry
+        return None
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry["stored_at"] < self.ttl
+
+    def store(
+        self,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        entry = {
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+        }
+        for backend in self.__backends:
+            backend.set(key, entry)
+        return entry
+
+    def touch(self, key: str, entry: CacheEntry) -> CacheEntry:
+        """Продлевает запись после ответа 304 Not Modified"""
+        return self.store(key, entry["body"], entry["etag"], entry["last_modified"])
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def clear(self) -> None:
+        for backend in self.__backends:
+            backend.clear()
@@ -0,0 +1,109 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.cache import DiskCache, ResponseCache
+from src.external_api import HHAPI, PageFetchError
+from src.queries import Criteria
+from src.vacancies import Vacancy
+from src.work_with_files import FileHandler
+
+# Идентификатор вакансии в ссылке вида https://hh.ru/vacancy/12345
+VACANCY_ID_PATTERN = re.compile(r"/vacancy/(\d+)")
+
+# Описание вакансии меняется редко, поэтому кэш живет неделю,
+# а после этого проверяется условным запросом по ETag
+DETAILS_TTL = 7 * 24 * 3600
+
+
+def vacancy_id(link: str) -> Optional[str]:
+    match = VACANCY_ID_PATTERN.search(link or "")
+    return match.group(1) if match else None
+
+
+class VacancyEnricher:
+    """
+    Дополняет вакансии полями из подробного описания /vacancies/{id}.
+    Описания загружаются параллельно не более чем max_workers запросами
+    и кэшируются на диске по id, так что повторный запуск не запрашивает
+    уже загруженные вакансии
+    """
+
+    def __init__(
+        self,
+        api: Optional[HHAPI] = None,
+        max_workers: int = 8,
+        cache_directory: Optional[str] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers должен быть положительным")
+        if api is None:
+            if cache_directory is None:
+                cache_directory = str(
+                    Path(__file__).parent.parent / "data" / "cache" / "details"
+                )
+            cache = ResponseCache([DiskCache(cache_directory)], ttl=DETAILS_TTL)
+            api = HHAPI(cache=cache, pool_size=max_workers)
+        self.__api = api
+        self.__max_workers = max_workers
+
+    def __fetch_one(self, vacancy_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.__api.get_vacancy(vacancy_id)
+        except PageFetchError as e:
+            # Вакансия могла быть снята с публикации
+            print(f"Не удалось загрузить вакансию {vacancy_id}: {e}")
+            return None
+
+    def fetch_details(self, ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Подробные описания по id; незагруженные вакансии пропускаются"""
+        unique_ids = list(dict.fromkeys(ids))
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            results = list(executor.map(self.__fetch_one, unique_ids))
+        return {
+            vacancy_id: details
+            for vacancy_id, details in zip(unique_ids, results)
+            if details is not None
+        }
+
+    def enrich(
+        self, vacancies: Iterable[Vacancy], force: bool = False
+    ) -> List[Vacancy]:
+        """
+        Дополняет вакансии на месте и возвращает те, что удалось дополнить.
+        Вакансии с уже известным описанием пропускаются, если не задан force
+        """
+        pending = {}
+        for vacancy in vacancies:
+            identifier = vacancy_id(vacancy.link)
+            if identifier is None:
+                continue
+            if force or vacancy.description is None:
+                pending.setdefault(identifier, []).append(vacancy)
+
+        enriched = []
+        for identifier, details in self.fetch_details(pending).items():
+            for vacancy in pending[identifier]:
+                vacancy.apply_details(details)
+                enriched.append(vacancy)
+        return enriched
+
+    def enrich_storage(
+        self,
+        handler: FileHandler,
+        criteria: Optional[Criteria] = None,
+        force: bool = False,
+    ) -> int:
+        """
+        Дополняет сохраненные вакансии и перезаписывает их через интерфейс
+        FileHandler.upsert_data: записи заменяются на своих местах одной
+        операцией. Возвращает число обновленных вакансий
+        """
+        vacancies = [
+            Vacancy.from_record(record) for record in handler.get_data(criteria)
+        ]
+        enriched = self.enrich(vacancies, force=force)
+        if enriched:
+            handler.upsert_data(enriched)
+        return len(enriched)
@@ -1,8 +1,49 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 
+from src.cache import ResponseCache
+from src.metrics import metrics
+from src.rate_limit import TokenBucket
+from src.transport import (
+    DEFAULT_TIMEOUT,
+    RETRY_STATUSES,
+    Timeout,
+    backoff_delay,
+    create_session,
+    retry_after,
+)
+
+
+class PageFetchError(ConnectionError):
+    """
+    Не удалось загрузить страницу выдачи даже после повторов.
+    page - номер страницы, с которой можно продолжить загрузку,
+    status - HTTP-статус ответа (None при ошибке соединения или таймауте),
+    vacancies - вакансии, загруженные до ошибки
+    """
+
+    def __init__(
+        self,
+        message: str,
+        page: int = 0,
+        retry_after: Optional[float] = None,
+        status: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.page = page
+        self.retry_after = retry_after
+        self.status = status
+        self.vacancies: List[Dict[str, Any]] = []
+
+    @property
+    def retryable(self) -> bool:
+        """Повтор имеет смысл при сбое сети и временных ошибках сервера"""
+        return self.status is None or self.status in RETRY_STATUSES
+
 
 class JobAPI(ABC):
     """Абстрактный класс для работы с API вакансий"""
@@ -25,13 +66,38 @@ class HHAPI(JobAPI):
     Класс для работы с API HeadHunter
     """
 
-    def __init__(self):
-        self.__url = "https://api.hh.ru/vacancies"
+    # API hh.ru отдает не больше 2000 результатов: 20 страниц по 100 вакансий
+    MAX_PAGES = 20
+    MAX_RESULTS = 2000
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        url: str = "https://api.hh.ru/vacancies",
+        rate_limiter: Optional[TokenBucket] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool_size: int = 10,
+        page_retries: int = 2,
+    ):
+        """
+        timeout - таймауты (соединение, чтение) в секундах,
+        pool_size - размер пула соединений, он должен покрывать число
+        параллельных запросов; page_retries - сколько раз повторить
+        загрузку страницы после исчерпания повторов на уровне HTTP.
+        Повторы перемножаются: каждая попытка страницы включает до 5
+        повторов urllib3 (build_retry), так что при стандартных настройках
+        страница в худшем случае запрашивается (1 + 5) * (1 + 2) = 18 раз.
+        Постоянные ошибки (400, 403, 404 и т.п.) не повторяются
+        """
+        self.__url = url
         self.__headers = {"User-Agent": "HH-User-Agent"}
+        # Шаблон параметров: каждый поиск работает со своей копией
         self.__params = {"text": "", "page": 0, "per_page": 100}
-        self.__vacancies = []
         self.__connected = False
-        self.__session = requests.Session()
+        self.__session = create_session(pool_size=pool_size, timeout=timeout)
+        self.__page_retries = page_retries
+        self.__cache = cache
+        self.__rate_limiter = rate_limiter
 
     def connect(self):
         """Публичный метод для реализации абстрактного класса"""
@@ -40,30 +106,214 @@ class HHAPI(JobAPI):
     def __establish_connection(self):
         """Приватный метод для реального подключения"""
         try:
+            self.__wait_for_rate_limit()
             response = self.__session.get(f"{self.__url}", headers=self.__headers)
             response.raise_for_status()
             self.__connected = True
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Ошибка подключения: {e}")
 
+    def __wait_for_rate_limit(self) -> None:
+        if self.__rate_limiter is not None:
+            self.__rate_limiter.acquire()
+
     def load_vacancies(
-        self, keyword: str, *args: Any, **kwargs: Any
+        self,
+        keyword: str,
+        *args: Any,
+        concurrent: bool = False,
+        max_workers: int = 4,
+        use_cache: bool = True,
+        start_page: int = 0,
+        **kwargs: Any,
     ) -> List[Dict[str, Any]]:
-        """Метод для получения вакансий"""
-        if not self.__connected:
-            self.__establish_connection()
-        self.__params["text"] = keyword
-        for page in range(20):
-            self.__params["page"] = page
-            response: requests.Response = self.__session.get(
-                self.__url, headers=self.__headers, params=self.__params
-            )
-            temp_vacancies: List[Dict[str, Any]] = response.json()["items"]
-            self.__vacancies.extend(temp_vacancies)
+        """
+        Метод для получения вакансий.
+        Дополнительные именованные аргументы передаются как параметры запроса.
+        При concurrent=True первая страница запрашивается отдельно, а остальные
+        загружаются параллельно не более чем max_workers запросами одновременно.
+        use_cache=False обходит кэш ответов, если он подключен.
+        Каждый вызов возвращает новый список только со своими результатами.
+        Если страница так и не загрузилась, PageFetchError содержит уже
+        полученные вакансии и номер страницы для продолжения через start_page
+        """
+        vacancies: List[Dict[str, Any]] = []
+        with metrics.timer("api.load_vacancies"):
+            try:
+                for items in self.iter_pages(
+                    keyword,
+                    concurrent=concurrent,
+                    max_workers=max_workers,
+                    use_cache=use_cache,
+                    params=kwargs,
+                    start_page=start_page,
+                ):
+                    vacancies.extend(items)
+            except PageFetchError as e:
+                e.vacancies = vacancies
+                raise
+        metrics.increment("api.items", len(vacancies))
+        return vacancies
 
-            if not temp_vacancies:  # Прерываем если закончились вакансии
+    def iter_pages(
+        self,
+        keyword: str,
+        concurrent: bool = False,
+        max_workers: int = 4,
+        use_cache: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        start_page: int = 0,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Генератор, отдающий вакансии постранично по мере загрузки.
+        В памяти одновременно держится только текущая страница.
+        params - дополнительные параметры запроса (date_from, order_by и т.п.),
+        start_page - страница, с которой начинается (или продолжается) загрузка
+        """
+        params = {**self.__params, **(params or {}), "text": keyword}
+        if concurrent:
+            yield from self.__iter_pages_concurrently(
+                params, max_workers, use_cache, start_page
+            )
+            return
+        for page in range(start_page, self.MAX_PAGES):
+            items = self.__fetch_page({**params, "page": page}, use_cache)["items"]
+            if not items:  # Прерываем если закончились вакансии
                 break
-        return self.__vacancies
+            yield items
+
+    def count_found(self, keyword: str, use_cache: bool = True, **kwargs: Any) -> int:
+        """
+        Сколько всего вакансий найдено по запросу (поле found), включая
+        недоступные из-за ограничения MAX_RESULTS. Запрашивается первая
+        страница, поэтому с кэшем последующая загрузка ее не повторяет
+        """
+        params = {**self.__params, **kwargs, "text": keyword, "page": 0}
+        return self.__fetch_page(params, use_cache).get("found", 0)
+
+    def iter_vacancies(self, keyword: str, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        """Генератор сырых вакансий по одной, аргументы как у iter_pages"""
+        for items in self.iter_pages(keyword, **kwargs):
+            yield from items
+
+    def get_vacancy(self, vacancy_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Полное описание вакансии с /vacancies/{id}: текст описания,
+        ключевые навыки, требуемый опыт и другие поля, которых нет в выдаче
+        """
+        return self.__fetch_page({}, use_cache, url=f"{self.__url}/{vacancy_id}")
+
+    def __fetch_page(
+        self,
+        params: Dict[str, Any],
+        use_cache: bool = True,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Загружает страницу, повторяя запрос только этой страницы при ошибке.
+        Задержка берется из Retry-After или растет экспоненциально
+        """
+        for attempt in range(self.__page_retries + 1):
+            try:
+                return self.__request_page(params, use_cache, url)
+            except PageFetchError as e:
+                if attempt == self.__page_retries or not e.retryable:
+                    raise
+                metrics.increment("api.retries")
+                delay = e.retry_after
+                time.sleep(delay if delay is not None else backoff_delay(attempt))
+
+    def __request_page(
+        self,
+        params: Dict[str, Any],
+        use_cache: bool = True,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Запрашивает одну страницу выдачи (или другой ресурс по url)
+        и возвращает ответ API. Свежий ответ берется из кэша, устаревший
+        проверяется условным запросом. Успешный ответ заодно подтверждает
+        соединение с API
+        """
+        url = url or self.__url
+        cache = self.__cache if use_cache else None
+        headers = self.__headers
+        entry = None
+        if cache is not None:
+            key = cache.make_key(url, params)
+            entry = cache.get(key)
+            if entry is not None:
+                if cache.is_fresh(entry):
+                    metrics.increment("api.cache_hits")
+                    return entry["body"]
+                headers = {**headers, **cache.conditional_headers(entry)}
+
+        try:
+            self.__wait_for_rate_limit()
+            metrics.increment("api.requests")
+            with metrics.timer("api.request"):
+                response: requests.Response = self.__session.get(
+                    url, headers=headers, params=params
+                )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            metrics.increment("api.errors")
+            error_response = getattr(e, "response", None)
+            target = f"страницы {params.get('page', 0)}" if url == self.__url else url
+            raise PageFetchError(
+                f"Ошибка загрузки {target}: {e}",
+                page=params.get("page", 0),
+                retry_after=retry_after(error_response),
+                status=getattr(error_response, "status_code", None),
+            )
+        self.__connected = True
+        if metrics.enabled:
+            metrics.increment("api.bytes", len(response.content))
+
+        if cache is None:
+            return response.json()
+        if entry is not None and response.status_code == 304:
+            metrics.increment("api.not_modified")
+            return cache.touch(key, entry)["body"]
+        body = response.json()
+        cache.store(
+            key,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return body
+
+    def __iter_pages_concurrently(
+        self,
+        params: Dict[str, Any],
+        max_workers: int,
+        use_cache: bool = True,
+        start_page: int = 0,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Загружает первую страницу, а затем остальные параллельно"""
+        if max_workers < 1:
+            raise ValueError("max_workers должен быть положительным")
+        first_page = self.__fetch_page({**params, "page": start_page}, use_cache)
+        if not first_page["items"]:
+            return
+        yield first_page["items"]
+        pages = min(first_page.get("pages", 1), self.MAX_PAGES)
+        if pages <= 1:
+            return
+
+        # У каждого запроса свой словарь параметров, общий менять нельзя
+        page_params = [
+            {**params, "page": page} for page in range(start_page + 1, pages)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map возвращает результаты в порядке страниц
+            responses = executor.map(
+                lambda page: self.__fetch_page(page, use_cache), page_params
+            )
+            for response in responses:
+                if response["items"]:
+                    yield response["items"]
 
 
 # Пример использования
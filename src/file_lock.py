@@ -0,0 +1,77 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Межпроцессная рекомендательная блокировка через отдельный .lock файл.
+    Разделяемую блокировку могут держать несколько читателей, исключительную -
+    только один писатель. На Windows обе блокировки исключительные
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @contextmanager
+    def __locked(self, exclusive: bool) -> Iterator[None]:
+        with open(self.path, "a+b") as file:
+            if fcntl is not None:
+                fcntl.flock(
+                    file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                )
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+                else:
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def shared(self):
+        """Блокировка для чтения"""
+        return self.__locked(exclusive=False)
+
+    def exclusive(self):
+        """Блокировка для записи"""
+        return self.__locked(exclusive=True)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Записывает файл целиком или не меняет его вовсе: данные пишутся
+    во временный файл в той же папке, сбрасываются на диск и подменяют
+    исходный файл через os.replace
+    """
+    path = Path(path)
+    descriptor, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Фиксируем на диске и саму запись о переименовании
+        directory = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
@@ -0,0 +1,127 @@
+import json
+import mmap
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Union
+
+TOMBSTONE_PREFIX = b'{"_deleted"'
+UPSERT_PREFIX = b'{"_upsert"'
+LINK_PATTERN = re.compile(rb'"link": "((?:[^"\\]|\\.)*)"')
+
+
+class LazyVacancyReader:
+    """
+    Читатель файла JSON Lines (формат JSONLinesFileHandler) только для чтения.
+    Файл отображается в память, при открытии строится лишь индекс смещений
+    записей, а сами записи разбираются при обращении к ним.
+    Поддерживает len(), индексы, срезы и итерацию
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.__file = open(path, "rb")
+        size = Path(path).stat().st_size
+        # Пустой файл нельзя отобразить в память
+        self.__data: Union[mmap.mmap, bytes] = (
+            mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        )
+        self.__starts = array("q")
+        self.__ends = array("q")
+        self.__build_index()
+
+    def __build_index(self) -> None:
+        data = self.__data
+        lines = []
+        has_tombstones = False
+        position = 0
+        size = len(data)
+        while position < size:
+            end = data.find(b"\n", position)
+            if end == -1:
+                end = size
+            if end > position and self.__is_complete(position, end, end == size):
+                lines.append((position, end))
+                head = data[position : position + len(TOMBSTONE_PREFIX)]
+                if head.startswith((TOMBSTONE_PREFIX, UPSERT_PREFIX)):
+                    has_tombstones = True
+            position = end + 1
+
+        if has_tombstones:
+            lines = self.__apply_tombstones(lines)
+        for start, end in lines:
+            self.__starts.append(start)
+            self.__ends.append(end)
+
+    def __is_complete(self, start: int, end: int, last: bool) -> bool:
+        """
+        Отсеивает строки, недописанные при сбое: JSONLinesFileHandler их
+        пропускает. Запись заканчивается на "}", а последняя строка без
+        перевода строки проверяется полным разбором
+        """
+        if self.__data[end - 1 : end] != b"}":
+            return False
+        if last:
+            try:
+                json.loads(self.__data[start:end])
+            except ValueError:
+                return False
+        return True
+
+    def __apply_tombstones(self, lines: List[tuple]) -> List[tuple]:
+        """
+        Исключает удаленные записи и подставляет замененные на место
+        прежних так же, как JSONLinesFileHandler
+        """
+        live: Dict[bytes, tuple] = {}
+        for start, end in lines:
+            line = self.__data[start:end]
+            if line.startswith(TOMBSTONE_PREFIX):
+                live.pop(json.loads(line)["_deleted"].encode("utf-8"), None)
+                continue
+            match = LINK_PATTERN.search(line)
+            link = (
+                json.loads(b'"' + match.group(1) + b'"').encode("utf-8")
+                if match
+                else line
+            )
+            if line.startswith(UPSERT_PREFIX):
+                live[link] = (start, end)
+            else:
+                live.setdefault(link, (start, end))
+        return list(live.values())
+
+    def __len__(self) -> int:
+        return len(self.__starts)
+
+    def __record(self, index: int) -> Dict[str, Any]:
+        record = json.loads(self.__data[self.__starts[index] : self.__ends[index]])
+        record.pop("_upsert", None)
+        return record
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [
+                self.__record(position) for position in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс вне диапазона")
+        return self.__record(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.__record(index)
+
+    def close(self) -> None:
+        if isinstance(self.__data, mmap.mmap):
+            self.__data.close()
+        self.__file.close()
+
+    def __enter__(self) -> "LazyVacancyReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
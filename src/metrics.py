@@ -0,0 +1,224 @@
+import io
+import json
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from src.file_lock import atomic_write
+
+
+class MetricsSink(ABC):
+    """Абстрактный приемник снимков метрик"""
+
+    @abstractmethod
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        pass
+
+
+class StdoutSink(MetricsSink):
+    """Печатает метрики в читаемом виде"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.__stream = stream
+
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        stream = self.__stream or sys.stdout
+        for name, value in sorted(snapshot["counters"].items()):
+            print(f"{name}: {value}", file=stream)
+        for name, timer in sorted(snapshot["timers"].items()):
+            print(
+                f"{name}: {timer['count']} раз, всего {timer['total']:.4f} с, "
+                f"максимум {timer['max']:.4f} с",
+                file=stream,
+            )
+
+
+class JSONSink(MetricsSink):
+    """Сохраняет снимок метрик в JSON-файл"""
+
+    def __init__(self, path: str):
+        self.__path = path
+
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        content = json.dumps(snapshot, ensure_ascii=False, indent=4)
+        atomic_write(self.__path, content.encode("utf-8"))
+
+
+class PrometheusSink(MetricsSink):
+    """
+    Сохраняет метрики в текстовом формате Prometheus, пригодном
+    для textfile-коллектора node_exporter
+    """
+
+    def __init__(self, path: str, prefix: str = "vacancies"):
+        self.__path = path
+        self.__prefix = prefix
+
+    def __metric_name(self, name: str, suffix: str = "") -> str:
+        cleaned = "".join(c if c.isalnum() else "_" for c in name)
+        return f"{self.__prefix}_{cleaned}{suffix}"
+
+    def render(self, snapshot: Dict[str, Any]) -> str:
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = self.__metric_name(name, "_total")
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, timer in sorted(snapshot["timers"].items()):
+            metric = self.__metric_name(name, "_seconds")
+            lines += [
+                f"# TYPE {metric} summary",
+                f"{metric}_count {timer['count']}",
+                f"{metric}_sum {timer['total']}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        atomic_write(self.__path, self.render(snapshot).encode("utf-8"))
+
+
+class _NullTimer:
+    """Таймер-заглушка для выключенных метрик"""
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, metrics: "Metrics", name: str):
+        self.__metrics = metrics
+        self.__name = name
+        self.__started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.__started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.__metrics.observe(self.__name, time.perf_counter() - self.__started)
+
+
+class Metrics:
+    """
+    Потокобезопасный реестр счетчиков и таймеров по этапам.
+    По умолчанию выключен: increment и timer тогда только проверяют флаг
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.__counters: Dict[str, float] = {}
+        self.__timers: Dict[str, Dict[str, float]] = {}
+        self.__lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Учитывает одно измерение длительности этапа"""
+        if not self.enabled:
+            return
+        with self.__lock:
+            timer = self.__timers.get(name)
+            if timer is None:
+                timer = self.__timers[name] = {"count": 0, "total": 0.0, "max": 0.0}
+            timer["count"] += 1
+            timer["total"] += seconds
+            timer["max"] = max(timer["max"], seconds)
+
+    def timer(self, name: str) -> Any:
+        """Контекстный менеджер, измеряющий длительность блока"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.__lock:
+            return {
+                "counters": dict(self.__counters),
+                "timers": {name: dict(t) for name, t in self.__timers.items()},
+            }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters.clear()
+            self.__timers.clear()
+
+    def export(self, sink: MetricsSink) -> None:
+        sink.export(self.snapshot())
+
+
+# Общий реестр, в который пишут HHAPI, Vacancy и обработчики файлов
+metrics = Metrics()
+
+
+def enable() -> None:
+    metrics.enabled = True
+
+
+def disable() -> None:
+    metrics.enabled = False
+
+
+class ProfileResult:
+    """Результаты профилирования: статистика cProfile и пик памяти"""
+
+    def __init__(self) -> None:
+        self.profile: Optional[Any] = None  # cProfile.Profile
+        self.memory_peak: Optional[int] = None
+        self.memory_top: list = []
+
+    def stats(self, sort: str = "cumulative", limit: int = 20) -> str:
+        """Текстовый отчет cProfile по самым затратным функциям"""
+        if self.profile is None:
+            return ""
+        import pstats
+
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+@contextmanager
+def profile(
+    cpu: bool = True, memory: bool = False, top: int = 10
+) -> Iterator[ProfileResult]:
+    """
+    Профилирует блок кода: cpu включает cProfile, memory - tracemalloc.
+    Пик памяти и крупнейшие места выделения доступны после выхода из блока
+    """
+    # Профилировщики импортируются только здесь: модуль метрик загружается
+    # при каждом запуске, а профилирование нужно редко
+    import cProfile
+    import tracemalloc
+
+    result = ProfileResult()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+    if cpu:
+        result.profile = cProfile.Profile()
+        result.profile.enable()
+    try:
+        yield result
+    finally:
+        if cpu:
+            result.profile.disable()
+        if memory:
+            result.memory_peak = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            result.memory_top = snapshot.statistics("lineno")[:top]
+            if started_tracing:
+                tracemalloc.stop()
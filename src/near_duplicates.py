@@ -0,0 +1,234 @@
+import hashlib
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.file_lock import atomic_write
+from src.text_index import tokenize
+
+# Параметры MinHash/LSH: 16 полос по 4 строки дают порог кандидатов
+# около (1/16) ** (1/4) = 0.5 оценки сходства Жаккара
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.7
+
+# Простое число Мерсенна для универсального хеширования
+MERSENNE_PRIME = (1 << 61) - 1
+SHINGLE_SIZE = 3
+SALARY_STEP = 10000
+TOMBSTONE_KEY = "_deleted"
+
+_random = random.Random(2024)
+PERMUTATIONS = [
+    (_random.randrange(1, MERSENNE_PRIME), _random.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+
+def shingles(record: Dict[str, Any]) -> Set[str]:
+    """
+    Признаки вакансии: буквенные триграммы нормализованного названия,
+    слова компании и округленная зарплатная вилка
+    """
+    title = " ".join(tokenize(str(record.get("title") or "")))
+    features = {
+        title[start : start + SHINGLE_SIZE]
+        for start in range(max(len(title) - SHINGLE_SIZE + 1, 1))
+    }
+    features.update(
+        f"company:{word}" for word in tokenize(str(record.get("company") or ""))
+    )
+    salary_min, salary_max = record.get("salary_min"), record.get("salary_max")
+    if salary_min is not None or salary_max is not None:
+        band = [
+            value // SALARY_STEP if value is not None else None
+            for value in (salary_min, salary_max)
+        ]
+        features.add(f"salary:{band[0]}-{band[1]}")
+    return features
+
+
+def minhash(features: Iterable[str]) -> List[int]:
+    """Сигнатура MinHash: минимум каждой из NUM_PERM хеш-функций по признакам"""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "big")
+        for f in features
+    ]
+    if not hashes:
+        return [MERSENNE_PRIME] * NUM_PERM
+    return [
+        min((a * value + b) % MERSENNE_PRIME for value in hashes)
+        for a, b in PERMUTATIONS
+    ]
+
+
+def similarity(left: List[int], right: List[int]) -> float:
+    """Оценка сходства Жаккара: доля совпавших позиций сигнатур"""
+    return sum(x == y for x, y in zip(left, right)) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """
+    Поиск почти одинаковых вакансий (перепосты агентств, филиалов)
+    по названию, компании и зарплате. Сигнатуры MinHash разбиваются
+    на полосы (LSH banding), и сравниваются только вакансии с общей
+    корзиной хотя бы в одной полосе, а не все пары
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.__signatures: Dict[str, List[int]] = {}
+        self.__buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+        # Строки файла сигнатур, не соответствующие живым вакансиям:
+        # надгробия и перезаписанные сигнатуры
+        self.stale_entries = 0
+
+    def __len__(self) -> int:
+        return len(self.__signatures)
+
+    @staticmethod
+    def __bands(signature: List[int]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(BANDS):
+            yield band, tuple(signature[band * ROWS : (band + 1) * ROWS])
+
+    def __insert(self, link: str, signature: List[int]) -> None:
+        if link in self.__signatures:
+            self.remove(link)
+        self.__signatures[link] = signature
+        for key in self.__bands(signature):
+            self.__buckets.setdefault(key, set()).add(link)
+
+    @staticmethod
+    def make_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Строка файла сигнатур для вакансии"""
+        return {"link": record["link"], "signature": minhash(shingles(record))}
+
+    def add_entry(self, entry: Dict[str, Any]) -> None:
+        self.__insert(entry["link"], entry["signature"])
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.add_entry(self.make_entry(record))
+
+    def add_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.add(record)
+
+    def remove(self, link: str) -> None:
+        signature = self.__signatures.pop(link, None)
+        if signature is None:
+            return
+        for key in self.__bands(signature):
+            bucket = self.__buckets.get(key)
+            if bucket is not None:
+                bucket.discard(link)
+                if not bucket:
+                    del self.__buckets[key]
+
+    def __candidates(self, signature: List[int]) -> Set[str]:
+        candidates: Set[str] = set()
+        for key in self.__bands(signature):
+            candidates.update(self.__buckets.get(key, ()))
+        return candidates
+
+    def find_duplicate(self, record: Dict[str, Any]) -> Optional[str]:
+        """
+        Ссылка на самую похожую сохраненную вакансию со сходством не ниже
+        порога или None. Вакансия с той же ссылкой дубликатом не считается
+        """
+        signature = minhash(shingles(record))
+        best, best_score = None, self.threshold
+        for link in self.__candidates(signature):
+            if link == record["link"]:
+                continue
+            score = similarity(signature, self.__signatures[link])
+            if score >= best_score:
+                best, best_score = link, score
+        return best
+
+    def pairs(self) -> List[Tuple[str, str, float]]:
+        """Все пары почти одинаковых вакансий индекса со сходством"""
+        seen: Set[Tuple[str, str]] = set()
+        result = []
+        for bucket in self.__buckets.values():
+            if len(bucket) < 2:
+                continue
+            ordered = sorted(bucket)
+            for i, left in enumerate(ordered):
+                for right in ordered[i + 1 :]:
+                    if (left, right) in seen:
+                        continue
+                    seen.add((left, right))
+                    score = similarity(
+                        self.__signatures[left], self.__signatures[right]
+                    )
+                    if score >= self.threshold:
+                        result.append((left, right, score))
+        return sorted(result)
+
+    @staticmethod
+    def append(path: Path, entries: Iterable[Dict[str, Any]]) -> None:
+        """Дописывает сигнатуры (make_entry) в файл рядом с данными"""
+        lines = [json.dumps(entry) + "\n" for entry in entries]
+        if not path.exists():
+            lines.insert(0, json.dumps({"num_perm": NUM_PERM, "bands": BANDS}) + "\n")
+        if lines:
+            with open(path, "a", encoding="utf-8") as file:
+                file.writelines(lines)
+
+    @staticmethod
+    def append_removed(path: Path, links: Iterable[str]) -> None:
+        """Отмечает удаленные вакансии в файле сигнатур надгробиями"""
+        lines = [json.dumps({TOMBSTONE_KEY: link}) + "\n" for link in links]
+        if lines:
+            with open(path, "a", encoding="utf-8") as file:
+                file.writelines(lines)
+
+    def save(self, path: Path) -> None:
+        """Перезаписывает файл сигнатур целиком, убирая надгробия"""
+        lines = [json.dumps({"num_perm": NUM_PERM, "bands": BANDS})]
+        lines += [
+            json.dumps({"link": link, "signature": signature})
+            for link, signature in self.__signatures.items()
+        ]
+        atomic_write(path, ("\n".join(lines) + "\n").encode("utf-8"))
+        self.stale_entries = 0
+
+    @classmethod
+    def load(
+        cls, path: Path, threshold: float = DEFAULT_THRESHOLD
+    ) -> Optional["NearDuplicateIndex"]:
+        """
+        Загружает сигнатуры; None, если файла нет или он построен
+        с другими параметрами MinHash
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return None
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, json.JSONDecodeError):
+            return None
+        if header != {"num_perm": NUM_PERM, "bands": BANDS}:
+            return None
+
+        index = cls(threshold)
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # недописанная при сбое строка
+            if TOMBSTONE_KEY in entry:
+                index.remove(entry[TOMBSTONE_KEY])
+            else:
+                index.add_entry(entry)
+        index.stale_entries = len(lines) - 1 - len(index)
+        return index
+
+    @staticmethod
+    def sidecar_path(data_file: Path) -> Path:
+        """Путь к файлу сигнатур рядом с файлом данных"""
+        return data_file.with_name(data_file.name + ".minhash.jsonl")
@@ -0,0 +1,205 @@
+import operator
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+# Запись хранилища: словарь полей вакансии
+Record = Dict[str, Any]
+Predicate = Callable[[Record], bool]
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Сравнения, для которых поле должно быть задано
+COMPARISONS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+# Соответствие операций запроса операторам SQL
+SQL_OPERATORS = {
+    "eq": "IS",
+    "ne": "IS NOT",
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+}
+
+
+class Query:
+    """
+    Скомпилированный фильтр записей.
+    Создается из словаря условий вида {"поле__операция": значение}:
+    eq (по умолчанию), ne, gt, gte, lt, lte, in, isnull, contains
+    (подстрока без учета регистра) и keywords (все слова присутствуют).
+    Условия словаря объединяются через И, ключ "or" принимает список
+    словарей условий. Запросы комбинируются операторами &, | и ~
+    """
+
+    def __init__(
+        self,
+        predicate: Predicate,
+        sql: Optional[tuple] = None,
+        fields: frozenset = frozenset(),
+        sql_types: frozenset = frozenset(),
+    ):
+        self.__predicate = predicate
+        # (условие WHERE, параметры), если запрос выражается на SQL
+        self.sql = sql
+        # Поля записи, которые использует запрос
+        self.fields = fields
+        # Пары (поле, тип значения) для сравнений на равенство: SQL совпадает
+        # с Python, только если тип значения совпадает с типом колонки
+        self.sql_types = sql_types
+
+    def __call__(self, record: Record) -> bool:
+        return self.__predicate(record)
+
+    def filter(self, records: Iterable[Record]) -> Iterator[Record]:
+        """Отбирает подходящие записи за один потоковый проход"""
+        return filter(self.__predicate, records)
+
+    def __and__(self, other: "Query") -> "Query":
+        left, right = self.__predicate, other.__predicate
+        sql = None
+        if self.sql and other.sql:
+            sql = (f"({self.sql[0]}) AND ({other.sql[0]})", self.sql[1] + other.sql[1])
+        return Query(
+            lambda record: left(record) and right(record),
+            sql,
+            self.fields | other.fields,
+            self.sql_types | other.sql_types,
+        )
+
+    def __or__(self, other: "Query") -> "Query":
+        left, right = self.__predicate, other.__predicate
+        sql = None
+        if self.sql and other.sql:
+            sql = (f"({self.sql[0]}) OR ({other.sql[0]})", self.sql[1] + other.sql[1])
+        return Query(
+            lambda record: left(record) or right(record),
+            sql,
+            self.fields | other.fields,
+            self.sql_types | other.sql_types,
+        )
+
+    def __invert__(self) -> "Query":
+        predicate = self.__predicate
+        # В SQL сравнение с NULL дает NULL, и NOT NULL тоже NULL, тогда как
+        # в Python условие над пустым полем ложно, а его отрицание истинно.
+        # COALESCE приводит NULL к ложи до отрицания
+        sql = (f"NOT COALESCE(({self.sql[0]}), 0)", self.sql[1]) if self.sql else None
+        return Query(
+            lambda record: not predicate(record), sql, self.fields, self.sql_types
+        )
+
+
+def _words(value: Any) -> set:
+    return set(WORD_PATTERN.findall(str(value).lower())) if value is not None else set()
+
+
+def _sql_type(value: Any) -> Optional[type]:
+    """
+    Тип значения для сравнения в SQL: строка, целое число или None.
+    Для прочих значений (bool, float и т.п.) строковое сравнение Python
+    и сравнение SQL с приведением типов колонки расходятся
+    """
+    if value is None or type(value) in (str, int):
+        return type(value)
+    return None
+
+
+def _compile_lookup(key: str, value: Any) -> Query:
+    field, _, operation = key.partition("__")
+    operation = operation or "eq"
+    get = operator.itemgetter(field)
+
+    def field_value(record: Record) -> Any:
+        try:
+            return get(record)
+        except KeyError:
+            return None
+
+    sql = None
+    sql_types = frozenset()
+    if operation in ("eq", "ne"):
+        # Как и раньше, значения сравниваются в строковом виде;
+        # строка значения вычисляется один раз при компиляции
+        expected = str(value)
+        if operation == "eq":
+            predicate = lambda record: str(field_value(record)) == expected
+        else:
+            predicate = lambda record: str(field_value(record)) != expected
+        value_type = _sql_type(value)
+        if value_type is not None:
+            sql = (f"{field} {SQL_OPERATORS[operation]} ?", (value,))
+            sql_types = frozenset({(field, value_type)})
+    elif operation in COMPARISONS:
+        compare = COMPARISONS[operation]
+
+        def predicate(record: Record) -> bool:
+            current = field_value(record)
+            return current is not None and compare(current, value)
+
+        sql = (f"{field} {SQL_OPERATORS[operation]} ?", (value,))
+    elif operation == "in":
+        allowed = frozenset(value)
+        predicate = lambda record: field_value(record) in allowed
+        values = tuple(item for item in allowed if item is not None)
+        placeholders = ", ".join("?" for _ in values)
+        condition = f"{field} IN ({placeholders})"
+        if None in allowed:
+            # NULL IN (...) в SQL не истинно, а None in allowed - истинно
+            condition = f"{condition} OR {field} IS NULL"
+        value_types = {_sql_type(item) for item in values}
+        if None not in value_types:
+            sql = (condition, values)
+            sql_types = frozenset((field, item) for item in value_types)
+    elif operation == "isnull":
+        expected_null = bool(value)
+        predicate = lambda record: (field_value(record) is None) == expected_null
+        sql = (f"{field} IS {'' if expected_null else 'NOT '}NULL", ())
+    elif operation == "contains":
+        needle = str(value).lower()
+
+        def predicate(record: Record) -> bool:
+            current = field_value(record)
+            return current is not None and needle in str(current).lower()
+
+    elif operation == "keywords":
+        required = _words(" ".join(value) if not isinstance(value, str) else value)
+        predicate = lambda record: required <= _words(field_value(record))
+    else:
+        raise ValueError(f"Неизвестная операция фильтра: {operation}")
+    if not field.isidentifier():
+        sql = None
+    return Query(predicate, sql, frozenset({field}), sql_types)
+
+
+# Условия фильтра, принимаемые хранилищами
+Criteria = Union[Dict[str, Any], Query]
+
+
+def compile_query(criteria: Optional[Criteria]) -> Query:
+    """Компилирует словарь условий в Query; готовый Query возвращается как есть"""
+    if isinstance(criteria, Query):
+        return criteria
+    parts = []
+    for key, value in (criteria or {}).items():
+        if key == "or":
+            alternatives = [compile_query(option) for option in value]
+            if not alternatives:
+                raise ValueError("Условие 'or' должно содержать варианты")
+            combined = alternatives[0]
+            for alternative in alternatives[1:]:
+                combined = combined | alternative
+            parts.append(combined)
+        else:
+            parts.append(_compile_lookup(key, value))
+    if not parts:
+        return Query(lambda record: True, ("1", ()))
+    query = parts[0]
+    for part in parts[1:]:
+        query = query & part
+    return query
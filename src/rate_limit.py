@@ -0,0 +1,45 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Потокобезопасный ограничитель частоты запросов «корзина токенов».
+    Токены пополняются со скоростью rate в секунду, но не больше capacity,
+    поэтому допускаются короткие всплески до capacity запросов
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate и capacity должны быть положительными")
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = float(capacity)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.__updated
+        self.__tokens = min(self.__capacity, self.__tokens + elapsed * self.__rate)
+        self.__updated = now
+
+    def try_acquire(self) -> bool:
+        """Забирает токен, если он есть, не дожидаясь пополнения"""
+        with self.__lock:
+            self.__refill()
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Блокирует поток, пока не появится свободный токен"""
+        while True:
+            with self.__lock:
+                self.__refill()
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait = (1 - self.__tokens) / self.__rate
+            time.sleep(wait)
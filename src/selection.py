@@ -0,0 +1,63 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Sequence
+
+from src.vacancies import Vacancy
+
+
+def salary_key(vacancy: Vacancy) -> int:
+    """Зарплата для сравнения, как в операторах сравнения Vacancy"""
+    return vacancy.salary_min or vacancy.salary_max or 0
+
+
+def top_n(vacancies: Iterable[Vacancy], n: int) -> List[Vacancy]:
+    """
+    N самых высокооплачиваемых вакансий по убыванию зарплаты.
+    Использует кучу размера n: O(N log n) без сортировки всей выборки
+    """
+    return heapq.nlargest(n, vacancies, key=salary_key)
+
+
+def sort_by_salary(vacancies: List[Vacancy], reverse: bool = True) -> List[Vacancy]:
+    """
+    Сортирует список на месте по ключу зарплаты.
+    Ключ вычисляется один раз на вакансию, а не при каждом сравнении
+    """
+    vacancies.sort(key=salary_key, reverse=reverse)
+    return vacancies
+
+
+class SalaryIndex:
+    """
+    Отсортированный индекс зарплат над коллекцией вакансий.
+    Строится один раз, после чего выборка по диапазону выполняется бинарным поиском
+    """
+
+    def __init__(
+        self, vacancies: Sequence[Vacancy], keys: Optional[Sequence[int]] = None
+    ):
+        if keys is None:
+            keys = [salary_key(vacancy) for vacancy in vacancies]
+        self.__vacancies = vacancies
+        self.__order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.__keys = [keys[position] for position in self.__order]
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    def in_range(
+        self, salary_from: Optional[int] = None, salary_to: Optional[int] = None
+    ) -> List[Vacancy]:
+        """Вакансии с ключом зарплаты в диапазоне [salary_from, salary_to]"""
+        start = 0 if salary_from is None else bisect_left(self.__keys, salary_from)
+        end = (
+            len(self.__keys)
+            if salary_to is None
+            else bisect_right(self.__keys, salary_to)
+        )
+        return [self.__vacancies[position] for position in self.__order[start:end]]
+
+    def top(self, n: int) -> List[Vacancy]:
+        """N вакансий с наибольшей зарплатой по убыванию"""
+        positions = self.__order[: -n - 1 : -1] if n > 0 else []
+        return [self.__vacancies[position] for position in positions]
@@ -0,0 +1,181 @@
+import gzip
+import json
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # Необязательная зависимость
+    zstandard = None
+
+Record = Dict[str, Any]
+
+COMPRESSIONS = (None, "gzip", "zstd")
+
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: Optional[str]) -> bytes:
+    try:
+        if compression == "gzip":
+            return gzip.decompress(data)
+        if compression == "zstd":
+            return zstandard.ZstdDecompressor().decompress(data)
+    except Exception as e:
+        # Ошибки распаковки приводим к ValueError, как и ошибки разбора JSON
+        raise ValueError(f"Не удалось распаковать данные: {e}")
+    return data
+
+
+def _check_compression(compression: Optional[str]) -> None:
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Неизвестный метод сжатия: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise ImportError("Для сжатия zstd установите пакет zstandard")
+
+
+class Serializer(ABC):
+    """Формат хранения списка записей в файле"""
+
+    @abstractmethod
+    def dumps(self, records: List[Record]) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> List[Record]:
+        """Разбирает данные; при некорректном содержимом вызывает ValueError"""
+        pass
+
+    def load_fields(self, data: bytes, fields: Iterable[str]) -> List[Record]:
+        """Читает только указанные поля записей"""
+        fields = list(fields)
+        return [
+            {field: record.get(field) for field in fields}
+            for record in self.loads(data)
+        ]
+
+
+class JSONSerializer(Serializer):
+    """
+    JSON-массив записей. По умолчанию совпадает с прежним форматом файла
+    (indent=4); indent=None дает компактную запись без пробелов
+    """
+
+    def __init__(self, indent: Optional[int] = 4, compression: Optional[str] = None):
+        _check_compression(compression)
+        self.__indent = indent
+        self.__compression = compression
+
+    def dumps(self, records: List[Record]) -> bytes:
+        if self.__indent is None:
+            content = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+        else:
+            content = json.dumps(records, ensure_ascii=False, indent=self.__indent)
+        return _compress(content.encode("utf-8"), self.__compression)
+
+    def loads(self, data: bytes) -> List[Record]:
+        return json.loads(_decompress(data, self.__compression))
+
+
+class ColumnarSerializer(Serializer):
+    """
+    Колоночный формат: каждое поле хранится отдельным блоком, поэтому
+    для выборки нескольких полей распаковываются только их блоки.
+    Поле company кодируется словарем: список уникальных названий и номера в нем.
+
+    Структура файла: MAGIC, длина заголовка (4 байта), заголовок в JSON
+    со смещениями блоков, затем сами блоки
+    """
+
+    MAGIC = b"VCOL1\n"
+    DICTIONARY_FIELDS = ("company",)
+
+    def __init__(self, compression: Optional[str] = "gzip"):
+        _check_compression(compression)
+        self.__compression = compression
+
+    def dumps(self, records: List[Record]) -> bytes:
+        fields: Dict[str, None] = {}
+        for record in records:
+            fields.update(dict.fromkeys(record))
+
+        blocks = []
+        columns = {}
+        offset = 0
+        for field in fields:
+            values = [record.get(field) for record in records]
+            if field in self.DICTIONARY_FIELDS:
+                dictionary: Dict[Any, int] = {}
+                codes = [
+                    dictionary.setdefault(value, len(dictionary)) for value in values
+                ]
+                column = {"dictionary": list(dictionary), "codes": codes}
+            else:
+                column = {"values": values}
+            block = _compress(
+                json.dumps(column, ensure_ascii=False, separators=(",", ":")).encode(
+                    "utf-8"
+                ),
+                self.__compression,
+            )
+            columns[field] = [offset, len(block)]
+            offset += len(block)
+            blocks.append(block)
+
+        header = json.dumps(
+            {
+                "count": len(records),
+                "compression": self.__compression,
+                "columns": columns,
+            }
+        ).encode("utf-8")
+        return self.MAGIC + struct.pack("<I", len(header)) + header + b"".join(blocks)
+
+    def __read_header(self, data: bytes) -> tuple:
+        if not data.startswith(self.MAGIC):
+            raise ValueError("Данные не в колоночном формате")
+        start = len(self.MAGIC)
+        try:
+            (header_length,) = struct.unpack_from("<I", data, start)
+        except struct.error as e:
+            raise ValueError(f"Поврежденный заголовок: {e}")
+        header_start = start + 4
+        header = json.loads(data[header_start : header_start + header_length])
+        return header, header_start + header_length
+
+    def __read_column(
+        self, data: bytes, header: Dict[str, Any], body_start: int, field: str
+    ) -> List[Any]:
+        location = header["columns"].get(field)
+        if location is None:
+            return [None] * header["count"]
+        offset, length = location
+        block = data[body_start + offset : body_start + offset + length]
+        column = json.loads(_decompress(block, header["compression"]))
+        if "dictionary" in column:
+            dictionary = column["dictionary"]
+            return [dictionary[code] for code in column["codes"]]
+        return column["values"]
+
+    def load_fields(self, data: bytes, fields: Iterable[str]) -> List[Record]:
+        header, body_start = self.__read_header(data)
+        fields = list(fields)
+        columns = [
+            self.__read_column(data, header, body_start, field) for field in fields
+        ]
+        return (
+            [dict(zip(fields, values)) for values in zip(*columns)]
+            if fields
+            else [{} for _ in range(header["count"])]
+        )
+
+    def loads(self, data: bytes) -> List[Record]:
+        header, _ = self.__read_header(data)
+        return self.load_fields(data, header["columns"])
@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.external_api import HHAPI
+from src.sync import DATE_FORMAT
+
+Window = Tuple[datetime, datetime]
+
+
+class ShardedCrawl:
+    """
+    Полная выгрузка по широкому запросу в обход ограничения API
+    в MAX_RESULTS результатов. Период публикации делится пополам, пока
+    выдача каждой части (шарда) не уложится в ограничение; шарды
+    загружаются параллельно и объединяются без повторов по id
+    """
+
+    def __init__(
+        self,
+        api: Optional[HHAPI] = None,
+        max_workers: int = 4,
+        period: timedelta = timedelta(days=30),
+        min_window: timedelta = timedelta(minutes=1),
+    ):
+        """
+        period - глубина поиска по умолчанию (API ищет за последние 30 дней),
+        min_window - самый короткий шард: его выдача берется как есть,
+        даже если не укладывается в ограничение
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers должен быть положительным")
+        self.__api = api or HHAPI()
+        self.__max_workers = max_workers
+        self.__period = period
+        self.__min_window = min_window
+
+    @staticmethod
+    def window_params(window: Window) -> Dict[str, str]:
+        date_from, date_to = window
+        return {
+            "date_from": date_from.strftime(DATE_FORMAT),
+            "date_to": date_to.strftime(DATE_FORMAT),
+        }
+
+    def __count(self, keyword: str, window: Window, params: Dict[str, Any]) -> int:
+        return self.__api.count_found(
+            keyword, **{**params, **self.window_params(window)}
+        )
+
+    def plan(
+        self,
+        keyword: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        **params: Any,
+    ) -> List[Window]:
+        """
+        Разбивает период на шарды, выдача каждого из которых укладывается
+        в ограничение API. Окна одного уровня проверяются параллельно
+        """
+        date_to = date_to or datetime.now(timezone.utc).replace(microsecond=0)
+        date_from = date_from or date_to - self.__period
+        frontier = [(date_from, date_to)]
+        shards: List[Window] = []
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while frontier:
+                counts = executor.map(
+                    lambda window: self.__count(keyword, window, params), frontier
+                )
+                next_frontier = []
+                for window, found in zip(frontier, counts):
+                    if found == 0:
+                        continue
+                    start, end = window
+                    if found <= self.__api.MAX_RESULTS:
+                        shards.append(window)
+                    elif end - start <= self.__min_window:
+                        print(
+                            f"Шард {start:%Y-%m-%d %H:%M}-{end:%H:%M}: найдено "
+                            f"{found}, загружены первые {self.__api.MAX_RESULTS}"
+                        )
+                        shards.append(window)
+                    else:
+                        middle = start + (end - start) / 2
+                        middle = middle.replace(microsecond=0)
+                        next_frontier += [(start, middle), (middle, end)]
+                frontier = next_frontier
+
+        return sorted(shards)
+
+    def crawl(
+        self,
+        keyword: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        **params: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Загружает все вакансии за период. Если выдача целиком укладывается
+        в ограничение, делается обычный запрос без разбиения.
+        Вакансия на границе двух шардов попадает в результат один раз
+        """
+        if date_from is None and date_to is None:
+            if self.__api.count_found(keyword, **params) <= self.__api.MAX_RESULTS:
+                return self.__api.load_vacancies(keyword, **params)
+
+        shards = self.plan(keyword, date_from, date_to, **params)
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            results = executor.map(
+                lambda window: self.__api.load_vacancies(
+                    keyword, **{**params, **self.window_params(window)}
+                ),
+                shards,
+            )
+            seen_ids = set()
+            vacancies = []
+            for items in results:
+                for item in items:
+                    if item["id"] in seen_ids:
+                        continue
+                    seen_ids.add(item["id"])
+                    vacancies.append(item)
+        return vacancies
@@ -0,0 +1,230 @@
+import gzip
+import json
+from bisect import bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.file_lock import FileLock, atomic_write
+from src.serializers import JSONSerializer, Serializer
+from src.work_with_files import FileHandler, _data_file_path
+
+Record = Dict[str, Any]
+# Момент истории: номер версии или время с часовым поясом
+Moment = Union[int, datetime]
+
+
+def _check_aware(moment: datetime) -> datetime:
+    """
+    Время снимков хранится с часовым поясом; наивное время неоднозначно
+    и не сравнивается с ним, поэтому отклоняется
+    """
+    if moment.tzinfo is None or moment.utcoffset() is None:
+        raise ValueError(
+            "Время должно содержать часовой пояс, например "
+            "datetime(2024, 5, 1, tzinfo=timezone.utc)"
+        )
+    return moment
+
+
+def _parse_timestamp(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    # Записи без пояса считаются UTC
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+def _diff_states(old: Dict[str, Record], new: Dict[str, Record]) -> Dict[str, Any]:
+    """Разница двух состояний по ссылкам, со старыми значениями записей"""
+    return {
+        "added": {link: record for link, record in new.items() if link not in old},
+        "removed": {link: record for link, record in old.items() if link not in new},
+        "changed": {
+            link: {"old": old[link], "new": record}
+            for link, record in new.items()
+            if link in old and old[link] != record
+        },
+    }
+
+
+def _apply_delta(state: Dict[str, Record], delta: Dict[str, Any]) -> None:
+    for link in delta["removed"]:
+        state.pop(link, None)
+    state.update(delta["added"])
+    for link, change in delta["changed"].items():
+        state[link] = change["new"]
+
+
+class SnapshotStore:
+    """
+    История состояний хранилища вакансий. Каждый снимок сохраняет только
+    разницу с предыдущим (добавленные, удаленные и измененные по ссылке
+    записи), а каждые checkpoint_every версий - еще и полную копию.
+    Восстановление состояния читает ближайшую копию и не больше
+    checkpoint_every разниц; сравнение двух моментов читает только
+    разницы между ними
+
+    Файлы лежат в data/history/<name>: manifest.json со списком версий,
+    v000001.delta.json.gz и v000001.checkpoint для опорных версий
+    """
+
+    def __init__(
+        self,
+        name: str = "vacancies",
+        checkpoint_every: int = 10,
+        serializer: Optional[Serializer] = None,
+    ):
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every должен быть положительным")
+        self.__directory = _data_file_path(str(Path("history") / name))
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        self.__manifest_path = self.__directory / "manifest.json"
+        self.__lock = FileLock(self.__directory / "manifest.lock")
+        self.__checkpoint_every = checkpoint_every
+        self.__serializer = serializer or JSONSerializer(
+            indent=None, compression="gzip"
+        )
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """Версии по возрастанию: номер, время, опорная ли версия, счетчики"""
+        try:
+            with open(self.__manifest_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return []
+
+    def __path(self, version: int, kind: str) -> Path:
+        suffix = "delta.json.gz" if kind == "delta" else "checkpoint"
+        return self.__directory / f"v{version:06d}.{suffix}"
+
+    def __read_delta(self, version: int) -> Dict[str, Any]:
+        with open(self.__path(version, "delta"), "rb") as file:
+            return json.loads(gzip.decompress(file.read()))
+
+    def __read_checkpoint(self, version: int) -> Dict[str, Record]:
+        with open(self.__path(version, "checkpoint"), "rb") as file:
+            records = self.__serializer.loads(file.read())
+        return {record["link"]: record for record in records}
+
+    def __version_at(self, versions: List[Dict[str, Any]], moment: Moment) -> int:
+        """Последняя версия не позже момента; 0 - до первого снимка"""
+        if isinstance(moment, int):
+            if not 0 <= moment <= len(versions):
+                raise ValueError(f"Нет версии {moment}")
+            return moment
+        timestamps = [_parse_timestamp(v["timestamp"]) for v in versions]
+        return bisect_right(timestamps, _check_aware(moment))
+
+    def __state(
+        self, versions: List[Dict[str, Any]], version: int
+    ) -> Dict[str, Record]:
+        if version == 0:
+            return {}
+        base = max(v["version"] for v in versions[:version] if v["checkpoint"])
+        state = self.__read_checkpoint(base)
+        for number in range(base + 1, version + 1):
+            _apply_delta(state, self.__read_delta(number))
+        return state
+
+    def state_at(self, moment: Moment) -> List[Record]:
+        """Записи хранилища в указанной версии или на указанное время"""
+        versions = self.versions()
+        return list(
+            self.__state(versions, self.__version_at(versions, moment)).values()
+        )
+
+    def commit(
+        self, records: Iterable[Record], timestamp: Optional[datetime] = None
+    ) -> Optional[int]:
+        """
+        Сохраняет новое состояние, если оно отличается от последнего.
+        Возвращает номер новой версии или None, если изменений нет
+        """
+        timestamp = _check_aware(timestamp or datetime.now(timezone.utc))
+        new_state = {record["link"]: record for record in records}
+        with self.__lock.exclusive():
+            versions = self.versions()
+            if versions and timestamp < _parse_timestamp(versions[-1]["timestamp"]):
+                raise ValueError("Снимок не может быть раньше последней версии")
+            delta = _diff_states(self.__state(versions, len(versions)), new_state)
+            if versions and not any(delta.values()):
+                return None
+
+            version = len(versions) + 1
+            checkpoint = (version - 1) % self.__checkpoint_every == 0
+            content = json.dumps(delta, ensure_ascii=False).encode("utf-8")
+            atomic_write(self.__path(version, "delta"), gzip.compress(content))
+            if checkpoint:
+                atomic_write(
+                    self.__path(version, "checkpoint"),
+                    self.__serializer.dumps(list(new_state.values())),
+                )
+            versions.append(
+                {
+                    "version": version,
+                    "timestamp": timestamp.isoformat(),
+                    "checkpoint": checkpoint,
+                    **{kind: len(delta[kind]) for kind in delta},
+                }
+            )
+            # Манифест пишется последним: до этого новая версия не видна
+            atomic_write(
+                self.__manifest_path,
+                json.dumps(versions, ensure_ascii=False, indent=4).encode("utf-8"),
+            )
+        return version
+
+    def snapshot(
+        self, handler: FileHandler, timestamp: Optional[datetime] = None
+    ) -> Optional[int]:
+        """Сохраняет текущее содержимое хранилища как новую версию"""
+        return self.commit(handler.get_data(), timestamp)
+
+    def diff(self, start: Moment, end: Moment) -> Dict[str, List[Any]]:
+        """
+        Изменения между двумя моментами: добавленные и удаленные записи
+        и пары (старая, новая) для измененных. Вакансия, появившаяся
+        и исчезнувшая внутри интервала, в результат не попадает
+        """
+        versions = self.versions()
+        first = self.__version_at(versions, start)
+        last = self.__version_at(versions, end)
+        if first > last:
+            raise ValueError("Начало интервала позже его конца")
+
+        # ссылка -> [запись до интервала, запись в конце интервала]
+        net: Dict[str, List[Optional[Record]]] = {}
+        for number in range(first + 1, last + 1):
+            delta = self.__read_delta(number)
+            for link, record in delta["added"].items():
+                net.setdefault(link, [None, None])[1] = record
+            for link, record in delta["removed"].items():
+                net.setdefault(link, [record, None])[1] = None
+            for link, change in delta["changed"].items():
+                net.setdefault(link, [change["old"], None])[1] = change["new"]
+
+        result: Dict[str, List[Any]] = {"added": [], "removed": [], "changed": []}
+        for link, (before, after) in net.items():
+            if before is None and after is not None:
+                result["added"].append(after)
+            elif before is not None and after is None:
+                result["removed"].append(before)
+            elif before is not None and before != after:
+                result["changed"].append({"link": link, "old": before, "new": after})
+        return result
+
+    def history(self, link: str) -> List[Dict[str, Any]]:
+        """События одной вакансии: когда появилась, менялась и исчезла"""
+        events = []
+        for entry in self.versions():
+            delta = self.__read_delta(entry["version"])
+            for kind in ("added", "removed", "changed"):
+                if link in delta[kind]:
+                    events.append(
+                        {
+                            "version": entry["version"],
+                            "timestamp": entry["timestamp"],
+                            "event": kind,
+                            "record": delta[kind][link],
+                        }
+                    )
+        return events
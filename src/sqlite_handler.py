@@ -0,0 +1,207 @@
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from src.queries import Criteria, Query, compile_query
+from src.work_with_files import FileHandler, _data_file_path
+
+# Поля, которые хранятся в отдельных колонках; остальные поля записи
+# складываются в колонку extra в виде JSON
+COLUMNS = ("title", "company", "salary_min", "salary_max", "link")
+# Типы значений колонок: сравнение на равенство выполняется запросом,
+# только если тип значения совпадает с типом колонки
+COLUMN_TYPES = {
+    "title": str,
+    "company": str,
+    "salary_min": int,
+    "salary_max": int,
+    "link": str,
+}
+
+
+class SQLiteFileHandler(FileHandler):
+    """
+    Хранилище вакансий в базе SQLite.
+    Фильтры по зарплате и компании выполняются запросами к индексам,
+    без загрузки всей базы в память
+    """
+
+    def __init__(self, filename: str = "vacancies.db"):
+        self.__filename = _data_file_path(filename)
+        self.__connection = sqlite3.connect(self.__filename)
+        self.__connection.row_factory = sqlite3.Row
+        self.__create_schema()
+
+    def __create_schema(self) -> None:
+        with self.__connection:
+            self.__connection.executescript("""
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    salary_min INTEGER,
+                    salary_max INTEGER,
+                    link TEXT NOT NULL UNIQUE,
+                    extra TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_vacancies_company
+                    ON vacancies (company);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_min
+                    ON vacancies (salary_min);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_max
+                    ON vacancies (salary_max);
+                CREATE INDEX IF NOT EXISTS idx_vacancies_salary_key
+                    ON vacancies (COALESCE(NULLIF(salary_min, 0), salary_max, 0));
+                """)
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __enter__(self) -> "SQLiteFileHandler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def __row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        item = {column: row[column] for column in COLUMNS}
+        if row["extra"]:
+            item.update(json.loads(row["extra"]))
+        return item
+
+    @staticmethod
+    def __dict_to_row(item: Dict[str, Any]) -> tuple:
+        extra = {key: value for key, value in item.items() if key not in COLUMNS}
+        return tuple(item.get(column) for column in COLUMNS) + (
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+        )
+
+    def __select(self, where: str = "", params: tuple = (), tail: str = "") -> List:
+        query = f"SELECT * FROM vacancies {where} {tail}"
+        rows = self.__connection.execute(query, params)
+        return [self.__row_to_dict(row) for row in rows]
+
+    @staticmethod
+    def __sql_condition(query: Query) -> Optional[tuple]:
+        """Условие WHERE для запроса, если он целиком выражается на SQL"""
+        if query.sql is not None and query.fields <= set(COLUMNS):
+            if all(
+                value_type is type(None) or COLUMN_TYPES[field] is value_type
+                for field, value_type in query.sql_types
+            ):
+                return query.sql
+        return None
+
+    def get_data(self, criteria: Optional[Criteria] = None) -> List[Dict[str, Any]]:
+        if criteria is None:
+            return self.__select(tail="ORDER BY id")
+        query = compile_query(criteria)
+        condition = self.__sql_condition(query)
+        if condition is not None:
+            return self.__select(f"WHERE {condition[0]}", condition[1], "ORDER BY id")
+        # Запрос по полям из extra проверяется в Python за один проход по курсору
+        rows = self.__connection.execute("SELECT * FROM vacancies ORDER BY id")
+        return list(query.filter(self.__row_to_dict(row) for row in rows))
+
+    def add_data(self, data: List["Vacancy"]) -> None:
+        rows = (self.__dict_to_row(self.vacancy_to_dict(v)) for v in data)
+        # Вся пачка вставляется одной транзакцией, дубликаты по ссылке пропускаются
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT OR IGNORE INTO vacancies "
+                "(title, company, salary_min, salary_max, link, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def upsert_data(self, data: List["Vacancy"]) -> None:
+        """Обновляет строки с теми же ссылками на месте (id не меняется)"""
+        rows = (self.__dict_to_row(self.vacancy_to_dict(v)) for v in data)
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO vacancies "
+                "(title, company, salary_min, salary_max, link, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (link) DO UPDATE SET title = excluded.title, "
+                "company = excluded.company, salary_min = excluded.salary_min, "
+                "salary_max = excluded.salary_max, extra = excluded.extra",
+                rows,
+            )
+
+    def delete_data(self, criteria: Criteria) -> None:
+        """
+        Удаляет записи по условиям. Условия на колонки выполняются запросом
+        к базе, если значения сравнений совпадают по типу с колонками,
+        остальные проверяются в Python
+        """
+        query = compile_query(criteria)
+        condition = self.__sql_condition(query)
+        with self.__connection:
+            if condition is not None:
+                self.__connection.execute(
+                    f"DELETE FROM vacancies WHERE {condition[0]}", condition[1]
+                )
+                return
+            rows = self.__connection.execute("SELECT * FROM vacancies")
+            links = [
+                (item["link"],)
+                for item in query.filter(self.__row_to_dict(row) for row in rows)
+            ]
+            self.__connection.executemany("DELETE FROM vacancies WHERE link = ?", links)
+
+    def contains(self, link: str) -> bool:
+        row = self.__connection.execute(
+            "SELECT 1 FROM vacancies WHERE link = ?", (link,)
+        ).fetchone()
+        return row is not None
+
+    def data_version(self) -> Optional[tuple]:
+        # PRAGMA data_version меняется при изменениях из других соединений,
+        # total_changes - при изменениях через это соединение
+        external = self.__connection.execute("PRAGMA data_version").fetchone()[0]
+        return (external, self.__connection.total_changes)
+
+    def count(self) -> int:
+        return self.__connection.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+    def get_by_salary_range(
+        self, salary_from: Optional[int] = None, salary_to: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Вакансии, вилка которых пересекается с диапазоном [salary_from, salary_to].
+        Вакансии без зарплаты не попадают в выборку
+        """
+        # Условия записаны без COALESCE, чтобы SQLite мог использовать индексы
+        conditions = ["(salary_min IS NOT NULL OR salary_max IS NOT NULL)"]
+        params: List[int] = []
+        if salary_from is not None:
+            conditions.append(
+                "(salary_max >= ? OR (salary_max IS NULL AND salary_min >= ?))"
+            )
+            params += [salary_from, salary_from]
+        if salary_to is not None:
+            conditions.append(
+                "(salary_min <= ? OR (salary_min IS NULL AND salary_max <= ?))"
+            )
+            params += [salary_to, salary_to]
+        return self.__select(
+            "WHERE " + " AND ".join(conditions), tuple(params), "ORDER BY id"
+        )
+
+    def get_top_by_salary(self, n: int) -> List[Dict[str, Any]]:
+        """N вакансий с наибольшей зарплатой (как при сравнении Vacancy)"""
+        return self.__select(
+            tail="ORDER BY COALESCE(NULLIF(salary_min, 0), salary_max, 0) DESC, id "
+            "LIMIT ?",
+            params=(n,),
+        )
+
+    def get_by_company(self, *companies: str) -> List[Dict[str, Any]]:
+        """Вакансии указанных компаний"""
+        if not companies:
+            return []
+        placeholders = ", ".join("?" for _ in companies)
+        return self.__select(
+            f"WHERE company IN ({placeholders})", companies, "ORDER BY id"
+        )
@@ -0,0 +1,116 @@
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from src.external_api import HHAPI
+from src.vacancies import Vacancy
+from src.work_with_files import FileHandler, _data_file_path
+
+# Формат дат API hh.ru, например 2024-05-01T10:00:00+0300
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def parse_date(value: str) -> datetime:
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+class SyncState:
+    """
+    Водяные знаки инкрементальной синхронизации по ключевым словам:
+    время последнего запуска и самая свежая дата публикации
+    """
+
+    def __init__(self, filename: str = "sync_state.json"):
+        self.__filename = _data_file_path(filename)
+
+    def __load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.__filename, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def get(self, keyword: str) -> Optional[Dict[str, str]]:
+        return self.__load().get(keyword)
+
+    def update(self, keyword: str, last_run: str, newest_published_at: str) -> None:
+        state = self.__load()
+        state[keyword] = {
+            "last_run": last_run,
+            "newest_published_at": newest_published_at,
+        }
+        temp_filename = self.__filename.with_name(self.__filename.name + ".tmp")
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False, indent=4)
+        os.replace(temp_filename, self.__filename)
+
+
+class IncrementalSync:
+    """
+    Загружает только вакансии, опубликованные после прошлого запуска.
+    Выдача запрашивается от новых к старым начиная с date_from, и постраничная
+    загрузка прекращается на первой уже сохраненной вакансии
+    """
+
+    def __init__(
+        self,
+        api: HHAPI,
+        handler: FileHandler,
+        state: Optional[SyncState] = None,
+    ):
+        self.__api = api
+        self.__handler = handler
+        self.__state = state or SyncState()
+
+    def sync(self, keyword: str) -> List[Vacancy]:
+        """Синхронизирует ключевое слово и возвращает добавленные вакансии"""
+        watermark = self.__state.get(keyword)
+        since = parse_date(watermark["newest_published_at"]) if watermark else None
+        params: Dict[str, Any] = {"order_by": "publication_time"}
+        if watermark:
+            params["date_from"] = watermark["newest_published_at"]
+
+        newest = watermark["newest_published_at"] if watermark else None
+        added: List[Vacancy] = []
+        # Кэш не используется: нужна актуальная выдача
+        for items in self.__api.iter_pages(keyword, use_cache=False, params=params):
+            new_items, reached_known = self.__split_page(items, since)
+            for item in new_items:
+                published_at = item.get("published_at")
+                if published_at and (
+                    newest is None or parse_date(published_at) > parse_date(newest)
+                ):
+                    newest = published_at
+            vacancies = Vacancy.cast_to_object(new_items)
+            self.__handler.add_data(vacancies)
+            added.extend(vacancies)
+            if reached_known:
+                break
+
+        last_run = datetime.now(timezone.utc).strftime(DATE_FORMAT)
+        if newest is not None:
+            self.__state.update(keyword, last_run, newest)
+        return added
+
+    def __split_page(
+        self, items: List[Dict[str, Any]], since: Optional[datetime]
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        """
+        Отделяет новые вакансии страницы от уже известных. Хранилище общее
+        для всех ключевых слов, поэтому сохраненная вакансия останавливает
+        загрузку, только если она не новее водяного знака этого слова;
+        иначе ее могло сохранить другое слово, и загрузка продолжается
+        """
+        new_items = []
+        for item in items:
+            published_at = item.get("published_at")
+            published = parse_date(published_at) if published_at else None
+            if since is not None and published is not None and published < since:
+                return new_items, True
+            if self.__handler.contains(item.get("alternate_url", "")):
+                if since is not None and published is not None and published <= since:
+                    return new_items, True
+                continue
+            new_items.append(item)
+        return new_items, False
@@ -0,0 +1,235 @@
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.file_lock import atomic_write
+
+WORD_PATTERN = re.compile(r"\w+")
+CYRILLIC_PATTERN = re.compile(r"[а-я]")
+
+# Окончания русских слов, от длинных к коротким (облегченный стеммер)
+RUSSIAN_ENDINGS = sorted(
+    (
+        "иями ями ами иях ях ах ией ием иям ям ам ия ья ие ье ей ий ой ем ом ию ью "
+        "ими ыми его ого ему ому ее ые ое ый ым им их ых ую юю ая яя ою ею "
+        "ов ев ешь ете ите ишь ует уют ить ать ять еть ла ло ли ть ет ит ут ют "
+        "ал ил ыл ся а я о е и ы у ю ь й"
+    ).split(),
+    key=len,
+    reverse=True,
+)
+ENGLISH_ENDINGS = ("ing", "ers", "er", "es", "ed", "s")
+MIN_STEM_LENGTH = 3
+
+# Поля вакансии, по которым строится индекс
+INDEXED_FIELDS = ("title", "company")
+
+# Индекс хранится журналом JSON Lines: первая строка - заголовок формата,
+# дальше добавленные документы и надгробия удаленных
+LOG_HEADER = {"format": "text-index", "version": 2}
+TOMBSTONE_KEY = "_deleted"
+
+
+def stem(word: str) -> str:
+    """Отбрасывает окончание слова, оставляя основу не короче MIN_STEM_LENGTH"""
+    endings = RUSSIAN_ENDINGS if CYRILLIC_PATTERN.search(word) else ENGLISH_ENDINGS
+    for ending in endings:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+            return word[: -len(ending)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Разбивает текст на слова, приводит к нижнему регистру и основам"""
+    return [stem(word) for word in WORD_PATTERN.findall(text.lower().replace("ё", "е"))]
+
+
+class TextIndex:
+    """
+    Инвертированный индекс по названию вакансии и компании.
+    Для каждой основы слова хранится список документов (posting list)
+    с числом вхождений; поиск ранжирует результаты по TF-IDF
+    """
+
+    def __init__(self):
+        self.__next_id = 0
+        # ссылка -> [id документа, число слов, название, компания]
+        self.__documents: Dict[str, List[Any]] = {}
+        self.__links: Dict[int, str] = {}
+        self.__postings: Dict[str, Dict[int, int]] = {}
+        # Устаревшие строки журнала: по ним решается, когда его сжать
+        self.stale_entries = 0
+
+    def __len__(self) -> int:
+        return len(self.__documents)
+
+    @staticmethod
+    def make_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Запись журнала индекса: ссылка, поля и число вхождений основ"""
+        terms = Counter(
+            term
+            for field in INDEXED_FIELDS
+            for term in tokenize(str(record.get(field) or ""))
+        )
+        return {
+            "link": record["link"],
+            "title": record.get("title"),
+            "company": record.get("company"),
+            "terms": dict(terms),
+        }
+
+    def __insert(self, entry: Dict[str, Any]) -> None:
+        link = entry["link"]
+        if link in self.__documents:
+            self.remove(link)
+        terms = entry["terms"]
+        doc_id = self.__next_id
+        self.__next_id += 1
+        self.__documents[link] = [
+            doc_id,
+            sum(terms.values()),
+            entry["title"],
+            entry["company"],
+        ]
+        self.__links[doc_id] = link
+        for term, count in terms.items():
+            self.__postings.setdefault(term, {})[doc_id] = count
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.__insert(self.make_entry(record))
+
+    def add_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.add(record)
+
+    def remove(self, link: str) -> None:
+        document = self.__documents.pop(link, None)
+        if document is None:
+            return
+        doc_id = document[0]
+        del self.__links[doc_id]
+        title, company = document[2], document[3]
+        for term in set(tokenize(f"{title or ''} {company or ''}")):
+            postings = self.__postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.__postings[term]
+
+    def search(
+        self, text: str, limit: int = 10, require_all: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Находит вакансии по словам запроса, лучшие результаты идут первыми.
+        При require_all=True в выдачу попадают только вакансии со всеми словами
+        """
+        terms = set(tokenize(text))
+        if not terms:
+            return []
+        postings = [self.__postings.get(term, {}) for term in terms]
+        if require_all and not all(postings):
+            return []
+
+        total = len(self.__documents)
+        scores: Dict[int, float] = {}
+        matched: Counter = Counter()
+        for term_postings in postings:
+            idf = math.log(1 + total / len(term_postings)) if term_postings else 0
+            for doc_id, count in term_postings.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + count * idf
+                matched[doc_id] += 1
+        if require_all:
+            scores = {
+                doc_id: score
+                for doc_id, score in scores.items()
+                if matched[doc_id] == len(terms)
+            }
+
+        # Длинные названия не должны выигрывать только за счет числа слов
+        for doc_id in scores:
+            length = self.__documents[self.__links[doc_id]][1]
+            scores[doc_id] /= math.sqrt(length or 1)
+
+        best = heapq.nsmallest(
+            limit, scores.items(), key=lambda pair: (-pair[1], pair[0])
+        )
+        hits = []
+        for doc_id, score in best:
+            link = self.__links[doc_id]
+            _, _, title, company = self.__documents[link]
+            hits.append(
+                {"link": link, "title": title, "company": company, "score": score}
+            )
+        return hits
+
+    @classmethod
+    def append(cls, path: Path, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Дописывает записи в журнал индекса, не загружая сам индекс:
+        так индекс поддерживают и обработчики, которые по нему не ищут
+        """
+        lines = [
+            json.dumps(cls.make_entry(record), ensure_ascii=False) + "\n"
+            for record in records
+        ]
+        if lines:
+            with open(path, "a", encoding="utf-8") as file:
+                file.writelines(lines)
+
+    @staticmethod
+    def append_removed(path: Path, links: Iterable[str]) -> None:
+        """Отмечает удаленные записи в журнале индекса надгробиями"""
+        lines = [json.dumps({TOMBSTONE_KEY: link}) + "\n" for link in links]
+        if lines:
+            with open(path, "a", encoding="utf-8") as file:
+                file.writelines(lines)
+
+    def save(self, path: Path) -> None:
+        """Перезаписывает журнал целиком, убирая надгробия и замененные записи"""
+        lines = [json.dumps(LOG_HEADER)]
+        for link, (_, _, title, company) in self.__documents.items():
+            entry = self.make_entry({"link": link, "title": title, "company": company})
+            lines.append(json.dumps(entry, ensure_ascii=False))
+        atomic_write(path, ("\n".join(lines) + "\n").encode("utf-8"))
+        self.stale_entries = 0
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["TextIndex"]:
+        """
+        Восстанавливает индекс по журналу; None, если файла нет
+        или он в другом формате. Основы слов хранятся в журнале,
+        поэтому при загрузке тексты заново не разбираются
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return None
+        try:
+            if json.loads(lines[0]) != LOG_HEADER:
+                return None
+        except (IndexError, json.JSONDecodeError):
+            return None
+
+        index = cls()
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # недописанная при сбое строка
+            if TOMBSTONE_KEY in entry:
+                index.remove(entry[TOMBSTONE_KEY])
+            else:
+                index.__insert(entry)
+        # Строки журнала, не соответствующие живым документам
+        index.stale_entries = len(lines) - 1 - len(index)
+        return index
+
+    @staticmethod
+    def sidecar_path(data_file: Path) -> Path:
+        """Путь к файлу индекса рядом с файлом данных"""
+        return data_file.with_name(data_file.name + ".index.jsonl")
@@ -0,0 +1,98 @@
+import random
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.metrics import metrics
+
+# Таймауты (соединение, чтение) в секундах
+DEFAULT_TIMEOUT = (3.05, 15)
+# Ответы, после которых запрос имеет смысл повторить
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """Адаптер, подставляющий таймаут во все запросы, где он не указан явно"""
+
+    def __init__(self, *args: Any, timeout: Timeout = DEFAULT_TIMEOUT, **kwargs: Any):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> Any:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class CountingRetry(Retry):
+    """
+    Политика повторов, учитывающая в метриках повторы внутри urllib3:
+    каждый повтор - это еще один запрос к API
+    """
+
+    def increment(self, *args: Any, **kwargs: Any) -> Retry:
+        # Исчерпанная политика бросает MaxRetryError, и повтора не будет
+        retry = super().increment(*args, **kwargs)
+        metrics.increment("api.retries")
+        metrics.increment("api.requests")
+        return retry
+
+
+def build_retry(
+    total: int = 5, backoff_factor: float = 0.5, backoff_jitter: float = 0.5
+) -> Retry:
+    """
+    Политика повторов: экспоненциальная задержка со случайной добавкой,
+    заголовок Retry-After у ответов 429/503 имеет приоритет
+    """
+    return CountingRetry(
+        total=total,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        # Последний неудачный ответ возвращается как есть, его статус
+        # проверяет raise_for_status
+        raise_on_status=False,
+    )
+
+
+def create_session(
+    pool_size: int = 10,
+    timeout: Timeout = DEFAULT_TIMEOUT,
+    retries: Optional[Retry] = None,
+) -> requests.Session:
+    """Сессия с пулом на pool_size соединений, таймаутами и повторами"""
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retries if retries is not None else build_retry(),
+        timeout=timeout,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def backoff_delay(
+    attempt: int, factor: float = 0.5, maximum: float = 30, jitter: float = 0.5
+) -> float:
+    """Задержка перед повтором номер attempt (с нуля)"""
+    return min(maximum, factor * 2**attempt) + random.uniform(0, jitter)
+
+
+def retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """Значение заголовка Retry-After в секундах, если сервер его прислал"""
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
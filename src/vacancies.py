@@ -1,9 +1,26 @@
-from typing import Dict, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from src.metrics import metrics
+
 
 class Vacancy:
-    __slots__ = ("title", "company", "salary_min", "salary_max", "link")
+    __slots__ = (
+        "title",
+        "company",
+        "salary_min",
+        "salary_max",
+        "link",
+        "currency",
+        "gross",
+        "description",
+        "key_skills",
+        "experience",
+    )
+
+    # Поля из подробного описания (/vacancies/{id}), в выдаче списком их нет
+    DETAIL_FIELDS = ("description", "key_skills", "experience")
 
     def __init__(
         self,
@@ -11,6 +28,8 @@ class Vacancy:
         company: str,
         salary: Optional[Union[int, str, Dict[str, int]]] = None,
         link: str = "",
+        currency: Optional[str] = None,
+        gross: Optional[bool] = None,
     ):
         self.title = title
         self.company = company
@@ -18,6 +37,15 @@ class Vacancy:
 
         # Валидация и парсинг зарплаты
         self.salary_min, self.salary_max = self.__validate_salary(salary)
+        # Валюта и признак «до вычета налогов» могут прийти в словаре зарплаты
+        if isinstance(salary, dict):
+            currency = currency or salary.get("currency")
+            gross = gross if gross is not None else salary.get("gross")
+        self.currency = currency
+        self.gross = gross
+        self.description: Optional[str] = None
+        self.key_skills: Optional[List[str]] = None
+        self.experience: Optional[str] = None
 
         # Вызов валидаторов
         self.__validate_title()
@@ -59,6 +87,63 @@ class Vacancy:
             if not all([result.scheme in ("http", "https"), result.netloc]):
                 raise ValueError("Некорректная ссылка")
 
+    @classmethod
+    def from_fields(
+        cls,
+        title: str,
+        company: str,
+        salary_min: Optional[int],
+        salary_max: Optional[int],
+        link: str,
+        currency: Optional[str] = None,
+        gross: Optional[bool] = None,
+        description: Optional[str] = None,
+        key_skills: Optional[List[str]] = None,
+        experience: Optional[str] = None,
+    ) -> "Vacancy":
+        """
+        Создает вакансию из уже проверенных полей без повторной валидации.
+        Используется пакетной обработкой, где проверка выполняется заранее
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.title = title
+        vacancy.company = company
+        vacancy.salary_min = salary_min
+        vacancy.salary_max = salary_max
+        vacancy.link = link
+        vacancy.currency = currency
+        vacancy.gross = gross
+        vacancy.description = description
+        vacancy.key_skills = key_skills
+        vacancy.experience = experience
+        return vacancy
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "Vacancy":
+        """Восстанавливает вакансию из записи хранилища (см. vacancy_to_dict)"""
+        return cls.from_fields(
+            record["title"],
+            record["company"],
+            record.get("salary_min"),
+            record.get("salary_max"),
+            record.get("link", ""),
+            record.get("currency"),
+            record.get("gross"),
+            *(record.get(field) for field in cls.DETAIL_FIELDS),
+        )
+
+    def apply_details(self, details: Dict) -> None:
+        """
+        Дополняет вакансию полями подробного описания из ответа API.
+        Отсутствующие в ответе поля не затирают уже известные значения
+        """
+        if details.get("description") is not None:
+            self.description = details["description"]
+        if details.get("key_skills") is not None:
+            self.key_skills = [skill["name"] for skill in details["key_skills"]]
+        if details.get("experience"):
+            self.experience = details["experience"].get("name")
+
     # Методы сравнения
     def __get_comparable_salary(self) -> int:
         return self.salary_min or self.salary_max or 0
@@ -86,33 +171,114 @@ class Vacancy:
         """
         Преобразует сырые данные из API в список объектов Vacancy
         """
-        vacancies = []
+        return list(cls.iter_cast_to_object(vacancies_data))
 
-        for vacancy_data in vacancies_data:
-            try:
-                # Извлекаем основные данные
-                title = vacancy_data.get("name", "")
-                company = vacancy_data.get("employer", {}).get("name", "")
-                link = vacancy_data.get("alternate_url", "")
-
-                # Обрабатываем зарплату
-                salary_data = vacancy_data.get("salary")
-                salary = None
+    @classmethod
+    def from_api_item(cls, vacancy_data: dict) -> "Vacancy":
+        """Создает вакансию из одного элемента выдачи API"""
+        # Извлекаем основные данные
+        title = vacancy_data.get("name", "")
+        company = vacancy_data.get("employer", {}).get("name", "")
+        link = vacancy_data.get("alternate_url", "")
 
-                if salary_data:
-                    # Приводим к единому формату для нашего класса
-                    salary = {
-                        "from": salary_data.get("from"),
-                        "to": salary_data.get("to"),
-                    }
+        # Обрабатываем зарплату
+        salary_data = vacancy_data.get("salary")
+        salary = None
 
-                # Создаем объект вакансии
-                vacancy = cls(title=title, company=company, salary=salary, link=link)
+        if salary_data:
+            # Приводим к единому формату для нашего класса
+            salary = {
+                "from": salary_data.get("from"),
+                "to": salary_data.get("to"),
+                "currency": salary_data.get("currency"),
+                "gross": salary_data.get("gross"),
+            }
 
-                vacancies.append(vacancy)
+        # Создаем объект вакансии
+        vacancy = cls(title=title, company=company, salary=salary, link=link)
+        # Подробное описание тоже можно превратить в вакансию целиком
+        vacancy.apply_details(vacancy_data)
+        return vacancy
 
+    @classmethod
+    def iter_cast_to_object(cls, vacancies_data: Iterable[dict]) -> Iterator["Vacancy"]:
+        """
+        Ленивая версия cast_to_object: принимает любой итерируемый источник
+        сырых данных и отдает объекты Vacancy по одному
+        """
+        for vacancy_data in vacancies_data:
+            try:
+                with metrics.timer("vacancies.parse"):
+                    vacancy = cls.from_api_item(vacancy_data)
             except (KeyError, ValueError) as e:
+                metrics.increment("vacancies.rejected")
                 print(f"Ошибка обработки вакансии: {e}")
                 continue
+            metrics.increment("vacancies.parsed")
+            yield vacancy
 
+    @classmethod
+    def cast_to_object_parallel(
+        cls,
+        vacancies_data: list[dict],
+        processes: Optional[int] = None,
+        chunk_size: int = 2000,
+        threshold: int = 10000,
+    ) -> list["Vacancy"]:
+        """
+        Параллельная версия cast_to_object для больших выгрузок.
+        Данные делятся на части по chunk_size, которые разбираются в пуле
+        процессов и возвращаются компактными кортежами в исходном порядке.
+        Меньше threshold элементов разбираются в текущем процессе
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным")
+        if len(vacancies_data) < threshold or processes == 1:
+            return cls.cast_to_object(vacancies_data)
+
+        chunks = [
+            vacancies_data[start : start + chunk_size]
+            for start in range(0, len(vacancies_data), chunk_size)
+        ]
+        vacancies = []
+        # Дочерние процессы пишут в свои копии метрик, поэтому считаем здесь
+        with metrics.timer("vacancies.parse_parallel"):
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                for rows, errors in executor.map(_convert_chunk, chunks):
+                    for error in errors:
+                        print(f"Ошибка обработки вакансии: {error}")
+                    metrics.increment("vacancies.rejected", len(errors))
+                    metrics.increment("vacancies.parsed", len(rows))
+                    vacancies.extend(cls.from_fields(*row) for row in rows)
         return vacancies
+
+
+def _convert_chunk(chunk: list[dict]) -> Tuple[List[tuple], List[str]]:
+    """
+    Разбирает часть сырых данных в дочернем процессе.
+    Возвращает кортежи полей вакансий и тексты ошибок: их передача
+    между процессами дешевле, чем передача объектов
+    """
+    rows = []
+    errors = []
+    for vacancy_data in chunk:
+        try:
+            vacancy = Vacancy.from_api_item(vacancy_data)
+        except (KeyError, ValueError) as e:
+            errors.append(str(e))
+            continue
+        rows.append(
+            (
+                vacancy.title,
+                vacancy.company,
+                vacancy.salary_min,
+                vacancy.salary_max,
+                vacancy.link,
+                vacancy.currency,
+                vacancy.gross,
+                vacancy.description,
+                vacancy.key_skills,
+                vacancy.experience,
+            )
+        )
+    return rows, errors
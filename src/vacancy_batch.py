@@ -0,0 +1,180 @@
+import heapq
+import re
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.vacancies import Vacancy
+
+# Та же проверка, что в Vacancy.__validate_link: схема http(s) и непустой хост
+LINK_PATTERN = re.compile(r"^https?://[^/?#]+", re.IGNORECASE)
+
+# Биты маски зарплаты
+HAS_MIN = 1
+HAS_MAX = 2
+
+
+class VacancyBatch:
+    """
+    Колоночное хранение пачки вакансий.
+    Строковые поля лежат в списках, границы зарплаты в компактных массивах
+    array('q'), а наличие значения отмечается в маске. Объекты Vacancy
+    создаются только по запросу
+    """
+
+    def __init__(self):
+        self.titles: List[str] = []
+        self.companies: List[str] = []
+        self.links: List[str] = []
+        self.salary_min = array("q")
+        self.salary_max = array("q")
+        self.salary_mask = bytearray()
+        self.currencies: List[Optional[str]] = []
+        self.gross: List[Optional[bool]] = []
+        # Ошибки валидации: (индекс во входных данных, описание)
+        self.errors: List[Tuple[int, str]] = []
+
+    @staticmethod
+    def __validate_text(values: List[Any]) -> List[bool]:
+        return [isinstance(value, str) and bool(value.strip()) for value in values]
+
+    @staticmethod
+    def __validate_links(values: List[Any]) -> List[bool]:
+        match = LINK_PATTERN.match
+        return [
+            isinstance(value, str) and (not value or match(value) is not None)
+            for value in values
+        ]
+
+    @staticmethod
+    def __validate_salaries(values: List[Any]) -> List[bool]:
+        return [
+            value is None or (isinstance(value, int) and not isinstance(value, bool))
+            for value in values
+        ]
+
+    @classmethod
+    def from_raw(cls, vacancies_data: Iterable[Dict[str, Any]]) -> "VacancyBatch":
+        """
+        Пакетная версия Vacancy.cast_to_object: каждая проверка выполняется
+        одним проходом по столбцу, а ошибки собираются в batch.errors
+        """
+        items = list(vacancies_data)
+        employers = [item.get("employer") or {} for item in items]
+        salaries = [item.get("salary") or {} for item in items]
+
+        titles = [item.get("name", "") for item in items]
+        companies = [employer.get("name", "") for employer in employers]
+        links = [item.get("alternate_url", "") for item in items]
+        salary_from = [salary.get("from") for salary in salaries]
+        salary_to = [salary.get("to") for salary in salaries]
+        currencies = [salary.get("currency") for salary in salaries]
+        gross = [salary.get("gross") for salary in salaries]
+
+        checks = (
+            (cls.__validate_text(titles), "Некорректное название вакансии"),
+            (cls.__validate_text(companies), "Некорректное название компании"),
+            (cls.__validate_salaries(salary_from), "Некорректный формат зарплаты"),
+            (cls.__validate_salaries(salary_to), "Некорректный формат зарплаты"),
+            (cls.__validate_links(links), "Некорректная ссылка"),
+        )
+
+        batch = cls()
+        for index in range(len(items)):
+            error = next((msg for valid, msg in checks if not valid[index]), None)
+            if error is not None:
+                batch.errors.append((index, error))
+                continue
+            batch.__append(
+                titles[index],
+                companies[index],
+                salary_from[index],
+                salary_to[index],
+                links[index],
+                currencies[index],
+                gross[index],
+            )
+        return batch
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "VacancyBatch":
+        batch = cls()
+        for vacancy in vacancies:
+            batch.__append(
+                vacancy.title,
+                vacancy.company,
+                vacancy.salary_min,
+                vacancy.salary_max,
+                vacancy.link,
+                vacancy.currency,
+                vacancy.gross,
+            )
+        return batch
+
+    def __append(
+        self,
+        title: str,
+        company: str,
+        salary_min: Optional[int],
+        salary_max: Optional[int],
+        link: str,
+        currency: Optional[str] = None,
+        gross: Optional[bool] = None,
+    ) -> None:
+        self.titles.append(title)
+        self.companies.append(company)
+        self.links.append(link)
+        self.salary_min.append(salary_min or 0)
+        self.salary_max.append(salary_max or 0)
+        self.salary_mask.append(
+            (HAS_MIN if salary_min is not None else 0)
+            | (HAS_MAX if salary_max is not None else 0)
+        )
+        self.currencies.append(currency)
+        self.gross.append(gross)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def get_salary(self, index: int) -> Tuple[Optional[int], Optional[int]]:
+        mask = self.salary_mask[index]
+        return (
+            self.salary_min[index] if mask & HAS_MIN else None,
+            self.salary_max[index] if mask & HAS_MAX else None,
+        )
+
+    def __getitem__(self, index: int) -> Vacancy:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс вне диапазона")
+        salary_min, salary_max = self.get_salary(index)
+        return Vacancy.from_fields(
+            self.titles[index],
+            self.companies[index],
+            salary_min,
+            salary_max,
+            self.links[index],
+            self.currencies[index],
+            self.gross[index],
+        )
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_vacancies(self) -> List[Vacancy]:
+        return list(self)
+
+    def salary_keys(self) -> array:
+        """Ключи зарплаты для сравнения (как salary_min or salary_max or 0)"""
+        keys = array("q", self.salary_min)
+        for index, mask in enumerate(self.salary_mask):
+            if not keys[index] and mask & HAS_MAX:
+                keys[index] = self.salary_max[index]
+        return keys
+
+    def top_n(self, n: int) -> List[Vacancy]:
+        """N самых высокооплачиваемых вакансий; создаются только они"""
+        keys = self.salary_keys()
+        positions = heapq.nlargest(n, range(len(self)), key=keys.__getitem__)
+        return [self[position] for position in positions]
@@ -1,12 +1,38 @@
 import json
+import os
 from abc import ABC, abstractmethod
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from src.file_lock import FileLock, atomic_write
+from src.lazy_reader import LazyVacancyReader
+from src.metrics import metrics
+from src.near_duplicates import NearDuplicateIndex
+from src.queries import Criteria, compile_query
+from src.serializers import JSONSerializer, Serializer
+from src.text_index import TextIndex
+
+
+def _data_file_path(filename: str) -> Path:
+    """Возвращает путь к файлу в папке data, создавая папку при необходимости"""
+    # Определяем путь к корню проекта
+    project_root = Path(__file__).parent.parent
+
+    # Создаем путь к папке data
+    data_dir = project_root / "data"
+    data_dir.mkdir(exist_ok=True)  # Создаем папку если не существует
+
+    # Полный путь к файлу (абсолютный путь остается как есть)
+    return data_dir / filename
 
 
 class FileHandler(ABC):
+    # Условия criteria описаны в src.queries.Query: словарь вида
+    # {"salary_min__gte": 100000, "title__contains": "python"} или готовый Query
+
     @abstractmethod
-    def get_data(self) -> List[Dict[str, Any]]:
+    def get_data(self, criteria: Optional[Criteria] = None) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
@@ -14,77 +40,566 @@ class FileHandler(ABC):
         pass
 
     @abstractmethod
-    def delete_data(self, criteria: Dict[str, Any]) -> None:
+    def delete_data(self, criteria: Criteria) -> None:
         pass
 
-
-class JSONFileHandler(FileHandler):
-    def __init__(self, filename: str = "vacancies.json"):
-        # Определяем путь к корню проекта
-        project_root = Path(__file__).parent.parent
-
-        # Создаем путь к папке data
-        self.__data_dir = project_root / "data"
-        self.__data_dir.mkdir(exist_ok=True)  # Создаем папку если не существует
-
-        # Полный путь к файлу
-        self.__filename = self.__data_dir / filename
-        self.__ensure_file_exists()
-
-    def __ensure_file_exists(self) -> None:
-        """Создает файл если он не существует"""
-        self.__filename.touch(exist_ok=True)
+    def upsert_data(self, data: List["Vacancy"]) -> None:
+        """
+        Заменяет сохраненные вакансии с теми же ссылками и добавляет новые.
+        Базовая версия удаляет и добавляет записи двумя операциями;
+        хранилища проекта переопределяют ее одной записью на месте
+        """
+        self.delete_data({"link__in": [vacancy.link for vacancy in data]})
+        self.add_data(data)
 
     @staticmethod
     def vacancy_to_dict(vacancy: "Vacancy") -> Dict[str, Any]:
-        return {
+        data = {
             "title": vacancy.title,
             "company": vacancy.company,
             "salary_min": vacancy.salary_min,
             "salary_max": vacancy.salary_max,
             "link": vacancy.link,
         }
+        # Необязательные поля записываются, только если они известны
+        if vacancy.currency is not None:
+            data["currency"] = vacancy.currency
+        if vacancy.gross is not None:
+            data["gross"] = vacancy.gross
+        for field in vacancy.DETAIL_FIELDS:
+            value = getattr(vacancy, field)
+            if value is not None:
+                data[field] = value
+        return data
+
+    def data_version(self) -> Optional[tuple]:
+        """
+        Метка версии данных: меняется при каждом изменении хранилища.
+        None означает, что версию определить нельзя и кэшировать нельзя
+        """
+        return None
+
+    def contains(self, link: str) -> bool:
+        """Проверяет, сохранена ли вакансия с указанной ссылкой"""
+        return any(item["link"] == link for item in self.get_data())
+
+    def add_stream(self, data: Iterable["Vacancy"], batch_size: int = 100) -> int:
+        """
+        Записывает вакансии из итерируемого источника пачками по batch_size,
+        не собирая весь поток в память. Возвращает число переданных вакансий
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size должен быть положительным")
+        iterator = iter(data)
+        total = 0
+        while batch := list(islice(iterator, batch_size)):
+            self.add_data(batch)
+            total += len(batch)
+        return total
+
+
+class JSONFileHandler(FileHandler):
+    def __init__(
+        self,
+        filename: str = "vacancies.json",
+        text_index: bool = False,
+        serializer: Optional[Serializer] = None,
+    ):
+        """
+        text_index=True включает полнотекстовый индекс по названию и компании,
+        который хранится рядом с файлом данных и обновляется при каждой записи.
+        serializer задает формат файла, по умолчанию JSON с отступами
+        """
+        self.__serializer = serializer or JSONSerializer()
+        self.__filename = _data_file_path(filename)
+        self.__ensure_file_exists()
+        # Несколько процессов могут работать с одним файлом: читатели берут
+        # разделяемую блокировку, писатель - исключительную
+        self.__lock = FileLock(
+            self.__filename.with_name(self.__filename.name + ".lock")
+        )
+        # Новые записи сначала попадают в журнал и переносятся в файл данных
+        # одной атомарной записью; после сбоя журнал доигрывается
+        self.__journal = self.__filename.with_name(self.__filename.name + ".journal")
+        # Индекс ссылок строится один раз и перестраивается,
+        # только если файл изменили в обход этого обработчика
+        self.__links: Optional[Set[str]] = None
+        self.__links_stamp: Optional[tuple] = None
+        self.__text_index: Optional[TextIndex] = None
+        # Метка файла индекса после последней загрузки или записи этим
+        # обработчиком: по ней видно, что индекс дописал другой обработчик
+        self.__text_index_stamp: Optional[tuple] = None
+        # Сигнатуры MinHash загружаются при первой нечеткой дедупликации
+        # и перечитываются, если файл сигнатур дописал другой обработчик
+        self.__near_duplicates: Optional[NearDuplicateIndex] = None
+        self.__near_duplicates_stamp: Optional[tuple] = None
+        if text_index:
+            self.__text_index = self.__open_text_index()
 
-    def get_data(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def __stamp(path: Path) -> Optional[tuple]:
         try:
-            with open(self.__filename, "r", encoding="utf-8") as file:
-                return json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError):
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def __open_text_index(self) -> TextIndex:
+        """
+        Загружает индекс с диска, а если его нет (или он в старом формате) -
+        строит по данным. Журнал с большим числом устаревших строк сжимается
+        """
+        path = TextIndex.sidecar_path(self.__filename)
+        index = TextIndex.load(path)
+        if index is None:
+            index = TextIndex()
+            index.add_many(self.get_data())
+            index.save(path)
+        elif index.stale_entries > len(index):
+            index.save(path)
+        self.__text_index_stamp = self.__stamp(path)
+        return index
+
+    def __update_text_index(
+        self, added: List[Dict[str, Any]], removed: List[str] = ()
+    ) -> None:
+        """
+        Дописывает изменения в журнал индекса, если он существует, даже когда
+        этот обработчик открыт без text_index: иначе индекс устареет
+        """
+        path = TextIndex.sidecar_path(self.__filename)
+        if not path.exists():
+            return
+        in_sync = (
+            self.__text_index is not None
+            and self.__stamp(path) == self.__text_index_stamp
+        )
+        TextIndex.append_removed(path, removed)
+        TextIndex.append(path, added)
+        if in_sync:
+            for link in removed:
+                self.__text_index.remove(link)
+            self.__text_index.add_many(added)
+            self.__text_index_stamp = self.__stamp(path)
+
+    def __open_near_duplicates(
+        self, existing_data: List[Dict[str, Any]]
+    ) -> NearDuplicateIndex:
+        """
+        Загружает сигнатуры с диска, а если их нет (или они построены с другими
+        параметрами) - строит по данным. Файл с большим числом устаревших
+        строк сжимается
+        """
+        path = NearDuplicateIndex.sidecar_path(self.__filename)
+        index = NearDuplicateIndex.load(path)
+        if index is None:
+            index = NearDuplicateIndex()
+            index.add_many(existing_data)
+            index.save(path)
+        elif index.stale_entries > len(index):
+            index.save(path)
+        self.__near_duplicates_stamp = self.__stamp(path)
+        return index
+
+    def __near_duplicate_index(
+        self, existing_data: List[Dict[str, Any]]
+    ) -> NearDuplicateIndex:
+        path = NearDuplicateIndex.sidecar_path(self.__filename)
+        if (
+            self.__near_duplicates is None
+            or self.__stamp(path) != self.__near_duplicates_stamp
+        ):
+            # Сигнатуры еще не загружены или их изменил другой обработчик
+            self.__near_duplicates = self.__open_near_duplicates(existing_data)
+        return self.__near_duplicates
+
+    def __update_near_duplicates(
+        self, added: List[Dict[str, Any]], removed: Iterable[str] = ()
+    ) -> None:
+        """
+        Дописывает изменения в файл сигнатур, если он уже создан;
+        загруженные сигнатуры обновляются, только если файл не менялся
+        в обход этого обработчика, иначе они перечитываются при обращении
+        """
+        path = NearDuplicateIndex.sidecar_path(self.__filename)
+        if not path.exists():
+            return
+        in_sync = (
+            self.__near_duplicates is not None
+            and self.__stamp(path) == self.__near_duplicates_stamp
+        )
+        removed = list(removed)
+        entries = [NearDuplicateIndex.make_entry(item) for item in added]
+        NearDuplicateIndex.append_removed(path, removed)
+        NearDuplicateIndex.append(path, entries)
+        if in_sync:
+            for link in removed:
+                self.__near_duplicates.remove(link)
+            for entry in entries:
+                self.__near_duplicates.add_entry(entry)
+            self.__near_duplicates_stamp = self.__stamp(path)
+
+    def __drop_near_duplicates(
+        self, existing_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Отбрасывает новые записи, почти совпадающие с уже известными"""
+        index = self.__near_duplicate_index(existing_data)
+        # Записи пакета попадают в сигнатуры хранилища только после записи,
+        # а до нее следующие записи пакета сравниваются с ними отдельно
+        batch = NearDuplicateIndex(index.threshold)
+        kept = []
+        for item in new_data:
+            if (
+                index.find_duplicate(item) is not None
+                or batch.find_duplicate(item) is not None
+            ):
+                metrics.increment("storage.fuzzy_dedup_hits")
+                continue
+            batch.add(item)
+            kept.append(item)
+        return kept
+
+    def near_duplicates(self) -> List[tuple]:
+        """Пары почти одинаковых сохраненных вакансий: (ссылка, ссылка, сходство)"""
+        with self.__lock.shared():
+            data = self.__read()
+        return self.__near_duplicate_index(data).pairs()
+
+    def search(self, text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Ищет вакансии по словам в названии и компании через индекс.
+        Возвращает ссылку, название, компанию и оценку релевантности
+        """
+        if self.__text_index is None:
+            raise RuntimeError("Полнотекстовый индекс не включен (text_index=True)")
+        path = TextIndex.sidecar_path(self.__filename)
+        if self.__stamp(path) != self.__text_index_stamp:
+            # Индекс изменил другой обработчик или процесс
+            self.__text_index = self.__open_text_index()
+        return self.__text_index.search(text, limit)
+
+    def __ensure_file_exists(self) -> None:
+        """Создает файл если он не существует"""
+        self.__filename.touch(exist_ok=True)
+
+    def __file_stamp(self) -> Optional[tuple]:
+        try:
+            stat = self.__filename.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def __link_index(
+        self, existing_data: Optional[List[Dict[str, Any]]] = None
+    ) -> Set[str]:
+        """Возвращает множество сохраненных ссылок, при необходимости перестраивая его"""
+        stamp = self.__file_stamp()
+        if self.__links is None or stamp != self.__links_stamp:
+            if existing_data is None:
+                existing_data = self.get_data()
+            self.__links = {item["link"] for item in existing_data}
+            self.__links_stamp = stamp
+        return self.__links
+
+    def __write(self, data: List[Dict[str, Any]]) -> None:
+        content = self.__serializer.dumps(data)
+        atomic_write(self.__filename, content)
+        metrics.increment("storage.write_bytes", len(content))
+        self.__links_stamp = self.__file_stamp()
+
+    def __read_bytes(self) -> bytes:
+        try:
+            with open(self.__filename, "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return b""
+
+    def __read(self, strict: bool = False) -> List[Dict[str, Any]]:
+        """
+        Читает файл данных. При strict=True поврежденный непустой файл
+        вызывает ValueError, чтобы запись не затерла его пустым списком
+        """
+        content = self.__read_bytes()
+        try:
+            return self.__serializer.loads(content)
+        except ValueError:
+            if strict and content.strip():
+                raise ValueError(f"Файл данных поврежден: {self.__filename}")
+            return []
+
+    def get_fields(self, fields: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Читает только указанные поля записей. Колоночный формат
+        распаковывает при этом лишь нужные столбцы
+        """
+        if self.__journal.exists():
+            with self.__lock.exclusive():
+                self.__replay_journal()
+        with self.__lock.shared():
+            content = self.__read_bytes()
+        try:
+            return self.__serializer.load_fields(content, fields)
+        except ValueError:
             return []
 
+    def __read_journal(self) -> List[Dict[str, Any]]:
+        """Записи журнала; недописанная при сбое строка пропускается"""
+        records = []
+        try:
+            with open(self.__journal, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def __write_journal(self, records: List[Dict[str, Any]]) -> None:
+        with open(self.__journal, "a", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def __apply(
+        self, existing_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]
+    ) -> None:
+        """Дописывает новые записи без дубликатов и очищает журнал"""
+        links = self.__link_index(existing_data)
+
+        # Фильтруем дубликаты. Новые ссылки попадают в индекс только после
+        # успешной записи: иначе при сбое повтор счел бы их дубликатами
+        pending: Set[str] = set()
+        filtered_new_data = [
+            item for item in new_data if not self.__is_duplicate(links, pending, item)
+        ]
+        metrics.increment("storage.dedup_hits", len(new_data) - len(filtered_new_data))
+
+        # Объединяем данные и сохраняем в файл
+        self.__write(existing_data + filtered_new_data)
+        links.update(pending)
+        self.__journal.unlink(missing_ok=True)
+
+        self.__update_text_index(filtered_new_data)
+        self.__update_near_duplicates(filtered_new_data)
+
+    def __replay_journal(self) -> None:
+        """Переносит в файл данных записи, оставшиеся в журнале после сбоя"""
+        if self.__journal.exists():
+            self.__apply(self.__read(strict=True), self.__read_journal())
+
+    def get_data(self, criteria: Optional[Criteria] = None) -> List[Dict[str, Any]]:
+        if self.__journal.exists():
+            with self.__lock.exclusive():
+                self.__replay_journal()
+        with self.__lock.shared():
+            data = self.__read()
+        if criteria is None:
+            return data
+        return list(compile_query(criteria).filter(data))
+
+    def contains(self, link: str) -> bool:
+        return link in self.__link_index()
+
+    def data_version(self) -> Optional[tuple]:
+        return self.__file_stamp()
+
     def __is_duplicate(
-        self, existing_data: List[Dict[str, Any]], new_item: Dict[str, Any]
+        self, links: Set[str], pending: Set[str], new_item: Dict[str, Any]
     ) -> bool:
-        return any(item["link"] == new_item["link"] for item in existing_data)
+        if new_item["link"] in links or new_item["link"] in pending:
+            return True
+        pending.add(new_item["link"])
+        return False
 
-    def add_data(self, data: List["Vacancy"]) -> None:
+    def add_data(self, data: List["Vacancy"], dedupe: str = "link") -> None:
+        """
+        dedupe="link" пропускает вакансии с уже сохраненной ссылкой,
+        dedupe="fuzzy" пропускает также почти одинаковые вакансии:
+        перепосты с другой ссылкой, названием в другой форме и т.п.
+        """
+        if dedupe not in ("link", "fuzzy"):
+            raise ValueError(f"Неизвестный режим дедупликации: {dedupe}")
         # Преобразуем объекты Vacancy в словари
         new_data = [self.vacancy_to_dict(v) for v in data]
 
-        # Получаем существующие данные
-        existing_data = self.get_data()
+        with metrics.timer("storage.add_data"), self.__lock.exclusive():
+            self.__replay_journal()
+            # Получаем существующие данные
+            with metrics.timer("storage.read"):
+                existing_data = self.__read(strict=True)
+            if dedupe == "fuzzy":
+                new_data = self.__drop_near_duplicates(existing_data, new_data)
+            self.__write_journal(new_data)
+            with metrics.timer("storage.merge_write"):
+                self.__apply(existing_data, new_data)
 
-        # Фильтруем дубликаты
-        filtered_new_data = [
-            item for item in new_data if not self.__is_duplicate(existing_data, item)
-        ]
+    def delete_data(self, criteria: Criteria) -> None:
+        query = compile_query(criteria)
+        with self.__lock.exclusive():
+            self.__replay_journal()
+            data = self.__read(strict=True)
+            links = self.__link_index(data)
+            filtered_data = []
+            removed = []
+            for item in data:
+                if query(item):
+                    removed.append(item["link"])
+                else:
+                    filtered_data.append(item)
+
+            self.__write(filtered_data)
+            links.difference_update(removed)
+            self.__update_text_index([], removed)
+            self.__update_near_duplicates([], removed)
 
-        # Объединяем данные
-        combined_data = existing_data + filtered_new_data
-
-        # Сохраняем в файл
-        with open(self.__filename, "w", encoding="utf-8") as file:
-            json.dump(combined_data, file, ensure_ascii=False, indent=4)
-
-    def delete_data(self, criteria: Dict[str, Any]) -> None:
-        data = self.get_data()
-        filtered_data = [
-            item
-            for item in data
-            if not all(
-                str(item.get(key)) == str(value) for key, value in criteria.items()
-            )
+    def upsert_data(self, data: List["Vacancy"]) -> None:
+        """Заменяет записи с теми же ссылками на их местах одной атомарной записью"""
+        updates = {vacancy.link: self.vacancy_to_dict(vacancy) for vacancy in data}
+        with self.__lock.exclusive():
+            self.__replay_journal()
+            existing_data = self.__read(strict=True)
+            links = self.__link_index(existing_data)
+            replaced = [
+                item["link"] for item in existing_data if item["link"] in updates
+            ]
+            merged = [updates.get(item["link"], item) for item in existing_data]
+            merged += [item for link, item in updates.items() if link not in links]
+            self.__write(merged)
+            links.update(updates)
+            self.__update_text_index(list(updates.values()), replaced)
+            self.__update_near_duplicates(list(updates.values()), replaced)
+
+
+class JSONLinesFileHandler(FileHandler):
+    """
+    Хранилище в формате JSON Lines: одна вакансия на строку.
+    Добавление дописывает строки в конец файла, удаление записывает
+    строку-надгробие {"_deleted": ссылка}. Место освобождает compact()
+    """
+
+    TOMBSTONE_KEY = "_deleted"
+    # Строка с этим ключом заменяет прежнюю запись с той же ссылкой
+    UPSERT_KEY = "_upsert"
+
+    def __init__(self, filename: str = "vacancies.jsonl"):
+        self.__filename = _data_file_path(filename)
+        self.__filename.touch(exist_ok=True)
+        self.__links: Optional[Set[str]] = None
+
+    @property
+    def filename(self) -> Path:
+        return self.__filename
+
+    def __iter_lines(self) -> Iterator[Dict[str, Any]]:
+        """Читает записи файла по одной, пропуская поврежденные строки"""
+        with open(self.__filename, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def __live_records(self) -> Dict[str, Dict[str, Any]]:
+        """Собирает актуальные записи с учетом надгробий"""
+        records: Dict[str, Dict[str, Any]] = {}
+        for record in self.__iter_lines():
+            if self.TOMBSTONE_KEY in record:
+                records.pop(record[self.TOMBSTONE_KEY], None)
+            elif record.pop(self.UPSERT_KEY, False):
+                # Замена остается на месте прежней записи
+                records[record["link"]] = record
+            else:
+                records.setdefault(record["link"], record)
+        return records
+
+    def __live_links(self) -> Set[str]:
+        if self.__links is None:
+            self.__links = set(self.__live_records())
+        return self.__links
+
+    def __append(self, records: Iterable[Dict[str, Any]]) -> None:
+        content = b"".join(
+            (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            for record in records
+        )
+        if content:
+            with open(self.__filename, "a+b") as file:
+                # После сбоя файл может оканчиваться недописанной строкой:
+                # новые записи начинаются с новой строки, чтобы не склеиться с ней
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        content = b"\n" + content
+                file.write(content)
+            metrics.increment("storage.write_bytes", len(content))
+
+    def __append_new(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Дописывает записи, ссылок которых еще нет в хранилище"""
+        links = self.__live_links()
+        new_records = []
+        for record in records:
+            if record["link"] not in links:
+                links.add(record["link"])
+                new_records.append(record)
+            else:
+                metrics.increment("storage.dedup_hits")
+        self.__append(new_records)
+
+    def get_data(self, criteria: Optional[Criteria] = None) -> List[Dict[str, Any]]:
+        records = self.__live_records().values()
+        if criteria is None:
+            return list(records)
+        return list(compile_query(criteria).filter(records))
+
+    def contains(self, link: str) -> bool:
+        return link in self.__live_links()
+
+    def data_version(self) -> Optional[tuple]:
+        stat = self.__filename.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def add_data(self, data: List["Vacancy"]) -> None:
+        self.__append_new(self.vacancy_to_dict(v) for v in data)
+
+    def delete_data(self, criteria: Criteria) -> None:
+        query = compile_query(criteria)
+        deleted = [link for link, item in self.__live_records().items() if query(item)]
+        self.__append({self.TOMBSTONE_KEY: link} for link in deleted)
+        self.__live_links().difference_update(deleted)
+
+    def upsert_data(self, data: List["Vacancy"]) -> None:
+        """
+        Дописывает замены одной строкой на вакансию: при сбое недописанная
+        строка пропускается, и остается прежняя запись
+        """
+        records = [
+            {self.UPSERT_KEY: True, **self.vacancy_to_dict(vacancy)} for vacancy in data
         ]
+        self.__append(records)
+        self.__live_links().update(record["link"] for record in records)
+
+    def reader(self) -> LazyVacancyReader:
+        """Ленивый читатель файла для постраничного просмотра без полной загрузки"""
+        return LazyVacancyReader(self.__filename)
+
+    def compact(self) -> None:
+        """Переписывает файл, оставляя только актуальные записи"""
+        records = self.__live_records()
+        temp_filename = self.__filename.with_name(self.__filename.name + ".tmp")
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            for record in records.values():
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_filename, self.__filename)
+        self.__links = set(records)
 
-        with open(self.__filename, "w", encoding="utf-8") as file:
-            json.dump(filtered_data, file, ensure_ascii=False, indent=4)
+    @classmethod
+    def migrate_from_json(
+        cls, source: str = "vacancies.json", filename: str = "vacancies.jsonl"
+    ) -> "JSONLinesFileHandler":
+        """Однократно переносит данные из JSON-хранилища в JSON Lines"""
+        handler = cls(filename)
+        handler.__append_new(JSONFileHandler(source).get_data())
+        return handler
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from src.analytics import (
+    SalaryAnalytics,
+    load_rates,
+    normalize_salary,
+    percentile,
+    salary_point,
+    salary_stats,
+)
+from src.sqlite_handler import SQLiteFileHandler
+from src.vacancies import Vacancy
+from src.work_with_files import JSONFileHandler
+
+
+@pytest.fixture
+def records():
+    return [
+        {"company": "A", "salary_min": 100000, "salary_max": 200000},
+        {"company": "A", "salary_min": 100000, "salary_max": None, "gross": True},
+        {"company": "B", "salary_min": None, "salary_max": 1000, "currency": "USD"},
+        {"company": "B", "salary_min": None, "salary_max": None},
+        {"company": "C", "salary_min": 5000, "salary_max": None, "currency": "XXX"},
+    ]
+
+
+def test_normalize_salary():
+    assert normalize_salary(100000) == 100000
+    assert normalize_salary(100000, gross=True) == pytest.approx(87000)
+    assert normalize_salary(1000, "USD", rates={"USD": 80.0}) == 80000
+    assert normalize_salary(1000, "XXX") is None
+    assert normalize_salary(None, "USD") is None
+
+
+def test_salary_point(records):
+    assert salary_point(records[0]) == 150000
+    assert salary_point(records[1]) == pytest.approx(87000)
+    assert salary_point(records[3]) is None
+
+
+def test_percentile():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([10], 90) == 10
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_salary_stats_grouped(records):
+    stats = salary_stats(records, group_by="company", rates={"RUR": 1, "USD": 100})
+
+    assert set(stats) == {"A", "B"}
+    assert stats["A"]["count"] == 2
+    assert stats["A"]["mean"] == pytest.approx((150000 + 87000) / 2)
+    assert stats["A"]["median"] == stats["A"]["percentiles"][50]
+    assert stats["B"]["max"] == 100000
+    assert sum(b["count"] for b in stats["A"]["histogram"]) == 2
+
+
+def test_salary_stats_ungrouped(records):
+    stats = salary_stats(records, bin_width=100000)
+    assert list(stats) == ["all"]
+    assert stats["all"]["count"] == 3
+    assert [b["from"] for b in stats["all"]["histogram"]] == [0, 100000]
+
+
+def test_load_rates(tmp_path):
+    path = tmp_path / "rates.json"
+    path.write_text(json.dumps({"USD": 75.5}), encoding="utf-8")
+    rates = load_rates(str(path))
+    assert rates["USD"] == 75.5
+    assert rates["RUR"] == 1.0
+
+
+@pytest.mark.parametrize("handler_class", [JSONFileHandler, SQLiteFileHandler])
+def test_report_is_cached_until_data_changes(tmp_path, mocker, handler_class):
+    handler = handler_class(str(tmp_path / "vacancies.data"))
+    handler.add_data([Vacancy("Dev", "A", 100000, "https://example.com/1")])
+    analytics = SalaryAnalytics(handler)
+    spy = mocker.spy(handler, "get_data")
+
+    first = analytics.report(group_by="company")
+    assert analytics.report(group_by="company") is first
+    assert spy.call_count == 1
+
+    handler.add_data([Vacancy("Dev", "B", 200000, "https://example.com/2")])
+    report = analytics.report(group_by="company")
+    assert spy.call_count == 2
+    assert set(report) == {"A", "B"}
+
+
+def test_salary_stats_grouped_by_callable(records):
+    keywords = {"A": "python", "B": "java"}
+    stats = salary_stats(records, group_by=lambda r: keywords.get(r["company"]))
+    assert {key: value["count"] for key, value in stats.items()} == {
+        "python": 2,
+        "java": 1,
+    }
@@ -0,0 +1,68 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.batch_search import BatchSearch
+from src.external_api import PageFetchError
+
+
+@pytest.fixture
+def api():
+    results = {
+        "python": [{"id": "1"}, {"id": "2"}],
+        "django": [{"id": "2"}, {"id": "3"}],
+        "java": [{"id": "4"}],
+    }
+    api = Mock()
+    api.load_vacancies.side_effect = lambda keyword, **kwargs: list(results[keyword])
+    return api
+
+
+def test_search_deduplicates_across_keywords(api):
+    result = BatchSearch(api, max_workers=3).search(["python", "django", "java"])
+
+    assert result == {
+        "python": [{"id": "1"}, {"id": "2"}],
+        "django": [{"id": "3"}],
+        "java": [{"id": "4"}],
+    }
+
+
+def test_search_skips_repeated_keywords(api):
+    BatchSearch(api).search(["python", "python"], concurrent=True)
+
+    api.load_vacancies.assert_called_once_with("python", concurrent=True)
+
+
+def test_search_all(api):
+    items = BatchSearch(api).search_all(["django", "python"])
+    assert [item["id"] for item in items] == ["2", "3", "1"]
+
+
+def test_invalid_workers(api):
+    with pytest.raises(ValueError):
+        BatchSearch(api, max_workers=0)
+
+
+def test_failed_keyword_keeps_other_results(api):
+    def load_vacancies(keyword, **kwargs):
+        if keyword == "django":
+            error = PageFetchError("Ошибка загрузки страницы 1", page=1, status=503)
+            error.vacancies = [{"id": "3"}]
+            raise error
+        return [{"id": "1"}] if keyword == "python" else [{"id": "4"}]
+
+    api.load_vacancies.side_effect = load_vacancies
+    search = BatchSearch(api, max_workers=3)
+
+    result = search.search(["python", "django", "java"])
+    assert result == {
+        "python": [{"id": "1"}],
+        "django": [{"id": "3"}],
+        "java": [{"id": "4"}],
+    }
+    assert list(search.errors) == ["django"]
+    assert search.errors["django"].page == 1
+
+    search.search(["python"])
+    assert search.errors == {}
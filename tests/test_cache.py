@@ -0,0 +1,63 @@
+import pytest
+
+from src.cache import DiskCache, MemoryCache, ResponseCache
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", {"body": 1})
+    cache.set("b", {"body": 2})
+    cache.get("a")  # "a" становится самой свежей записью
+    cache.set("c", {"body": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"body": 1}
+    assert len(cache) == 2
+
+
+def test_memory_cache_invalid_size():
+    with pytest.raises(ValueError):
+        MemoryCache(max_size=0)
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set("key", {"body": {"items": ["Вакансия"]}})
+
+    assert DiskCache(str(tmp_path)).get("key") == {"body": {"items": ["Вакансия"]}}
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_make_key_ignores_params_order():
+    first = ResponseCache.make_key("https://api", {"text": "a", "page": 1})
+    second = ResponseCache.make_key("https://api", {"page": 1, "text": "a"})
+    assert first == second
+    assert first != ResponseCache.make_key("https://api", {"text": "a", "page": 2})
+
+
+def test_response_cache_promotes_disk_entries(tmp_path):
+    memory = MemoryCache()
+    disk = DiskCache(str(tmp_path))
+    disk.set("key", {"body": 1, "stored_at": 0})
+
+    cache = ResponseCache([memory, disk])
+    assert cache.get("key")["body"] == 1
+    assert memory.get("key")["body"] == 1
+
+
+def test_response_cache_ttl(mocker):
+    cache = ResponseCache([MemoryCache()], ttl=10)
+    mocker.patch("src.cache.time.time", return_value=100)
+    entry = cache.store("key", {"items": []}, etag='"v1"')
+
+    mocker.patch("src.cache.time.time", return_value=105)
+    assert cache.is_fresh(entry)
+    mocker.patch("src.cache.time.time", return_value=111)
+    assert not cache.is_fresh(entry)
+    assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+
+def test_response_cache_requires_backend():
+    with pytest.raises(ValueError):
+        ResponseCache([])
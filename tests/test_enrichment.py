@@ -0,0 +1,101 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.enrichment import VacancyEnricher, vacancy_id
+from src.external_api import PageFetchError
+from src.vacancies import Vacancy
+from src.work_with_files import JSONFileHandler
+
+DETAILS = {
+    "1": {
+        "description": "<p>Python</p>",
+        "key_skills": [{"name": "Python"}, {"name": "SQL"}],
+        "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+    },
+    "2": {"description": "<p>Java</p>", "key_skills": [], "experience": None},
+}
+
+
+@pytest.fixture
+def api():
+    def get_vacancy(identifier):
+        if identifier not in DETAILS:
+            raise PageFetchError("404", page=0)
+        return DETAILS[identifier]
+
+    api = Mock()
+    api.get_vacancy.side_effect = get_vacancy
+    return api
+
+
+@pytest.fixture
+def vacancies():
+    return [
+        Vacancy("Python", "A", 100000, "https://hh.ru/vacancy/1"),
+        Vacancy("Java", "B", None, "https://hh.ru/vacancy/2?from=search"),
+        Vacancy("Removed", "C", None, "https://hh.ru/vacancy/3"),
+        Vacancy("No link", "D"),
+    ]
+
+
+def test_vacancy_id():
+    assert vacancy_id("https://hh.ru/vacancy/12345") == "12345"
+    assert vacancy_id("https://example.com/job") is None
+    assert vacancy_id("") is None
+
+
+def test_enrich(api, vacancies, capsys):
+    enriched = VacancyEnricher(api, max_workers=2).enrich(vacancies)
+
+    assert [v.title for v in enriched] == ["Python", "Java"]
+    assert vacancies[0].key_skills == ["Python", "SQL"]
+    assert vacancies[0].experience == "От 1 года до 3 лет"
+    assert vacancies[1].description == "<p>Java</p>"
+    assert vacancies[1].experience is None
+    assert vacancies[2].description is None
+    assert "Не удалось загрузить вакансию 3" in capsys.readouterr().out
+
+
+def test_enrich_skips_known_details(api, vacancies):
+    vacancies[0].description = "known"
+    enricher = VacancyEnricher(api)
+
+    enricher.enrich(vacancies[:1])
+    api.get_vacancy.assert_not_called()
+
+    enricher.enrich(vacancies[:1], force=True)
+    api.get_vacancy.assert_called_once_with("1")
+
+
+def test_enrich_storage(api, vacancies, tmp_path):
+    handler = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    handler.add_data(vacancies)
+
+    assert VacancyEnricher(api).enrich_storage(handler) == 2
+
+    records = {record["title"]: record for record in handler.get_data()}
+    # Дополненные записи остаются на своих местах
+    assert list(records) == ["Python", "Java", "Removed", "No link"]
+    assert records["Python"]["key_skills"] == ["Python", "SQL"]
+    assert records["Python"]["salary_min"] == 100000
+    assert "description" not in records["Removed"]
+
+    # Повторный запуск не трогает уже дополненные вакансии
+    api.get_vacancy.reset_mock()
+    assert VacancyEnricher(api).enrich_storage(handler) == 0
+    assert [call.args for call in api.get_vacancy.call_args_list] == [("3",)]
+
+
+def test_details_are_cached_on_disk(tmp_path, mocker):
+    enricher = VacancyEnricher(cache_directory=str(tmp_path / "details"))
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = DETAILS["1"]
+    mock_get = mocker.patch("requests.Session.get", return_value=response)
+
+    enricher.fetch_details(["1"])
+    fresh = VacancyEnricher(cache_directory=str(tmp_path / "details"))
+    assert fresh.fetch_details(["1"]) == {"1": DETAILS["1"]}
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args.args[0] == "https://api.hh.ru/vacancies/1"
@@ -4,7 +4,8 @@ import pytest
 import requests
 from requests.exceptions import RequestException
 
-from src.external_api import HHAPI, JobAPI
+from src.cache import MemoryCache, ResponseCache
+from src.external_api import HHAPI, JobAPI, PageFetchError
 
 
 @pytest.fixture
@@ -79,3 +80,236 @@ def test_load_vacancies_empty_response(hh_api, mocker):
     result = hh_api.load_vacancies("Empty")
 
     assert len(result) == 0
+
+
+def test_load_vacancies_concurrent(hh_api, mocker):
+    def fake_get(url, headers=None, params=None):
+        response = Mock()
+        response.json.return_value = {
+            "items": [{"id": f"{params['page']}-{i}"} for i in range(2)],
+            "pages": 5,
+            "found": 10,
+        }
+        return response
+
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get", side_effect=fake_get)
+    hh_api._HHAPI__connected = True
+
+    result = hh_api.load_vacancies("Python", concurrent=True, max_workers=3)
+
+    # Запрошены только существующие страницы, результаты идут в порядке страниц
+    assert mock_get.call_count == 5
+    assert [item["id"] for item in result] == [
+        f"{page}-{i}" for page in range(5) for i in range(2)
+    ]
+
+
+def test_load_vacancies_concurrent_invalid_workers(hh_api):
+    hh_api._HHAPI__connected = True
+    with pytest.raises(ValueError):
+        hh_api.load_vacancies("Python", concurrent=True, max_workers=0)
+
+
+def test_iter_pages_is_lazy(hh_api, mocker):
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    mock_response = Mock()
+    mock_response.json.return_value = {"items": [{"id": "1"}]}
+    mock_get.return_value = mock_response
+    hh_api._HHAPI__connected = True
+
+    pages = hh_api.iter_pages("Python")
+    assert mock_get.call_count == 0  # Ничего не запрошено до начала итерации
+
+    assert next(pages) == [{"id": "1"}]
+    assert mock_get.call_count == 1
+
+
+def test_iter_vacancies_flattens_pages(hh_api, mocker):
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    first, last = Mock(), Mock()
+    first.json.return_value = {"items": [{"id": "1"}, {"id": "2"}]}
+    last.json.return_value = {"items": []}
+    mock_get.side_effect = [first, last]
+    hh_api._HHAPI__connected = True
+
+    assert list(hh_api.iter_vacancies("Python")) == [{"id": "1"}, {"id": "2"}]
+
+
+def _page_response(items, status_code=200, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"items": items}
+    return response
+
+
+def test_load_vacancies_uses_cache():
+    cache = ResponseCache([MemoryCache()], ttl=3600)
+    api = HHAPI(cache=cache)
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = [_page_response([{"id": "1"}]), _page_response([])]
+        assert api.load_vacancies("Python") == [{"id": "1"}]
+        assert mock_get.call_count == 2
+
+    with patch.object(requests.Session, "get") as mock_get:
+        # Повторный поиск полностью обслуживается из кэша
+        assert list(HHAPI(cache=cache).iter_vacancies("Python")) == [{"id": "1"}]
+        assert mock_get.call_count == 0
+
+        # Обход кэша
+        mock_get.side_effect = [_page_response([{"id": "2"}]), _page_response([])]
+        result = list(HHAPI(cache=cache).iter_vacancies("Python", use_cache=False))
+        assert result == [{"id": "2"}]
+
+
+def test_stale_cache_sends_conditional_request():
+    cache = ResponseCache([MemoryCache()], ttl=0)
+    api = HHAPI(cache=cache)
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = [
+            _page_response([{"id": "1"}], headers={"ETag": '"v1"'}),
+            _page_response([]),
+        ]
+        api.load_vacancies("Python")
+
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = [_page_response([], status_code=304), _page_response([])]
+        assert list(HHAPI(cache=cache).iter_vacancies("Python")) == [{"id": "1"}]
+        assert mock_get.call_args_list[0].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_load_vacancies_http_error(hh_api, mocker):
+    sleep = mocker.patch("src.external_api.time.sleep")
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    mock_get.return_value.raise_for_status.side_effect = requests.HTTPError("500")
+
+    with pytest.raises(ConnectionError):
+        hh_api.load_vacancies("Python")
+
+    # Страница повторяется page_retries раз, затем ошибка пробрасывается
+    assert mock_get.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_failed_page_is_retried_alone(mocker):
+    sleep = mocker.patch("src.external_api.time.sleep")
+    api = HHAPI(page_retries=1)
+    throttled = Mock()
+    throttled.raise_for_status.side_effect = requests.HTTPError(
+        "429", response=Mock(status_code=429, headers={"Retry-After": "7"})
+    )
+    mock_get = mocker.patch.object(api._HHAPI__session, "get")
+    mock_get.side_effect = [
+        _page_response([{"id": "1"}]),
+        throttled,
+        _page_response([{"id": "2"}]),
+        _page_response([]),
+    ]
+
+    assert api.load_vacancies("Python") == [{"id": "1"}, {"id": "2"}]
+    sleep.assert_called_once_with(7.0)
+    pages = [call.kwargs["params"]["page"] for call in mock_get.call_args_list]
+    assert pages == [0, 1, 1, 2]
+
+
+def test_load_vacancies_can_be_resumed(mocker):
+    mocker.patch("src.external_api.time.sleep")
+    api = HHAPI(page_retries=0)
+    failed = Mock()
+    failed.raise_for_status.side_effect = requests.HTTPError("503")
+    mock_get = mocker.patch.object(api._HHAPI__session, "get")
+    mock_get.side_effect = [_page_response([{"id": "1"}]), failed]
+
+    with pytest.raises(PageFetchError) as error:
+        api.load_vacancies("Python")
+    assert error.value.page == 1
+    assert error.value.vacancies == [{"id": "1"}]
+
+    mock_get.side_effect = [_page_response([{"id": "2"}]), _page_response([])]
+    rest = api.load_vacancies("Python", start_page=error.value.page)
+    assert error.value.vacancies + rest == [{"id": "1"}, {"id": "2"}]
+    assert mock_get.call_args_list[2].kwargs["params"]["page"] == 1
+
+
+def test_iter_pages_extra_params(hh_api, mocker):
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    mock_get.return_value.json.return_value = {"items": []}
+
+    hh_api.load_vacancies("Python", date_from="2024-05-01T10:00:00+0300")
+
+    params = mock_get.call_args.kwargs["params"]
+    assert params["date_from"] == "2024-05-01T10:00:00+0300"
+    assert params["text"] == "Python"
+    assert "date_from" not in hh_api._HHAPI__params
+
+
+def test_load_vacancies_calls_are_isolated(hh_api, mocker):
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    first, empty = Mock(), Mock()
+    first.json.return_value = {"items": [{"id": "1"}]}
+    empty.json.return_value = {"items": []}
+    mock_get.side_effect = [first, empty, first, empty]
+
+    assert hh_api.load_vacancies("Python") == [{"id": "1"}]
+    # Повторный вызов не возвращает результаты предыдущего
+    assert hh_api.load_vacancies("Java") == [{"id": "1"}]
+
+
+def test_rate_limiter_is_used_for_each_request(mocker):
+    limiter = Mock()
+    api = HHAPI(rate_limiter=limiter)
+    mock_get = mocker.patch.object(api._HHAPI__session, "get")
+    mock_get.return_value.json.return_value = {"items": []}
+
+    api.connect()
+    api.load_vacancies("Python")
+
+    assert limiter.acquire.call_count == 2
+
+
+def test_count_found(hh_api, mocker):
+    response = Mock(status_code=200)
+    response.json.return_value = {"items": [], "found": 12345}
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get", return_value=response)
+
+    assert hh_api.count_found("python", area=1) == 12345
+    params = mock_get.call_args.kwargs["params"]
+    assert params["text"] == "python"
+    assert params["page"] == 0
+    assert params["area"] == 1
+
+
+def test_permanent_errors_are_not_retried(hh_api, mocker):
+    sleep = mocker.patch("src.external_api.time.sleep")
+    not_found = Mock()
+    not_found.raise_for_status.side_effect = requests.HTTPError(
+        "404", response=Mock(status_code=404, headers={})
+    )
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    mock_get.return_value = not_found
+
+    with pytest.raises(PageFetchError) as error:
+        hh_api.get_vacancy("123")
+
+    assert mock_get.call_count == 1
+    sleep.assert_not_called()
+    assert error.value.status == 404
+    assert not error.value.retryable
+    assert "https://api.hh.ru/vacancies/123" in str(error.value)
+    assert "страницы" not in str(error.value)
+
+
+def test_server_errors_are_retried(hh_api, mocker):
+    mocker.patch("src.external_api.time.sleep")
+    unavailable = Mock()
+    unavailable.raise_for_status.side_effect = requests.HTTPError(
+        "503", response=Mock(status_code=503, headers={})
+    )
+    mock_get = mocker.patch.object(hh_api._HHAPI__session, "get")
+    mock_get.return_value = unavailable
+
+    with pytest.raises(PageFetchError) as error:
+        hh_api.load_vacancies("Python")
+
+    assert mock_get.call_count == 3
+    assert error.value.retryable
@@ -0,0 +1,37 @@
+import pytest
+
+from src.file_lock import FileLock, atomic_write
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("old")
+
+    atomic_write(path, b"new")
+
+    assert path.read_text() == "new"
+    assert list(tmp_path.iterdir()) == [path]  # Временный файл не остался
+
+
+def test_atomic_write_keeps_original_on_failure(tmp_path, mocker):
+    path = tmp_path / "data.json"
+    path.write_text("old")
+    mocker.patch("src.file_lock.os.replace", side_effect=OSError("disk full"))
+
+    with pytest.raises(OSError):
+        atomic_write(path, b"new")
+
+    assert path.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_file_lock_contexts(tmp_path):
+    lock = FileLock(tmp_path / "data.lock")
+
+    with lock.shared():
+        with FileLock(tmp_path / "data.lock").shared():
+            pass  # Читатели не мешают друг другу
+    with lock.exclusive():
+        pass
+
+    assert (tmp_path / "data.lock").exists()
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from src.lazy_reader import LazyVacancyReader
+from src.vacancies import Vacancy
+from src.work_with_files import JSONLinesFileHandler
+
+
+@pytest.fixture
+def handler(tmp_path):
+    handler = JSONLinesFileHandler(str(tmp_path / "vacancies.jsonl"))
+    handler.add_data(
+        [
+            Vacancy(f"Vacancy {number}", "Company", number, f"https://hh.ru/{number}")
+            for number in range(1, 11)
+        ]
+    )
+    return handler
+
+
+def test_len_index_and_slice(handler):
+    with handler.reader() as reader:
+        assert len(reader) == 10
+        assert reader[0]["title"] == "Vacancy 1"
+        assert reader[-1]["salary_min"] == 10
+        assert [item["salary_min"] for item in reader[2:5]] == [3, 4, 5]
+        assert [item["salary_min"] for item in reader[::4]] == [1, 5, 9]
+        with pytest.raises(IndexError):
+            reader[10]
+
+
+def test_iteration_matches_handler(handler):
+    with handler.reader() as reader:
+        assert list(reader) == handler.get_data()
+
+
+def test_tombstones_are_applied(handler):
+    handler.delete_data({"salary_min__lte": 3})
+    handler.add_data([Vacancy("Again", "Company", 1, "https://hh.ru/1")])
+
+    with handler.reader() as reader:
+        assert list(reader) == handler.get_data()
+        assert len(reader) == 8
+        assert reader[-1]["title"] == "Again"
+
+
+def test_empty_and_unterminated_file(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+    with LazyVacancyReader(path) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+
+    path.write_text(json.dumps({"link": "a"}) + "\n\n" + json.dumps({"link": "b"}))
+    with LazyVacancyReader(path) as reader:
+        assert [item["link"] for item in reader] == ["a", "b"]
+
+    # Недописанные при сбое строки пропускаются, как в JSONLinesFileHandler
+    path.write_text(
+        json.dumps({"link": "a"})
+        + '\n{"link": "обрыв'
+        + "\n"
+        + json.dumps({"link": "b"})
+        + '\n{"link": "c", "title": "}'
+    )
+    with LazyVacancyReader(path) as reader:
+        assert len(reader) == 2
+        assert [item["link"] for item in reader] == ["a", "b"]
+        assert list(reader) == JSONLinesFileHandler(str(path)).get_data()
@@ -0,0 +1,116 @@
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import main
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def item(number, salary=None):
+    return {
+        "name": f"Vacancy {number}",
+        "employer": {"name": "Co"},
+        "salary": {"from": salary, "to": None} if salary else None,
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+    }
+
+
+@pytest.fixture
+def api():
+    pages = {
+        "python": [[item(1, 100), item(2, 300)], [item(3, 200)]],
+        "django": [[item(2, 300), item(4)]],
+    }
+    api = Mock()
+    api.iter_pages.side_effect = lambda keyword, **kwargs: iter(pages[keyword])
+    return api
+
+
+def run(api, *argv):
+    stream = io.StringIO()
+    args = main.build_parser().parse_args(list(argv))
+    main.run_batch(args, api=api, stream=stream)
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_batch_streams_pages_without_duplicates(api):
+    records = run(api, "python", "django")
+    assert [r["title"] for r in records] == [
+        "Vacancy 1",
+        "Vacancy 2",
+        "Vacancy 3",
+        "Vacancy 4",
+    ]
+
+
+def test_output_is_flushed_per_page(api):
+    stream = Mock()
+    args = main.build_parser().parse_args(["python"])
+    main.run_batch(args, api=api, stream=stream)
+    assert stream.flush.call_count == 2
+
+
+def test_batch_top_and_sort(api):
+    assert [r["salary_min"] for r in run(api, "python", "--top", "2")] == [300, 200]
+    records = run(api, "python", "django", "--sort", "salary")
+    assert [r["title"] for r in records][:3] == ["Vacancy 2", "Vacancy 3", "Vacancy 1"]
+
+
+def test_batch_writes_files(api, tmp_path):
+    jsonl_path = tmp_path / "out.jsonl"
+    run(api, "python", "-o", str(jsonl_path))
+    assert len(jsonl_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    json_path = tmp_path / "out.json"
+    run(api, "django", "-o", str(json_path))
+    assert len(json.loads(json_path.read_text(encoding="utf-8"))) == 2
+
+
+def test_main_without_keywords_is_interactive(mocker):
+    interaction = mocker.patch("main.user_interaction")
+    assert main.main([]) == 0
+    interaction.assert_called_once()
+
+
+def test_main_reports_connection_errors(mocker, capsys):
+    mocker.patch("main.run_batch", side_effect=ConnectionError("нет сети"))
+    assert main.main(["python"]) == 1
+    assert "нет сети" in capsys.readouterr().err
+
+
+def test_import_is_lazy():
+    code = "import sys, main; print('requests' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_parse_errors_go_to_stderr(api, capsys):
+    api.iter_pages.side_effect = lambda keyword, **kwargs: iter(
+        [[item(1), {"name": "", "employer": {"name": "Co"}}]]
+    )
+    assert len(run(api, "python")) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Ошибка обработки вакансии" in captured.err
+
+
+def test_relative_output_is_written_to_working_directory(api, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run(api, "python", "-o", "out.jsonl")
+    run(api, "django", "-o", "out.json")
+
+    assert len((tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+    assert len(json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))) == 2
+    assert not (PROJECT_ROOT / "data" / "out.jsonl").exists()
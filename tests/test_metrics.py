@@ -0,0 +1,135 @@
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+from urllib3 import HTTPResponse
+
+from src import metrics as metrics_module
+from src.external_api import HHAPI
+from src.metrics import JSONSink, Metrics, PrometheusSink, StdoutSink, metrics, profile
+from src.vacancies import Vacancy
+from src.work_with_files import JSONFileHandler
+
+
+@pytest.fixture
+def enabled_metrics():
+    metrics.reset()
+    metrics_module.enable()
+    yield metrics
+    metrics_module.disable()
+    metrics.reset()
+
+
+def test_disabled_metrics_record_nothing():
+    registry = Metrics()
+    registry.increment("requests")
+    with registry.timer("stage"):
+        pass
+    assert registry.snapshot() == {"counters": {}, "timers": {}}
+
+
+def test_counters_and_timers():
+    registry = Metrics(enabled=True)
+    registry.increment("requests")
+    registry.increment("bytes", 100)
+    registry.increment("bytes", 50)
+    for _ in range(2):
+        with registry.timer("stage"):
+            pass
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {"requests": 1, "bytes": 150}
+    assert snapshot["timers"]["stage"]["count"] == 2
+    assert snapshot["timers"]["stage"]["total"] >= snapshot["timers"]["stage"]["max"]
+
+    registry.reset()
+    assert registry.snapshot()["counters"] == {}
+
+
+def test_sinks(tmp_path):
+    registry = Metrics(enabled=True)
+    registry.increment("api.requests", 3)
+    registry.observe("api.request", 0.5)
+
+    stream = io.StringIO()
+    registry.export(StdoutSink(stream))
+    assert "api.requests: 3" in stream.getvalue()
+
+    json_path = tmp_path / "metrics.json"
+    registry.export(JSONSink(str(json_path)))
+    assert json.loads(json_path.read_text())["counters"] == {"api.requests": 3}
+
+    prom_path = tmp_path / "metrics.prom"
+    registry.export(PrometheusSink(str(prom_path)))
+    text = prom_path.read_text()
+    assert "vacancies_api_requests_total 3" in text
+    assert "vacancies_api_request_seconds_count 1" in text
+    assert "vacancies_api_request_seconds_sum 0.5" in text
+
+
+def test_profile_captures_cpu_and_memory():
+    with profile(cpu=True, memory=True) as result:
+        data = [str(i) for i in range(10000)]
+    assert data
+    assert "function calls" in result.stats()
+    assert result.memory_peak > 0
+    assert result.memory_top
+
+
+def test_instrumented_pipeline(enabled_metrics, tmp_path, mocker):
+    api = HHAPI(page_retries=0)
+    response = Mock(status_code=200, content=b"x" * 10)
+    response.json.side_effect = [
+        {"items": [{"id": "1"}, {"id": "2"}]},
+        {"items": []},
+    ]
+    mocker.patch.object(api._HHAPI__session, "get", return_value=response)
+    api.load_vacancies("python")
+
+    Vacancy.cast_to_object(
+        [
+            {
+                "name": "Dev",
+                "employer": {"name": "Co"},
+                "salary": None,
+                "alternate_url": "https://example.com/1",
+            },
+            {"name": "", "employer": {"name": "Co"}, "alternate_url": ""},
+        ]
+    )
+
+    handler = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    vacancy = Vacancy("Dev", "Co", 100000, "https://example.com/1")
+    handler.add_data([vacancy])
+    handler.add_data([vacancy])
+
+    snapshot = enabled_metrics.snapshot()
+    counters = snapshot["counters"]
+    assert counters["api.requests"] == 2
+    assert counters["api.bytes"] == 20
+    assert counters["api.items"] == 2
+    assert counters["vacancies.parsed"] == 1
+    assert counters["vacancies.rejected"] == 1
+    assert counters["storage.dedup_hits"] == 1
+    assert counters["storage.write_bytes"] > 0
+    assert snapshot["timers"]["storage.add_data"]["count"] == 2
+
+
+def test_transport_retries_are_counted(enabled_metrics, mocker):
+    def response(status, body=b""):
+        return HTTPResponse(io.BytesIO(body), status=status, preload_content=False)
+
+    # Четыре ответа 503 повторяет urllib3, пятый запрос успешен
+    responses = [response(503) for _ in range(4)] + [response(200, b'{"items": []}')]
+    mocker.patch(
+        "urllib3.connectionpool.HTTPConnectionPool._make_request",
+        side_effect=responses,
+    )
+    mocker.patch("urllib3.util.retry.time.sleep")
+
+    HHAPI(page_retries=0).load_vacancies("python")
+
+    counters = enabled_metrics.snapshot()["counters"]
+    assert counters["api.requests"] == 5
+    assert counters["api.retries"] == 4
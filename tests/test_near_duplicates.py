@@ -0,0 +1,151 @@
+import pytest
+
+from src.near_duplicates import (
+    NearDuplicateIndex,
+    minhash,
+    shingles,
+    similarity,
+)
+from src.vacancies import Vacancy
+from src.work_with_files import JSONFileHandler
+
+
+def record(title, company, salary_min, salary_max, link):
+    return {
+        "title": title,
+        "company": company,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "link": link,
+    }
+
+
+@pytest.fixture
+def records():
+    return [
+        record(
+            "Python-разработчик", "Яндекс", 150000, 200000, "https://hh.ru/vacancy/1"
+        ),
+        record("Java-разработчик", "Сбер", 150000, 200000, "https://hh.ru/vacancy/2"),
+        record("Официант", "Кафе", None, 50000, "https://hh.ru/vacancy/3"),
+    ]
+
+
+def test_similarity_of_reposts(records):
+    repost = record("Python разработчик", "ООО Яндекс", 155000, 200000, "x")
+    original = minhash(shingles(records[0]))
+
+    assert similarity(original, minhash(shingles(repost))) >= 0.7
+    assert similarity(original, minhash(shingles(records[1]))) < 0.7
+    assert similarity(original, original) == 1.0
+
+
+def test_find_duplicate(records):
+    index = NearDuplicateIndex()
+    index.add_many(records)
+
+    repost = record("Python разработчик", "Яндекс", 150000, 200000, "https://x/9")
+    assert index.find_duplicate(repost) == records[0]["link"]
+    assert index.find_duplicate(records[0]) is None  # та же ссылка
+    assert index.find_duplicate(record("Повар", "Ресторан", 1, 2, "y")) is None
+
+    index.remove(records[0]["link"])
+    assert index.find_duplicate(repost) is None
+    assert len(index) == 2
+
+
+def test_pairs(records):
+    index = NearDuplicateIndex()
+    index.add_many(records)
+    index.add(record("Официант", "Кафе", None, 50000, "https://hh.ru/vacancy/4"))
+
+    pairs = index.pairs()
+    assert [(left, right) for left, right, _ in pairs] == [
+        ("https://hh.ru/vacancy/3", "https://hh.ru/vacancy/4")
+    ]
+
+
+def test_sidecar_round_trip(records, tmp_path):
+    path = NearDuplicateIndex.sidecar_path(tmp_path / "vacancies.json")
+    index = NearDuplicateIndex()
+    index.add_many(records[:2])
+    index.save(path)
+    index.add(records[2])
+    index.append(path, [NearDuplicateIndex.make_entry(records[2])])
+    index.remove(records[0]["link"])
+    index.append_removed(path, [records[0]["link"]])
+
+    loaded = NearDuplicateIndex.load(path)
+    assert len(loaded) == 2
+    assert loaded.find_duplicate(dict(records[2], link="other")) == records[2]["link"]
+
+    path.write_text('{"num_perm": 1, "bands": 1}\n')
+    assert NearDuplicateIndex.load(path) is None
+
+
+def test_handler_fuzzy_dedupe(tmp_path):
+    handler = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    handler.add_data([Vacancy("Python-разработчик", "Яндекс", 150000, "https://a/1")])
+
+    reposts = [
+        Vacancy("Python разработчик", "Яндекс", 150000, "https://a/2"),
+        Vacancy("Повар", "Ресторан", 80000, "https://a/3"),
+        Vacancy("Повар", "Ресторан", 80000, "https://a/4"),
+    ]
+    handler.add_data(reposts, dedupe="fuzzy")
+    assert [item["link"] for item in handler.get_data()] == [
+        "https://a/1",
+        "https://a/3",
+    ]
+
+    # Обычный режим сравнивает только ссылки, но сигнатуры поддерживает
+    handler.add_data([Vacancy("Python разработчик", "Яндекс", 150000, "https://a/5")])
+    assert len(handler.get_data()) == 3
+    pairs = JSONFileHandler(str(tmp_path / "vacancies.json")).near_duplicates()
+    assert [(left, right) for left, right, _ in pairs] == [
+        ("https://a/1", "https://a/5")
+    ]
+
+    handler.delete_data({"link": "https://a/1"})
+    handler = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    assert handler.near_duplicates() == []
+
+
+def test_handler_rejects_unknown_dedupe_mode(tmp_path):
+    handler = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    with pytest.raises(ValueError):
+        handler.add_data([], dedupe="exact")
+
+
+def test_handlers_share_signatures(tmp_path):
+    filename = str(tmp_path / "vacancies.json")
+    first, second = JSONFileHandler(filename), JSONFileHandler(filename)
+    first.add_data([Vacancy("Повар", "Ресторан", 80000, "https://a/1")], "fuzzy")
+    second.add_data([Vacancy("Бармен", "Бар", 60000, "https://a/2")], "fuzzy")
+
+    # Второй обработчик уже загрузил сигнатуры, но видит дописанные первым
+    first.add_data([Vacancy("Python-разработчик", "Яндекс", 1, "https://a/3")])
+    second.add_data(
+        [Vacancy("Python разработчик", "Яндекс", 1, "https://a/4")], "fuzzy"
+    )
+    assert [item["link"] for item in second.get_data()] == [
+        "https://a/1",
+        "https://a/2",
+        "https://a/3",
+    ]
+    assert JSONFileHandler(filename).near_duplicates() == []
+
+
+def test_handler_compacts_signatures(tmp_path):
+    filename = str(tmp_path / "vacancies.json")
+    handler = JSONFileHandler(filename)
+    handler.near_duplicates()
+    for number in range(3):
+        handler.add_data([Vacancy("Повар", "Ресторан", 1, f"https://a/{number}")])
+        handler.delete_data({"link": f"https://a/{number}"})
+    handler.add_data([Vacancy("Бармен", "Бар", 1, "https://a/9")])
+
+    path = NearDuplicateIndex.sidecar_path(tmp_path / "vacancies.json")
+    assert len(path.read_text().splitlines()) == 1 + 3 + 3 + 1
+    assert JSONFileHandler(filename).near_duplicates() == []
+    assert len(path.read_text().splitlines()) == 1 + 1
@@ -0,0 +1,83 @@
+import pytest
+
+from src.queries import compile_query
+
+
+@pytest.fixture
+def records():
+    return [
+        {"title": "Senior Python Developer", "company": "A", "salary_min": 200000},
+        {"title": "Junior Python developer", "company": "B", "salary_min": 80000},
+        {"title": "Java Developer", "company": "C", "salary_min": None},
+        {"title": "Python-аналитик", "company": "A", "salary_min": 120000},
+    ]
+
+
+def select(criteria, records):
+    return [record["title"] for record in compile_query(criteria).filter(records)]
+
+
+def test_equality_compares_strings(records):
+    # Строковое сравнение сохраняет прежнее поведение delete_data
+    assert select({"salary_min": "80000"}, records) == ["Junior Python developer"]
+    assert select({"salary_min": None}, records) == ["Java Developer"]
+
+
+def test_range(records):
+    assert select({"salary_min__gte": 120000}, records) == [
+        "Senior Python Developer",
+        "Python-аналитик",
+    ]
+    assert select({"salary_min__lt": 100000}, records) == ["Junior Python developer"]
+
+
+def test_contains_and_keywords(records):
+    assert len(select({"title__contains": "PYTHON"}, records)) == 3
+    assert select({"title__keywords": "python developer"}, records) == [
+        "Senior Python Developer",
+        "Junior Python developer",
+    ]
+    assert select({"title__keywords": ["python", "аналитик"]}, records) == [
+        "Python-аналитик"
+    ]
+
+
+def test_in_and_isnull(records):
+    assert len(select({"company__in": ["A", "C"]}, records)) == 3
+    assert select({"salary_min__isnull": True}, records) == ["Java Developer"]
+    assert len(select({"salary_min__isnull": False}, records)) == 3
+
+
+def test_combinations(records):
+    criteria = {
+        "title__contains": "python",
+        "or": [{"company": "B"}, {"salary_min__gt": 150000}],
+    }
+    assert select(criteria, records) == [
+        "Senior Python Developer",
+        "Junior Python developer",
+    ]
+
+    query = compile_query({"company": "A"}) & ~compile_query(
+        {"title__contains": "senior"}
+    )
+    assert select(query, records) == ["Python-аналитик"]
+    assert compile_query(query) is query
+
+
+def test_sql_translation():
+    query = compile_query({"salary_min__gte": 100, "company__in": ["A"]})
+    assert query.sql == ("(salary_min >= ?) AND (company IN (?))", (100, "A"))
+    assert query.fields == {"salary_min", "company"}
+    assert compile_query({"title__contains": "x"}).sql is None
+
+
+def test_empty_criteria_matches_everything(records):
+    assert len(select({}, records)) == 4
+
+
+def test_invalid_criteria():
+    with pytest.raises(ValueError):
+        compile_query({"title__regex": "x"})
+    with pytest.raises(ValueError):
+        compile_query({"or": []})
@@ -0,0 +1,36 @@
+import pytest
+
+from src.rate_limit import TokenBucket
+
+
+def test_token_bucket_limits_rate(mocker):
+    clock = mocker.patch("src.rate_limit.time")
+    clock.monotonic.return_value = 0.0
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()  # Корзина пуста
+
+    clock.monotonic.return_value = 0.5  # За полсекунды пополнился один токен
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_token_bucket_acquire_waits(mocker):
+    clock = mocker.patch("src.rate_limit.time")
+    clock.monotonic.return_value = 0.0
+    clock.sleep.side_effect = lambda seconds: setattr(
+        clock.monotonic, "return_value", clock.monotonic.return_value + seconds
+    )
+    bucket = TokenBucket(rate=4, capacity=1)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.sleep.assert_called_once_with(0.25)
+
+
+def test_token_bucket_invalid():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
@@ -0,0 +1,53 @@
+import pytest
+
+from src.selection import SalaryIndex, salary_key, sort_by_salary, top_n
+from src.vacancies import Vacancy
+from src.vacancy_batch import VacancyBatch
+
+
+@pytest.fixture
+def vacancies():
+    return [
+        Vacancy("A", "Co", 100000),
+        Vacancy("B", "Co", 150000),
+        Vacancy("C", "Co", "90000-110000"),
+        Vacancy("D", "Co", None),
+        Vacancy("E", "Co", {"from": None, "to": 120000}),
+    ]
+
+
+def test_salary_key_matches_comparison(vacancies):
+    assert [salary_key(v) for v in vacancies] == [100000, 150000, 90000, 0, 120000]
+
+
+def test_top_n(vacancies):
+    assert [v.title for v in top_n(vacancies, 3)] == ["B", "E", "A"]
+    assert top_n(vacancies, 0) == []
+
+
+def test_sort_by_salary_in_place(vacancies):
+    result = sort_by_salary(vacancies)
+    assert result is vacancies
+    assert [v.title for v in vacancies] == ["B", "E", "A", "C", "D"]
+
+    sort_by_salary(vacancies, reverse=False)
+    assert vacancies[0].title == "D"
+
+
+def test_salary_index(vacancies):
+    index = SalaryIndex(vacancies)
+
+    assert len(index) == 5
+    assert [v.title for v in index.in_range(95000, 120000)] == ["A", "E"]
+    assert [v.title for v in index.in_range(salary_from=120000)] == ["E", "B"]
+    assert [v.title for v in index.in_range(salary_to=0)] == ["D"]
+    assert [v.title for v in index.top(2)] == ["B", "E"]
+    assert index.top(0) == []
+
+
+def test_batch_top_n(vacancies):
+    batch = VacancyBatch.from_vacancies(vacancies)
+
+    assert [v.title for v in batch.top_n(2)] == ["B", "E"]
+    index = SalaryIndex(batch, keys=batch.salary_keys())
+    assert [v.title for v in index.in_range(100000, 100000)] == ["A"]
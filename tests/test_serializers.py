@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from src.serializers import ColumnarSerializer, JSONSerializer
+
+
+@pytest.fixture
+def records():
+    return [
+        {
+            "title": f"Вакансия {number}",
+            "company": f"Компания {number % 3}",
+            "salary_min": number * 1000 or None,
+            "salary_max": None,
+            "link": f"https://hh.ru/vacancy/{number}",
+        }
+        for number in range(50)
+    ]
+
+
+def test_json_default_matches_previous_format(records):
+    data = JSONSerializer().dumps(records)
+    assert data.decode("utf-8") == json.dumps(records, ensure_ascii=False, indent=4)
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [
+        JSONSerializer(),
+        JSONSerializer(indent=None, compression="gzip"),
+        ColumnarSerializer(),
+        ColumnarSerializer(compression=None),
+    ],
+)
+def test_roundtrip(serializer, records):
+    assert serializer.loads(serializer.dumps(records)) == records
+    assert serializer.loads(serializer.dumps([])) == []
+
+
+def test_compact_formats_are_smaller(records):
+    pretty = len(JSONSerializer().dumps(records))
+    assert len(JSONSerializer(indent=None).dumps(records)) < pretty
+    assert len(ColumnarSerializer().dumps(records)) < pretty / 5
+
+
+def test_columnar_dictionary_encodes_company(records):
+    data = ColumnarSerializer(compression=None).dumps(records)
+    assert data.count("Компания 1".encode("utf-8")) == 1
+
+
+def test_load_fields_reads_only_requested_columns(records, mocker):
+    serializer = ColumnarSerializer()
+    data = serializer.dumps(records)
+    decompress = mocker.spy(__import__("gzip"), "decompress")
+
+    result = serializer.load_fields(data, ["link", "missing"])
+
+    assert result[3] == {"link": "https://hh.ru/vacancy/3", "missing": None}
+    assert decompress.call_count == 1
+
+
+def test_invalid_data_raises_value_error():
+    with pytest.raises(ValueError):
+        ColumnarSerializer().loads(b"not columnar")
+    with pytest.raises(ValueError):
+        JSONSerializer(compression="gzip").loads(b"not gzip")
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        JSONSerializer(compression="lzma")
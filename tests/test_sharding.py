@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.sharding import ShardedCrawl
+from src.sync import parse_date
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=8)
+
+
+@pytest.fixture
+def api():
+    """Имитация API: 50 вакансий в день, выдача ограничена 100 результатами"""
+    published = [START + timedelta(minutes=30 * i) for i in range(8 * 48)]
+
+    def matching(kwargs):
+        if "date_from" not in kwargs:
+            return published
+        date_from = parse_date(kwargs["date_from"])
+        date_to = parse_date(kwargs["date_to"])
+        return [p for p in published if date_from <= p <= date_to]
+
+    api = Mock()
+    api.MAX_RESULTS = 100
+    api.count_found.side_effect = lambda keyword, **kwargs: len(matching(kwargs))
+    api.load_vacancies.side_effect = lambda keyword, **kwargs: [
+        {"id": str(int((p - START).total_seconds()))}
+        for p in matching(kwargs)[: api.MAX_RESULTS]
+    ]
+    return api
+
+
+def test_plan_splits_until_shards_fit(api):
+    shards = ShardedCrawl(api).plan("менеджер", START, END)
+
+    assert len(shards) > 1
+    assert shards[0][0] == START and shards[-1][1] == END
+    for (_, end), (start, _) in zip(shards, shards[1:]):
+        assert end == start
+    for shard in shards:
+        kwargs = ShardedCrawl.window_params(shard)
+        assert api.count_found("менеджер", **kwargs) <= api.MAX_RESULTS
+
+
+def test_crawl_covers_everything_without_duplicates(api):
+    vacancies = ShardedCrawl(api, max_workers=3).crawl("менеджер", START, END)
+
+    ids = [item["id"] for item in vacancies]
+    assert len(ids) == len(set(ids)) == 8 * 48
+
+
+def test_crawl_without_sharding_when_under_cap(api):
+    api.MAX_RESULTS = 1000
+    vacancies = ShardedCrawl(api).crawl("менеджер", area=1)
+
+    assert len(vacancies) == 8 * 48
+    api.load_vacancies.assert_called_once_with("менеджер", area=1)
+
+
+def test_min_window_stops_splitting(api, capsys):
+    api.MAX_RESULTS = 1
+    shards = ShardedCrawl(api, min_window=timedelta(days=1)).plan("x", START, END)
+
+    assert all(end - start <= timedelta(days=1) for start, end in shards)
+    assert "загружены первые 1" in capsys.readouterr().out
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError):
+        ShardedCrawl(Mock(), max_workers=0)
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.snapshots import SnapshotStore
+from src.vacancies import Vacancy
+from src.work_with_files import JSONFileHandler
+
+DAY = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def record(link, salary=100):
+    return {"title": "Dev", "company": "Co", "salary_min": salary, "link": link}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SnapshotStore(str(tmp_path / "history"), checkpoint_every=3)
+    states = [
+        [record("a"), record("b")],
+        [record("a", 200), record("b"), record("c")],
+        [record("a", 200), record("c")],
+        [record("a", 200), record("c"), record("d")],
+        [record("c"), record("d"), record("e")],
+    ]
+    for day, state in enumerate(states):
+        store.commit(state, DAY + timedelta(days=day))
+    return store
+
+
+def links(records):
+    return sorted(r["link"] for r in records)
+
+
+def test_versions_and_checkpoints(store, tmp_path):
+    versions = store.versions()
+    assert [v["version"] for v in versions] == [1, 2, 3, 4, 5]
+    assert [v["checkpoint"] for v in versions] == [True, False, False, True, False]
+    assert (versions[1]["added"], versions[1]["changed"]) == (1, 1)
+    assert len(list((tmp_path / "history").glob("*.checkpoint"))) == 2
+
+
+def test_state_at(store):
+    assert store.state_at(0) == []
+    assert links(store.state_at(3)) == ["a", "c"]
+    assert links(store.state_at(5)) == ["c", "d", "e"]
+    assert links(store.state_at(DAY + timedelta(days=1, hours=12))) == ["a", "b", "c"]
+    assert store.state_at(DAY - timedelta(days=1)) == []
+    with pytest.raises(ValueError):
+        store.state_at(6)
+
+
+def test_unchanged_state_is_not_committed(store):
+    assert store.commit(store.state_at(5), DAY + timedelta(days=10)) is None
+    assert len(store.versions()) == 5
+
+
+def test_commit_rejects_past_timestamp(store):
+    with pytest.raises(ValueError):
+        store.commit([], DAY)
+
+
+def test_diff(store):
+    diff = store.diff(1, 5)
+    assert links(diff["added"]) == ["c", "d", "e"]
+    assert links(diff["removed"]) == ["a", "b"]
+    assert diff["changed"] == []
+
+    diff = store.diff(DAY, DAY + timedelta(days=2))
+    assert links(diff["added"]) == ["c"]
+    assert links(diff["removed"]) == ["b"]
+    assert diff["changed"] == [
+        {"link": "a", "old": record("a"), "new": record("a", 200)}
+    ]
+
+    with pytest.raises(ValueError):
+        store.diff(5, 1)
+
+
+def test_history(store):
+    events = store.history("a")
+    assert [(e["version"], e["event"]) for e in events] == [
+        (1, "added"),
+        (2, "changed"),
+        (5, "removed"),
+    ]
+
+
+def test_snapshot_of_handler(tmp_path):
+    handler = JSONFileHandler(str(tmp_path / "vacancies.json"))
+    store = SnapshotStore(str(tmp_path / "history"))
+    handler.add_data([Vacancy("Dev", "Co", 100, "https://example.com/1")])
+    assert store.snapshot(handler) == 1
+    handler.delete_data({"link": "https://example.com/1"})
+    assert store.snapshot(handler) == 2
+
+    assert store.state_at(1)[0]["link"] == "https://example.com/1"
+    assert store.state_at(2) == []
+
+
+def test_naive_datetimes_are_rejected(store):
+    naive = datetime(2030, 1, 1)
+    with pytest.raises(ValueError):
+        store.state_at(naive)
+    with pytest.raises(ValueError):
+        store.diff(naive, naive)
+    with pytest.raises(ValueError):
+        store.commit([], naive)
+
+    # Неудачный вызов не ломает последующие снимки со временем по умолчанию
+    assert store.commit([record("z")]) == 6
+    assert links(store.state_at(datetime(2100, 1, 1, tzinfo=timezone.utc))) == ["z"]
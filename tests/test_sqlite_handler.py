@@ -0,0 +1,150 @@
+import pytest
+
+from src.queries import compile_query
+from src.sqlite_handler import SQLiteFileHandler
+from src.vacancies import Vacancy
+
+
+@pytest.fixture
+def handler(tmp_path):
+    with SQLiteFileHandler(str(tmp_path / "test_vacancies.db")) as handler:
+        yield handler
+
+
+@pytest.fixture
+def sample_vacancies():
+    return [
+        Vacancy("Python Developer", "Company A", 100000, "https://example.com/1"),
+        Vacancy("Java Developer", "Company B", "80000-120000", "https://example.com/2"),
+        Vacancy(
+            "Data Scientist",
+            "Company C",
+            {"from": 150000, "to": 200000},
+            "https://example.com/3",
+        ),
+        Vacancy("Intern", "Company A", None, "https://example.com/4"),
+    ]
+
+
+def test_add_and_get_data(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+    handler.add_data(sample_vacancies)  # Дубликаты пропускаются
+
+    data = handler.get_data()
+    assert len(data) == 4
+    assert data[0] == {
+        "title": "Python Developer",
+        "company": "Company A",
+        "salary_min": 100000,
+        "salary_max": 100000,
+        "link": "https://example.com/1",
+    }
+    assert handler.count() == 4
+    assert handler.contains("https://example.com/3")
+
+
+def test_delete_data(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+
+    handler.delete_data({"company": "Company A", "salary_min": 100000})
+    assert [item["link"] for item in handler.get_data()] == [
+        "https://example.com/2",
+        "https://example.com/3",
+        "https://example.com/4",
+    ]
+
+    handler.delete_data({"salary_min": None})
+    assert handler.count() == 2
+
+
+def test_filters(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+
+    data = handler.get_data({"salary_min__gte": 90000, "company__in": ["Company A"]})
+    assert [item["link"] for item in data] == ["https://example.com/1"]
+
+    # Поиск по подстроке выполняется в Python
+    data = handler.get_data({"title__contains": "developer"})
+    assert len(data) == 2
+
+    handler.delete_data({"or": [{"title__keywords": "intern"}, {"salary_max": 120000}]})
+    assert [item["link"] for item in handler.get_data()] == [
+        "https://example.com/1",
+        "https://example.com/3",
+    ]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ~compile_query({"salary_min__gt": 100000}),
+        ~compile_query({"salary_min__in": [100000, 150000]}),
+        ~compile_query({"salary_min__in": [None, 100000]}),
+        compile_query({"salary_min__in": [None, 100000]}),
+        ~(compile_query({"salary_min__lt": 120000}) | compile_query({"title": "x"})),
+        # Значения другого типа, чем колонка, сравниваются в строковом виде
+        compile_query({"salary_min": 100000.0}),
+        compile_query({"salary_min": "1e5"}),
+        compile_query({"salary_min": "100000"}),
+        compile_query({"salary_min": "None"}),
+        compile_query({"salary_min__ne": "None"}),
+        compile_query({"company": True}),
+        compile_query({"title": 5}),
+        compile_query({"salary_min__in": ["100000"]}),
+    ],
+)
+def test_sql_matches_python_on_null_fields(handler, sample_vacancies, query):
+    sample_vacancies.append(Vacancy("5", "True", None, "https://example.com/5"))
+    handler.add_data(sample_vacancies)
+    expected = [item["link"] for item in query.filter(handler.get_data())]
+
+    assert [item["link"] for item in handler.get_data(query)] == expected
+
+    handler.delete_data(query)
+    assert all(item["link"] not in expected for item in handler.get_data())
+    assert handler.count() == 5 - len(expected)
+
+
+def test_filter_by_unknown_field_matches_nothing(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+    handler.delete_data({"unknown": 1})
+    assert handler.count() == 4
+
+
+def test_salary_range(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+
+    links = [item["link"] for item in handler.get_by_salary_range(110000, 160000)]
+    assert links == ["https://example.com/2", "https://example.com/3"]
+
+    links = [item["link"] for item in handler.get_by_salary_range(salary_to=90000)]
+    assert links == ["https://example.com/2"]
+
+
+def test_top_by_salary(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+
+    top = handler.get_top_by_salary(2)
+    assert [item["title"] for item in top] == ["Data Scientist", "Python Developer"]
+
+
+def test_by_company(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+
+    assert len(handler.get_by_company("Company A")) == 2
+    assert len(handler.get_by_company("Company B", "Company C")) == 2
+    assert handler.get_by_company() == []
+
+
+def test_upsert(handler, sample_vacancies):
+    handler.add_data(sample_vacancies)
+    updated = Vacancy("Python Developer", "Company A", 120000, "https://example.com/1")
+    updated.key_skills = ["Python"]
+    handler.upsert_data(
+        [updated, Vacancy("Go Developer", "Company E", None, "https://example.com/5")]
+    )
+
+    data = handler.get_data()
+    assert [item["link"][-1] for item in data] == ["1", "2", "3", "4", "5"]
+    assert data[0]["salary_min"] == 120000
+    assert data[0]["key_skills"] == ["Python"]
@@ -0,0 +1,120 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.sync import IncrementalSync, SyncState
+from src.vacancies import Vacancy
+from src.work_with_files import JSONFileHandler
+
+
+def make_item(number, published_at):
+    return {
+        "name": f"Vacancy {number}",
+        "employer": {"name": "Company"},
+        "salary": None,
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "published_at": published_at,
+    }
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return JSONFileHandler(str(tmp_path / "vacancies.json"))
+
+
+@pytest.fixture
+def state(tmp_path):
+    return SyncState(str(tmp_path / "sync_state.json"))
+
+
+def test_first_sync_stores_watermark(handler, state):
+    api = Mock()
+    api.iter_pages.return_value = iter(
+        [
+            [
+                make_item(2, "2024-05-02T10:00:00+0300"),
+                make_item(1, "2024-05-01T10:00:00+0300"),
+            ]
+        ]
+    )
+
+    added = IncrementalSync(api, handler, state).sync("python")
+
+    assert len(added) == 2
+    assert len(handler.get_data()) == 2
+    assert state.get("python")["newest_published_at"] == "2024-05-02T10:00:00+0300"
+    params = api.iter_pages.call_args.kwargs["params"]
+    assert params == {"order_by": "publication_time"}
+
+
+def test_next_sync_stops_at_known_vacancy(handler, state):
+    handler.add_data(Vacancy.cast_to_object([make_item(2, "2024-05-02T10:00:00+0300")]))
+    state.update("python", "2024-05-02T12:00:00+0300", "2024-05-02T10:00:00+0300")
+    consumed = []
+
+    def pages():
+        for page in (
+            [
+                make_item(4, "2024-05-03T09:00:00+0300"),
+                make_item(3, "2024-05-02T11:00:00+0300"),
+            ],
+            [
+                make_item(2, "2024-05-02T10:00:00+0300"),
+                make_item(1, "2024-05-01T10:00:00+0300"),
+            ],
+            [make_item(0, "2024-04-30T10:00:00+0300")],
+        ):
+            consumed.append(page)
+            yield page
+
+    api = Mock()
+    api.iter_pages.return_value = pages()
+
+    added = IncrementalSync(api, handler, state).sync("python")
+
+    assert [v.link for v in added] == [
+        "https://hh.ru/vacancy/4",
+        "https://hh.ru/vacancy/3",
+    ]
+    assert len(consumed) == 2  # Третья страница не запрашивалась
+    params = api.iter_pages.call_args.kwargs["params"]
+    assert params["date_from"] == "2024-05-02T10:00:00+0300"
+    assert state.get("python")["newest_published_at"] == "2024-05-03T09:00:00+0300"
+    assert len(handler.get_data()) == 3
+
+
+def test_sync_without_new_vacancies_keeps_watermark(handler, state):
+    state.update("python", "2024-05-02T12:00:00+0300", "2024-05-02T10:00:00+0300")
+    api = Mock()
+    api.iter_pages.return_value = iter([[make_item(1, "2024-05-01T10:00:00+0300")]])
+
+    assert IncrementalSync(api, handler, state).sync("python") == []
+    assert handler.get_data() == []
+    assert state.get("python")["newest_published_at"] == "2024-05-02T10:00:00+0300"
+
+
+def test_vacancy_stored_by_other_keyword_does_not_stop_sync(handler, state):
+    # Вакансию 3 уже сохранил поиск по другому ключевому слову
+    handler.add_data(Vacancy.cast_to_object([make_item(3, "2024-05-02T11:00:00+0300")]))
+    state.update("python", "2024-05-02T12:00:00+0300", "2024-05-02T10:00:00+0300")
+    api = Mock()
+    api.iter_pages.return_value = iter(
+        [
+            [
+                make_item(5, "2024-05-03T10:00:00+0300"),
+                make_item(3, "2024-05-02T11:00:00+0300"),
+                make_item(4, "2024-05-02T10:30:00+0300"),
+                make_item(2, "2024-05-02T10:00:00+0300"),
+            ]
+        ]
+    )
+
+    added = IncrementalSync(api, handler, state).sync("python")
+
+    assert [v.link for v in added] == [
+        "https://hh.ru/vacancy/5",
+        "https://hh.ru/vacancy/4",
+        "https://hh.ru/vacancy/2",
+    ]
+    assert len(handler.get_data()) == 4
+    assert state.get("python")["newest_published_at"] == "2024-05-03T10:00:00+0300"
@@ -0,0 +1,73 @@
+import pytest
+
+from src.text_index import TextIndex, stem, tokenize
+
+
+@pytest.fixture
+def index():
+    index = TextIndex()
+    index.add_many(
+        [
+            {"title": "Python-разработчик", "company": "Яндекс", "link": "l1"},
+            {"title": "Senior Python Developer", "company": "Tinkoff", "link": "l2"},
+            {"title": "Менеджер по продажам", "company": "Ромашка", "link": "l3"},
+            {"title": "Старший менеджер проектов", "company": "Яндекс", "link": "l4"},
+        ]
+    )
+    return index
+
+
+def test_tokenize_stems_russian_and_english():
+    assert tokenize("Менеджеры по Продажам") == ["менеджер", "по", "продаж"]
+    assert tokenize("Python developers") == ["python", "develop"]
+    assert stem("ёж") == "ёж"  # Короткие слова не укорачиваются
+
+
+def test_search_matches_word_forms(index):
+    hits = index.search("менеджера")
+    assert [hit["link"] for hit in hits] == ["l3", "l4"]
+    assert hits[0]["title"] == "Менеджер по продажам"
+
+
+def test_search_ranking_and_limit(index):
+    hits = index.search("python яндекс", limit=1)
+    assert [hit["link"] for hit in hits] == ["l1"]  # Совпали оба слова
+
+    hits = index.search("python яндекс", require_all=True)
+    assert [hit["link"] for hit in hits] == ["l1"]
+    assert index.search("java") == []
+
+
+def test_remove(index):
+    index.remove("l1")
+    index.remove("unknown")
+
+    assert len(index) == 3
+    assert [hit["link"] for hit in index.search("python")] == ["l2"]
+
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / "index.jsonl"
+    index.save(path)
+
+    loaded = TextIndex.load(path)
+    assert loaded.search("менеджер") == index.search("менеджер")
+    assert TextIndex.load(tmp_path / "missing.jsonl") is None
+
+
+def test_append_log(index, tmp_path):
+    path = tmp_path / "index.jsonl"
+    index.save(path)
+    TextIndex.append_removed(path, ["l1"])
+    TextIndex.append(
+        path, [{"link": "l9", "title": "Python разработчик", "company": "Z"}]
+    )
+
+    loaded = TextIndex.load(path)
+    assert len(loaded) == len(index)
+    assert loaded.stale_entries == 2  # удаленная запись и ее надгробие
+    assert {hit["link"] for hit in loaded.search("python")} == {"l2", "l9"}
+
+    # Индекс старого формата не загружается и будет перестроен
+    path.write_text('{"next_id": 0, "documents": {}, "postings": {}}')
+    assert TextIndex.load(path) is None
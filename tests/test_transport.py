@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from src.transport import (
+    DEFAULT_TIMEOUT,
+    TimeoutHTTPAdapter,
+    backoff_delay,
+    build_retry,
+    create_session,
+    retry_after,
+)
+
+
+def test_create_session_mounts_adapter():
+    session = create_session(pool_size=32, timeout=(1, 2))
+    adapter = session.get_adapter("https://api.hh.ru/vacancies")
+
+    assert isinstance(adapter, TimeoutHTTPAdapter)
+    assert adapter.timeout == (1, 2)
+    assert adapter._pool_maxsize == 32
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.respect_retry_after_header
+
+
+def test_adapter_sets_default_timeout(mocker):
+    send = mocker.patch("requests.adapters.HTTPAdapter.send")
+    adapter = TimeoutHTTPAdapter()
+
+    adapter.send(Mock(spec=requests.PreparedRequest))
+    assert send.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+    adapter.send(Mock(spec=requests.PreparedRequest), timeout=1)
+    assert send.call_args.kwargs["timeout"] == 1
+
+
+def test_build_retry():
+    retry = build_retry(total=3)
+    assert retry.total == 3
+    assert "GET" in retry.allowed_methods
+
+
+@pytest.mark.parametrize("attempt, low, high", [(0, 0.5, 1.0), (3, 4.0, 4.5)])
+def test_backoff_delay(attempt, low, high):
+    assert low <= backoff_delay(attempt) <= high
+
+
+def test_backoff_delay_is_capped():
+    assert backoff_delay(20, maximum=30, jitter=0) == 30
+
+
+def test_retry_after():
+    assert retry_after(Mock(headers={"Retry-After": "5"})) == 5.0
+    assert retry_after(Mock(headers={"Retry-After": "soon"})) is None
+    assert retry_after(Mock(headers={})) is None
+    assert retry_after(None) is None
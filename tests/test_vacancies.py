@@ -124,3 +124,120 @@ def test_slots_enforcement():
     v = Vacancy("T", "C", 50000)
     with pytest.raises(AttributeError):
         v.new_attribute = 123
+
+
+def test_iter_cast_to_object_is_lazy(raw_api_data):
+    consumed = []
+
+    def source():
+        for item in raw_api_data:
+            consumed.append(item)
+            yield item
+
+    vacancies = Vacancy.iter_cast_to_object(source())
+    assert consumed == []
+
+    first = next(vacancies)
+    assert first.title == "Backend Developer"
+    assert len(consumed) == 1
+
+
+def test_cast_to_object_parallel(raw_api_data, capsys):
+    data = raw_api_data * 30
+    expected = Vacancy.cast_to_object(data)
+    capsys.readouterr()
+
+    vacancies = Vacancy.cast_to_object_parallel(
+        data, processes=2, chunk_size=7, threshold=10
+    )
+
+    assert [(v.title, v.salary_min, v.link) for v in vacancies] == [
+        (v.title, v.salary_min, v.link) for v in expected
+    ]
+    assert capsys.readouterr().out.count("Ошибка обработки вакансии") == 30
+
+
+def test_cast_to_object_parallel_keeps_all_fields(raw_api_data):
+    detailed = dict(
+        raw_api_data[0],
+        salary={"from": 100, "to": 200, "currency": "USD", "gross": True},
+        description="desc",
+        key_skills=[{"name": "py"}],
+        experience={"id": "between1And3", "name": "1-3"},
+    )
+    data = [detailed] * 20
+    fields = lambda v: tuple(getattr(v, name) for name in Vacancy.__slots__)
+
+    serial = Vacancy.cast_to_object(data)
+    parallel = Vacancy.cast_to_object_parallel(
+        data, processes=2, chunk_size=5, threshold=10
+    )
+
+    assert [fields(v) for v in parallel] == [fields(v) for v in serial]
+    assert (parallel[0].description, parallel[0].key_skills) == ("desc", ["py"])
+
+
+def test_cast_to_object_parallel_below_threshold(raw_api_data, mocker):
+    pool = mocker.patch("src.vacancies.ProcessPoolExecutor")
+
+    vacancies = Vacancy.cast_to_object_parallel(raw_api_data, threshold=100)
+
+    assert len(vacancies) == 1
+    pool.assert_not_called()
+
+
+def test_currency_and_gross():
+    vacancy = Vacancy(
+        "Dev", "Co", {"from": 1000, "to": None, "currency": "USD", "gross": True}
+    )
+    assert vacancy.currency == "USD"
+    assert vacancy.gross is True
+
+    item = Vacancy.from_api_item(
+        {
+            "name": "Dev",
+            "employer": {"name": "Co"},
+            "salary": {"from": 100, "to": 200, "currency": "EUR", "gross": False},
+            "alternate_url": "https://example.com/1",
+        }
+    )
+    assert (item.currency, item.gross) == ("EUR", False)
+    assert Vacancy("Dev", "Co", 100000).currency is None
+
+
+def test_detail_fields():
+    vacancy = Vacancy.from_api_item(
+        {
+            "name": "Dev",
+            "employer": {"name": "Co"},
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "description": "<p>Описание</p>",
+            "key_skills": [{"name": "Python"}],
+            "experience": {"id": "noExperience", "name": "Нет опыта"},
+        }
+    )
+    assert vacancy.description == "<p>Описание</p>"
+    assert vacancy.key_skills == ["Python"]
+    assert vacancy.experience == "Нет опыта"
+
+    plain = Vacancy("Dev", "Co")
+    assert (plain.description, plain.key_skills, plain.experience) == (None, None, None)
+
+
+def test_from_record_round_trip():
+    record = {
+        "title": "Dev",
+        "company": "Co",
+        "salary_min": 100,
+        "salary_max": None,
+        "link": "https://hh.ru/vacancy/1",
+        "currency": "RUR",
+        "key_skills": ["SQL"],
+    }
+    vacancy = Vacancy.from_record(record)
+    assert (vacancy.salary_min, vacancy.currency, vacancy.key_skills) == (
+        100,
+        "RUR",
+        ["SQL"],
+    )
+    assert vacancy.description is None
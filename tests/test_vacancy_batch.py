@@ -0,0 +1,88 @@
+import pytest
+
+from src.vacancies import Vacancy
+from src.vacancy_batch import VacancyBatch
+
+
+@pytest.fixture
+def raw_api_data():
+    return [
+        {
+            "name": "Backend Developer",
+            "employer": {"name": "Tech Corp"},
+            "salary": {"from": 120000, "to": None},
+            "alternate_url": "https://techcorp.com/jobs/1",
+        },
+        {
+            "name": "",  # Invalid title
+            "employer": {"name": "Bad Company"},
+            "salary": None,
+            "alternate_url": "",
+        },
+        {
+            "name": "Frontend Developer",
+            "employer": None,  # Invalid company
+            "alternate_url": "https://techcorp.com/jobs/2",
+        },
+        {
+            "name": "QA",
+            "employer": {"name": "Tech Corp"},
+            "salary": None,
+            "alternate_url": "ftp://techcorp.com/jobs/3",  # Invalid link
+        },
+        {
+            "name": "DevOps",
+            "employer": {"name": "Ops Inc"},
+            "salary": None,
+            "alternate_url": "",
+        },
+    ]
+
+
+def test_from_raw_collects_errors(raw_api_data, capsys):
+    batch = VacancyBatch.from_raw(raw_api_data)
+
+    assert len(batch) == 2
+    assert batch.titles == ["Backend Developer", "DevOps"]
+    assert [index for index, _ in batch.errors] == [1, 2, 3]
+    assert batch.errors[2] == (3, "Некорректная ссылка")
+    assert capsys.readouterr().out == ""  # Ошибки не печатаются
+
+
+def test_salary_mask(raw_api_data):
+    batch = VacancyBatch.from_raw(raw_api_data)
+
+    assert batch.get_salary(0) == (120000, None)
+    assert batch.get_salary(1) == (None, None)
+
+
+def test_matches_cast_to_object(raw_api_data):
+    expected = Vacancy.cast_to_object([raw_api_data[0], raw_api_data[4]])
+    batch = VacancyBatch.from_raw(raw_api_data)
+
+    for vacancy, other in zip(batch, expected):
+        assert isinstance(vacancy, Vacancy)
+        assert (vacancy.title, vacancy.company, vacancy.link) == (
+            other.title,
+            other.company,
+            other.link,
+        )
+        assert (vacancy.salary_min, vacancy.salary_max) == (
+            other.salary_min,
+            other.salary_max,
+        )
+
+
+def test_getitem_bounds(raw_api_data):
+    batch = VacancyBatch.from_raw(raw_api_data)
+    assert batch[-1].title == "DevOps"
+    with pytest.raises(IndexError):
+        batch[2]
+
+
+def test_from_vacancies():
+    batch = VacancyBatch.from_vacancies(
+        [Vacancy("A", "Co", "100-200"), Vacancy("B", "Co", None)]
+    )
+    assert batch.get_salary(0) == (100, 200)
+    assert batch.to_vacancies()[1].salary_min is None
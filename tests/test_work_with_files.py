@@ -1,11 +1,12 @@
 import json
+import multiprocessing
 import os
 
 import pytest
 
+from src.serializers import ColumnarSerializer
 from src.vacancies import Vacancy
-from src.work_with_files import \
-    JSONFileHandler  # Замените your_module на имя файла
+from src.work_with_files import JSONFileHandler, JSONLinesFileHandler
 
 
 @pytest.fixture
@@ -105,7 +106,6 @@ def test_invalid_data_handling(temp_file):
     assert data == []
 
 
-
 def test_delete_nonexistent_data(temp_file, sample_vacancies):
     handler = JSONFileHandler(temp_file)
     handler.add_data(sample_vacancies)
@@ -114,3 +114,322 @@ def test_delete_nonexistent_data(temp_file, sample_vacancies):
     handler.delete_data({"link": "https://nonexistent.com"})
     data = handler.get_data()
     assert len(data) == 3
+
+
+def test_add_stream(temp_file, sample_vacancies, mocker):
+    handler = JSONFileHandler(temp_file)
+    spy = mocker.spy(handler, "add_data")
+
+    total = handler.add_stream(iter(sample_vacancies), batch_size=2)
+
+    assert total == 3
+    assert spy.call_count == 2  # Две пачки: 2 + 1
+    assert len(handler.get_data()) == 3
+
+
+def test_add_stream_invalid_batch_size(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file)
+    with pytest.raises(ValueError):
+        handler.add_stream(sample_vacancies, batch_size=0)
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    return str(tmp_path / "test_vacancies.jsonl")
+
+
+def test_jsonl_add_appends_lines(jsonl_file, sample_vacancies):
+    handler = JSONLinesFileHandler(jsonl_file)
+    handler.add_data(sample_vacancies[:2])
+    handler.add_data(sample_vacancies)  # Дубликаты не дописываются
+
+    with open(jsonl_file, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+    assert [item["link"] for item in handler.get_data()] == [
+        "https://example.com/1",
+        "https://example.com/2",
+        "https://example.com/3",
+    ]
+
+
+def test_jsonl_delete_writes_tombstone(jsonl_file, sample_vacancies):
+    handler = JSONLinesFileHandler(jsonl_file)
+    handler.add_data(sample_vacancies)
+
+    handler.delete_data({"company": "Company A", "salary_min": 100000})
+
+    with open(jsonl_file, encoding="utf-8") as f:
+        lines = f.readlines()
+    assert len(lines) == 4
+    assert json.loads(lines[-1]) == {"_deleted": "https://example.com/1"}
+    assert len(handler.get_data()) == 2
+
+    # Удаленную вакансию можно добавить снова
+    handler.add_data(sample_vacancies[:1])
+    assert len(handler.get_data()) == 3
+
+
+def test_jsonl_compact(jsonl_file, sample_vacancies):
+    handler = JSONLinesFileHandler(jsonl_file)
+    handler.add_data(sample_vacancies)
+    handler.delete_data({"link": "https://example.com/2"})
+
+    handler.compact()
+
+    with open(jsonl_file, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert len(handler.get_data()) == 2
+
+
+def test_jsonl_migrate_from_json(temp_file, jsonl_file, sample_vacancies):
+    JSONFileHandler(temp_file).add_data(sample_vacancies)
+
+    handler = JSONLinesFileHandler.migrate_from_json(temp_file, jsonl_file)
+
+    assert handler.get_data() == JSONFileHandler(temp_file).get_data()
+
+
+def test_contains_uses_link_index(temp_file, sample_vacancies, mocker):
+    handler = JSONFileHandler(temp_file)
+    handler.add_data(sample_vacancies)
+    spy = mocker.spy(handler, "get_data")
+
+    assert handler.contains("https://example.com/2")
+    assert not handler.contains("https://nonexistent.com")
+    assert spy.call_count == 0  # Индекс уже построен при добавлении
+
+    handler.delete_data({"link": "https://example.com/2"})
+    assert not handler.contains("https://example.com/2")
+
+
+def test_contains_sees_external_changes(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file)
+    handler.add_data(sample_vacancies[:1])
+    assert not handler.contains("https://example.com/2")
+
+    JSONFileHandler(temp_file).add_data(sample_vacancies[1:2])
+
+    assert handler.contains("https://example.com/2")
+
+
+def test_duplicates_inside_one_batch(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file)
+    handler.add_data(sample_vacancies + sample_vacancies)
+    assert len(handler.get_data()) == 3
+
+
+def test_jsonl_contains(jsonl_file, sample_vacancies):
+    handler = JSONLinesFileHandler(jsonl_file)
+    handler.add_data(sample_vacancies)
+    handler.delete_data({"link": "https://example.com/1"})
+
+    assert not handler.contains("https://example.com/1")
+    assert handler.contains("https://example.com/3")
+
+
+def test_get_data_with_criteria(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file)
+    handler.add_data(sample_vacancies)
+
+    data = handler.get_data({"salary_min__gte": 90000, "title__contains": "developer"})
+    assert [item["link"] for item in data] == ["https://example.com/1"]
+
+
+def test_delete_data_with_query(jsonl_file, sample_vacancies):
+    handler = JSONLinesFileHandler(jsonl_file)
+    handler.add_data(sample_vacancies)
+
+    handler.delete_data({"company__in": ["Company A", "Company C"]})
+    assert [item["company"] for item in handler.get_data()] == ["Company B"]
+    assert handler.get_data({"title__keywords": "java"})[0]["salary_max"] == 120000
+
+
+def test_text_index_is_kept_in_sync(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file, text_index=True)
+    handler.add_data(sample_vacancies)
+
+    assert [hit["link"] for hit in handler.search("developer")] == [
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+
+    handler.delete_data({"link": "https://example.com/1"})
+    # Индекс сохранен на диск и подхватывается новым обработчиком
+    reopened = JSONFileHandler(temp_file, text_index=True)
+    assert [hit["link"] for hit in reopened.search("developer")] == [
+        "https://example.com/2"
+    ]
+
+
+def test_text_index_built_for_existing_data(temp_file, sample_vacancies):
+    JSONFileHandler(temp_file).add_data(sample_vacancies)
+
+    handler = JSONFileHandler(temp_file, text_index=True)
+    assert handler.search("scientist")[0]["company"] == "Company C"
+
+    with pytest.raises(RuntimeError):
+        JSONFileHandler(temp_file).search("scientist")
+
+
+def test_text_index_is_updated_by_plain_handlers(temp_file, sample_vacancies):
+    indexed = JSONFileHandler(temp_file, text_index=True)
+    indexed.add_data(sample_vacancies[:1])
+
+    plain = JSONFileHandler(temp_file)
+    plain.add_data(sample_vacancies[1:2])
+    plain.delete_data({"link": "https://example.com/1"})
+
+    assert [hit["link"] for hit in indexed.search("developer")] == [
+        "https://example.com/2"
+    ]
+    reopened = JSONFileHandler(temp_file, text_index=True)
+    assert [hit["link"] for hit in reopened.search("developer")] == [
+        "https://example.com/2"
+    ]
+
+
+def test_journal_is_replayed_after_crash(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file)
+    handler.add_data(sample_vacancies[:1])
+
+    # Сбой после записи в журнал, но до обновления файла данных
+    with open(temp_file + ".journal", "w", encoding="utf-8") as f:
+        for vacancy in sample_vacancies[1:]:
+            f.write(json.dumps(JSONFileHandler.vacancy_to_dict(vacancy)) + "\n")
+        f.write('{"title": "обрыв')
+
+    data = JSONFileHandler(temp_file).get_data()
+    assert [item["link"] for item in data] == [
+        "https://example.com/1",
+        "https://example.com/2",
+        "https://example.com/3",
+    ]
+    assert not os.path.exists(temp_file + ".journal")
+
+
+def test_write_does_not_overwrite_corrupted_file(temp_file, sample_vacancies):
+    with open(temp_file, "w") as f:
+        f.write('[{"title": "обрезанный фа')
+    handler = JSONFileHandler(temp_file)
+
+    with pytest.raises(ValueError):
+        handler.add_data(sample_vacancies)
+    with open(temp_file) as f:
+        assert f.read() == '[{"title": "обрезанный фа'
+
+
+def _add_from_process(filename, worker):
+    vacancies = [
+        Vacancy("Title", "Company", None, f"https://example.com/{worker}/{number}")
+        for number in range(10)
+    ]
+    handler = JSONFileHandler(filename)
+    for vacancy in vacancies:
+        handler.add_data([vacancy])
+
+
+def test_parallel_writers_do_not_lose_data(temp_file):
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_add_from_process, args=(temp_file, worker))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert len(JSONFileHandler(temp_file).get_data()) == 40
+
+
+def test_columnar_storage(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file, serializer=ColumnarSerializer())
+    handler.add_data(sample_vacancies)
+    handler.delete_data({"link": "https://example.com/2"})
+
+    assert [item["salary_min"] for item in handler.get_data()] == [100000, 150000]
+    assert handler.get_fields(["company"]) == [
+        {"company": "Company A"},
+        {"company": "Company C"},
+    ]
+    with open(temp_file, "rb") as f:
+        assert f.read().startswith(ColumnarSerializer.MAGIC)
+
+
+@pytest.mark.parametrize("handler_class", [JSONFileHandler, JSONLinesFileHandler])
+def test_upsert_replaces_in_place(tmp_path, sample_vacancies, handler_class):
+    handler = handler_class(str(tmp_path / "vacancies.data"))
+    handler.add_data(sample_vacancies[:3])
+
+    updated = Vacancy("Python Developer", "Company A", 120000, "https://example.com/1")
+    new = Vacancy("Go Developer", "Company E", 90000, "https://example.com/5")
+    handler.upsert_data([updated, new])
+
+    data = handler.get_data()
+    assert [item["link"] for item in data] == [
+        "https://example.com/1",
+        "https://example.com/2",
+        "https://example.com/3",
+        "https://example.com/5",
+    ]
+    assert data[0]["salary_min"] == 120000
+    assert handler.contains("https://example.com/5")
+    if handler_class is JSONLinesFileHandler:
+        with handler.reader() as reader:
+            assert list(reader) == data
+
+
+def test_upsert_keeps_text_index_current(temp_file, sample_vacancies):
+    handler = JSONFileHandler(temp_file, text_index=True)
+    handler.add_data(sample_vacancies[:1])
+    handler.upsert_data(
+        [Vacancy("Rust Engineer", "Company A", 100000, "https://example.com/1")]
+    )
+
+    assert handler.search("python") == []
+    assert handler.search("rust")[0]["link"] == "https://example.com/1"
+
+
+def test_failed_write_does_not_mark_links_as_stored(
+    temp_file, sample_vacancies, mocker
+):
+    handler = JSONFileHandler(temp_file)
+    handler.add_data(sample_vacancies[:1])
+    mocker.patch(
+        "src.work_with_files.atomic_write", side_effect=OSError("No space left")
+    )
+
+    with pytest.raises(OSError):
+        handler.add_data(sample_vacancies[1:2])
+    assert not handler.contains("https://example.com/2")
+
+    mocker.stopall()
+    handler.add_data(sample_vacancies[1:2])
+    assert [item["link"] for item in handler.get_data()] == [
+        "https://example.com/1",
+        "https://example.com/2",
+    ]
+    assert handler.contains("https://example.com/2")
+
+
+def test_jsonl_append_after_torn_line(jsonl_file, sample_vacancies):
+    handler = JSONLinesFileHandler(jsonl_file)
+    handler.add_data(sample_vacancies[:1])
+    # Сбой посреди дозаписи оставил недописанную строку
+    with open(jsonl_file, "a", encoding="utf-8") as f:
+        f.write('{"title": "обрыв')
+
+    handler.add_data(sample_vacancies[1:2])
+    handler.upsert_data(
+        [Vacancy("Python Developer", "Company A", 120000, "https://example.com/1")]
+    )
+    handler.delete_data({"link": "https://example.com/2"})
+    handler.add_data(sample_vacancies[2:])
+
+    reopened = JSONLinesFileHandler(jsonl_file)
+    assert [item["link"] for item in reopened.get_data()] == [
+        "https://example.com/1",
+        "https://example.com/3",
+    ]
+    assert reopened.get_data()[0]["salary_min"] == 120000
+    assert not reopened.contains("https://example.com/2")